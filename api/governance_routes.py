@@ -1,18 +1,15 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+import asyncio
+import uuid
 
-from core.governance.models import GovernanceParams, ProposalCreateRequest
-from core.governance.service import GovernanceService
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from core.governance.impact import GovernanceImpactSimulator
+from core.governance.models import GovernanceParams, ProposalCreateRequest, ProposalImpact
+from core.governance.service import GovernanceService
 
-def get_governance_service() -> GovernanceService:
-    global _GOVERNANCE_SERVICE  # type: ignore[annotation-unchecked]
-    try:
-        return _GOVERNANCE_SERVICE
-    except NameError:
-        _GOVERNANCE_SERVICE = GovernanceService()
-        return _GOVERNANCE_SERVICE
+from .validation_routes import get_governance_impact_simulator, get_governance_service
 
 
 router = APIRouter(prefix="/governance", tags=["governance"])
@@ -35,3 +32,22 @@ async def create_proposal(
         "activation_time": proposal.activation_time.isoformat(),
     }
 
+
+@router.get("/proposals/{proposal_id}/impact", response_model=ProposalImpact)
+async def get_proposal_impact(
+    proposal_id: uuid.UUID,
+    refresh: bool = Query(
+        default=False,
+        description="Recompute even if a report for the active params exists. Cached reports ignore later votes.",
+    ),
+    svc: GovernanceService = Depends(get_governance_service),
+    simulator: GovernanceImpactSimulator = Depends(get_governance_impact_simulator),
+) -> ProposalImpact:
+    # Replaying every stored vote can take a while; keep it off the event loop.
+    # The simulator serializes runs, so concurrent requests share one capped pool.
+    impact = await asyncio.get_running_loop().run_in_executor(
+        None, lambda: simulator.proposal_impact(svc, proposal_id, refresh=refresh)
+    )
+    if impact is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Proposal not found")
+    return impact
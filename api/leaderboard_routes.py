@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from core.leaderboard.models import LeaderboardEntry, LeaderboardRankResponse, LeaderboardResponse
+from core.leaderboard.service import BoardName, LeaderboardService
+
+from .validation_routes import get_leaderboard_service
+
+
+router = APIRouter(prefix="/leaderboards", tags=["leaderboards"])
+
+
+@router.get("/{board}", response_model=LeaderboardResponse)
+async def get_leaderboard(
+    board: BoardName,
+    k: int = Query(10, ge=1, le=1_000),
+    svc: LeaderboardService = Depends(get_leaderboard_service),
+) -> LeaderboardResponse:
+    entries = [
+        LeaderboardEntry(validator_id=vid, rank=i, value=value)
+        for i, (vid, value) in enumerate(svc.top(board, k), start=1)
+    ]
+    return LeaderboardResponse(
+        board=board,
+        size=len(svc.board(board)),
+        entries=entries,
+        top_share=svc.top_share(board, k),
+    )
+
+
+@router.get("/{board}/{validator_id}", response_model=LeaderboardRankResponse)
+async def get_leaderboard_rank(
+    board: BoardName,
+    validator_id: uuid.UUID,
+    svc: LeaderboardService = Depends(get_leaderboard_service),
+) -> LeaderboardRankResponse:
+    rank = svc.rank(board, validator_id)
+    if rank is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Validator not on leaderboard")
+    return LeaderboardRankResponse(
+        board=board,
+        size=len(svc.board(board)),
+        validator_id=validator_id,
+        rank=rank,
+        value=svc.value(board, validator_id),
+    )
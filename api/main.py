@@ -1,8 +1,23 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from .governance_routes import router as governance_router
+from .leaderboard_routes import router as leaderboard_router
+from .population_routes import router as population_router
+from .reputation_routes import router as reputation_router
 from .routes import router as core_router
-from .validation_routes import router as validation_router
+from .stake_routes import router as stake_router
+from .validation_routes import (
+    get_collusion_detector,
+    get_consensus_scheduler,
+    get_correlation_graph_writer,
+    get_lock_expiry_scheduler,
+    get_proposal_enactment_scheduler,
+    get_state_write_behind,
+    router as validation_router,
+)
 from core.observability.metrics import start_metrics_server, update_health_status
 
 
@@ -11,11 +26,41 @@ start_metrics_server()
 update_health_status(True)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Evaluate consensus in the background instead of on every client poll.
+    scheduler = get_consensus_scheduler()
+    # Reputation and stake are persisted write-behind only when a database is configured.
+    state_writer = get_state_write_behind() if os.getenv("DATABASE_URL") else None
+    if state_writer is not None:
+        state_writer.restore()
+        state_writer.start()
+    lock_expiry = get_lock_expiry_scheduler()
+    enactment = get_proposal_enactment_scheduler()
+    # Watch the accepted vote stream for bloc voting.
+    get_collusion_detector()
+    graph_writer = get_correlation_graph_writer()
+    scheduler.start()
+    lock_expiry.start()
+    enactment.start()
+    graph_writer.start()
+    try:
+        yield
+    finally:
+        await scheduler.stop()
+        await lock_expiry.stop()
+        await enactment.stop()
+        await graph_writer.stop()
+        if state_writer is not None:
+            await state_writer.stop()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="Open Epistemic Network",
         version="0.1.0",
         description="Open, non-blockchain epistemic protocol with hybrid stake+reputation validation.",
+        lifespan=lifespan,
     )
 
     @app.get("/health", tags=["meta"])
@@ -25,6 +70,10 @@ def create_app() -> FastAPI:
     app.include_router(core_router)
     app.include_router(governance_router)
     app.include_router(validation_router)
+    app.include_router(reputation_router)
+    app.include_router(leaderboard_router)
+    app.include_router(stake_router)
+    app.include_router(population_router)
     return app
 
 
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from core.population.models import Dimension, PopulationAggregatesResponse
+from core.population.service import PopulationAggregates
+
+from .validation_routes import get_population_aggregates
+
+
+router = APIRouter(prefix="/population", tags=["population"])
+
+
+@router.get("/{dimension}", response_model=PopulationAggregatesResponse)
+async def get_population_aggregates_by(
+    dimension: Dimension,
+    aggregates: PopulationAggregates = Depends(get_population_aggregates),
+) -> PopulationAggregatesResponse:
+    validators, total_stake, total_influence = aggregates.totals()
+    return PopulationAggregatesResponse(
+        dimension=dimension,
+        validators=validators,
+        total_stake=total_stake,
+        total_influence=total_influence,
+        groups=aggregates.groups(dimension),
+    )
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from core.reputation.models import ReputationHistoryResponse
+from core.reputation.service import ReputationEngine
+
+from .validation_routes import get_reputation_engine
+
+
+router = APIRouter(prefix="/reputation", tags=["reputation"])
+
+
+@router.get("/{validator_id}/history", response_model=ReputationHistoryResponse)
+async def get_reputation_history(
+    validator_id: uuid.UUID,
+    resolution: str = Query("raw", description="raw, minute, hour or day"),
+    since: Optional[datetime] = None,
+    limit: Optional[int] = Query(None, ge=1, le=10_000),
+    engine: ReputationEngine = Depends(get_reputation_engine),
+) -> ReputationHistoryResponse:
+    if engine.history is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reputation history is not enabled")
+    if since is not None and since.tzinfo is None:
+        # Timestamps without an offset are UTC, like every time the API returns.
+        since = since.replace(tzinfo=timezone.utc)
+    try:
+        points = engine.history.points(validator_id, resolution, since=since, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return ReputationHistoryResponse(validator_id=validator_id, resolution=resolution, points=points)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from core.stake.models import (
+    RepeatOffendersResponse,
+    SlashedValidator,
+    SlashingEventModel,
+    SlashingEventsResponse,
+    SlashingSummaryResponse,
+    SlashingTotals,
+)
+from core.stake.service import StakeManager
+
+from .validation_routes import get_stake_manager
+
+
+router = APIRouter(prefix="/stake/slashing", tags=["stake"])
+
+
+@router.get("/events", response_model=SlashingEventsResponse)
+async def list_slashing_events(
+    validator_id: Optional[uuid.UUID] = None,
+    reason: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=10_000),
+    stake: StakeManager = Depends(get_stake_manager),
+) -> SlashingEventsResponse:
+    events = stake.slashing_log.events(
+        validator_id=validator_id, reason=reason, since=since, until=until, limit=limit
+    )
+    return SlashingEventsResponse(events=[SlashingEventModel(**ev.__dict__) for ev in events])
+
+
+@router.get("/summary", response_model=SlashingSummaryResponse)
+async def get_slashing_summary(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    stake: StakeManager = Depends(get_stake_manager),
+) -> SlashingSummaryResponse:
+    count, amount = stake.slashing_log.totals(since=since, until=until)
+    by_reason = stake.slashing_log.totals_by_reason(since=since, until=until)
+    return SlashingSummaryResponse(
+        since=since,
+        until=until,
+        total=SlashingTotals(count=count, amount=amount),
+        by_reason={reason: SlashingTotals(count=c, amount=a) for reason, (c, a) in by_reason.items()},
+    )
+
+
+@router.get("/repeat-offenders", response_model=RepeatOffendersResponse)
+async def get_repeat_offenders(
+    min_count: int = Query(2, ge=1),
+    limit: int = Query(100, ge=1, le=10_000),
+    stake: StakeManager = Depends(get_stake_manager),
+) -> RepeatOffendersResponse:
+    offenders = stake.slashing_log.repeat_offenders(min_count, limit=limit)
+    return RepeatOffendersResponse(
+        min_count=min_count,
+        validators=[SlashedValidator(validator_id=vid, slash_count=count) for vid, count in offenders],
+    )
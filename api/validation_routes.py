@@ -1,19 +1,68 @@
 from __future__ import annotations
 
+import os
 import uuid
+from typing import Optional
 
 from fastapi import APIRouter, Depends
 
+from core.audit.collusion import CollusionDetector
+from core.audit.service import AuditEngine
+from core.governance.impact import GovernanceImpactSimulator
+from core.governance.scheduler import ProposalEnactmentScheduler
+from core.governance.service import GovernanceService
+from core.leaderboard.service import LeaderboardService
+from core.neo4j.client import get_neo4j_driver
+from core.neo4j.graph import InMemoryGraphBackend, Neo4jGraphBackend
+from core.neo4j.writer import CorrelationGraphWriter
+from core.db.base import get_session_factory
+from core.db.write_behind import StateWriteBehind
 from core.ledger.service import LedgerService
+from core.population.service import PopulationAggregates
+from core.replay.log import EventLog
+from core.reputation.history import ReputationHistory
 from core.reputation.service import ReputationEngine
+from core.stake.expiry import LockExpiryScheduler
 from core.stake.service import StakeManager
 from core.identity.service import IdentityService
-from core.validation.models import VoteCreateRequest
+from core.validation.batch import BatchConsensusEvaluator
+from core.validation.coalescing import ConsensusCoalescer
+from core.validation.correlation import VoteCorrelationEngine
+from core.validation.models import BatchConsensusRequest, VoteCreateRequest
+from core.validation.scheduler import ConsensusScheduler
 from core.validation.session import ValidationSessionService
 from core.validation.service import VoteService
 from core.observability.metrics import record_vote, record_consensus, record_slashing
 
-from .routes import get_vote_service, get_ledger_service
+from .routes import get_identity_service, get_ledger_service, get_vote_service
+
+
+def get_governance_service() -> GovernanceService:
+    global _GOVERNANCE_SERVICE  # type: ignore[annotation-unchecked]
+    try:
+        return _GOVERNANCE_SERVICE
+    except NameError:
+        _GOVERNANCE_SERVICE = GovernanceService()
+        return _GOVERNANCE_SERVICE
+
+
+def get_proposal_enactment_scheduler() -> ProposalEnactmentScheduler:
+    global _PROPOSAL_ENACTMENT_SCHEDULER  # type: ignore[annotation-unchecked]
+    try:
+        return _PROPOSAL_ENACTMENT_SCHEDULER
+    except NameError:
+        _PROPOSAL_ENACTMENT_SCHEDULER = ProposalEnactmentScheduler(get_governance_service())
+        return _PROPOSAL_ENACTMENT_SCHEDULER
+
+
+def get_event_log() -> Optional[EventLog]:
+    global _EVENT_LOG  # type: ignore[annotation-unchecked]
+    try:
+        return _EVENT_LOG
+    except NameError:
+        # Events are only kept when the write-behind can persist them for replay.
+        _EVENT_LOG = EventLog() if os.getenv("DATABASE_URL") else None
+        return _EVENT_LOG
 
 
 def get_stake_manager() -> StakeManager:
@@ -21,26 +70,107 @@ def get_stake_manager() -> StakeManager:
     try:
         return _STAKE_MANAGER
     except NameError:
-        _STAKE_MANAGER = StakeManager()
+        _STAKE_MANAGER = StakeManager(event_log=get_event_log())
         return _STAKE_MANAGER
 
 
+def get_lock_expiry_scheduler() -> LockExpiryScheduler:
+    global _LOCK_EXPIRY_SCHEDULER  # type: ignore[annotation-unchecked]
+    try:
+        return _LOCK_EXPIRY_SCHEDULER
+    except NameError:
+        _LOCK_EXPIRY_SCHEDULER = LockExpiryScheduler(get_stake_manager())
+        return _LOCK_EXPIRY_SCHEDULER
+
+
 def get_reputation_engine() -> ReputationEngine:
     global _REPUTATION_ENGINE  # type: ignore[annotation-unchecked]
     try:
         return _REPUTATION_ENGINE
     except NameError:
-        _REPUTATION_ENGINE = ReputationEngine()
+        _REPUTATION_ENGINE = ReputationEngine(history=ReputationHistory(), event_log=get_event_log())
         return _REPUTATION_ENGINE
 
 
-def get_identity_service() -> IdentityService:
-    global _IDENTITY_SERVICE  # type: ignore[annotation-unchecked]
+def get_state_write_behind() -> StateWriteBehind:
+    global _STATE_WRITE_BEHIND  # type: ignore[annotation-unchecked]
+    try:
+        return _STATE_WRITE_BEHIND
+    except NameError:
+        _STATE_WRITE_BEHIND = StateWriteBehind(
+            get_reputation_engine(),
+            get_stake_manager(),
+            get_session_factory(),
+            identity=get_identity_service(),
+            event_log=get_event_log(),
+            flush_interval=float(os.getenv("STATE_FLUSH_INTERVAL_SECONDS", "1.0")),
+            max_dirty=int(os.getenv("STATE_FLUSH_MAX_DIRTY", "10000")),
+        )
+        return _STATE_WRITE_BEHIND
+
+
+def get_leaderboard_service() -> LeaderboardService:
+    global _LEADERBOARD_SERVICE  # type: ignore[annotation-unchecked]
+    try:
+        return _LEADERBOARD_SERVICE
+    except NameError:
+        _LEADERBOARD_SERVICE = LeaderboardService(get_reputation_engine(), get_stake_manager())
+        return _LEADERBOARD_SERVICE
+
+
+def get_population_aggregates() -> PopulationAggregates:
+    global _POPULATION_AGGREGATES  # type: ignore[annotation-unchecked]
+    try:
+        return _POPULATION_AGGREGATES
+    except NameError:
+        _POPULATION_AGGREGATES = PopulationAggregates(
+            get_identity_service(), get_stake_manager(), get_reputation_engine()
+        )
+        return _POPULATION_AGGREGATES
+
+
+def get_correlation_engine() -> VoteCorrelationEngine:
+    global _CORRELATION_ENGINE  # type: ignore[annotation-unchecked]
+    try:
+        return _CORRELATION_ENGINE
+    except NameError:
+        _CORRELATION_ENGINE = VoteCorrelationEngine()
+        get_vote_service().add_listener(_CORRELATION_ENGINE.observe_vote)
+        return _CORRELATION_ENGINE
+
+
+def get_correlation_graph_writer() -> CorrelationGraphWriter:
+    global _CORRELATION_GRAPH_WRITER  # type: ignore[annotation-unchecked]
+    try:
+        return _CORRELATION_GRAPH_WRITER
+    except NameError:
+        # Without a Neo4j server the graph is kept in memory.
+        backend = Neo4jGraphBackend(get_neo4j_driver()) if os.getenv("NEO4J_URI") else InMemoryGraphBackend()
+        _CORRELATION_GRAPH_WRITER = CorrelationGraphWriter(
+            backend, flush_interval=float(os.getenv("GRAPH_FLUSH_INTERVAL_SECONDS", "1.0"))
+        )
+        get_identity_service().add_listener(_CORRELATION_GRAPH_WRITER.record_validator)
+        get_correlation_engine().add_listener(_CORRELATION_GRAPH_WRITER.record_co_vote)
+        return _CORRELATION_GRAPH_WRITER
+
+
+def get_audit_engine() -> AuditEngine:
+    global _AUDIT_ENGINE  # type: ignore[annotation-unchecked]
     try:
-        return _IDENTITY_SERVICE
+        return _AUDIT_ENGINE
     except NameError:
-        _IDENTITY_SERVICE = IdentityService()
-        return _IDENTITY_SERVICE
+        _AUDIT_ENGINE = AuditEngine()
+        return _AUDIT_ENGINE
+
+
+def get_collusion_detector() -> CollusionDetector:
+    global _COLLUSION_DETECTOR  # type: ignore[annotation-unchecked]
+    try:
+        return _COLLUSION_DETECTOR
+    except NameError:
+        _COLLUSION_DETECTOR = CollusionDetector(get_audit_engine())
+        get_vote_service().add_listener(_COLLUSION_DETECTOR.observe_vote)
+        return _COLLUSION_DETECTOR
 
 
 def get_validation_session_service(
@@ -48,6 +178,10 @@ def get_validation_session_service(
     stake: StakeManager = Depends(get_stake_manager),
     reputation: ReputationEngine = Depends(get_reputation_engine),
     identity: IdentityService = Depends(get_identity_service),
+    ledger: LedgerService = Depends(get_ledger_service),
+    correlation: VoteCorrelationEngine = Depends(get_correlation_engine),
+    leaderboards: LeaderboardService = Depends(get_leaderboard_service),
+    population: PopulationAggregates = Depends(get_population_aggregates),
 ) -> ValidationSessionService:
     global _VALIDATION_SESSION_SERVICE  # type: ignore[annotation-unchecked]
     try:
@@ -57,45 +191,91 @@ def get_validation_session_service(
             votes=votes, 
             stake=stake, 
             reputation=reputation,
-            identity=identity
+            identity=identity,
+            ledger=ledger,
+            correlation=correlation,
+            consensus_mode=os.getenv("CONSENSUS_MODE", "threshold"),
+            leaderboards=leaderboards,
+            population=population,
+            governance=get_governance_service(),
         )
         return _VALIDATION_SESSION_SERVICE
 
 
+def get_consensus_scheduler() -> ConsensusScheduler:
+    global _CONSENSUS_SCHEDULER  # type: ignore[annotation-unchecked]
+    try:
+        return _CONSENSUS_SCHEDULER
+    except NameError:
+        votes = get_vote_service()
+        sessions = get_validation_session_service(
+            votes=votes,
+            stake=get_stake_manager(),
+            reputation=get_reputation_engine(),
+            identity=get_identity_service(),
+            ledger=get_ledger_service(),
+            correlation=get_correlation_engine(),
+            leaderboards=get_leaderboard_service(),
+            population=get_population_aggregates(),
+        )
+        _CONSENSUS_SCHEDULER = ConsensusScheduler(sessions)
+        votes.add_listener(_CONSENSUS_SCHEDULER.notify_vote)
+        return _CONSENSUS_SCHEDULER
+
+
+def get_batch_consensus_evaluator(
+    svc: ValidationSessionService = Depends(get_validation_session_service),
+    votes: VoteService = Depends(get_vote_service),
+) -> BatchConsensusEvaluator:
+    global _BATCH_CONSENSUS_EVALUATOR  # type: ignore[annotation-unchecked]
+    try:
+        return _BATCH_CONSENSUS_EVALUATOR
+    except NameError:
+        _BATCH_CONSENSUS_EVALUATOR = BatchConsensusEvaluator(svc, votes)
+        return _BATCH_CONSENSUS_EVALUATOR
+
+
+def get_governance_impact_simulator(
+    svc: ValidationSessionService = Depends(get_validation_session_service),
+    votes: VoteService = Depends(get_vote_service),
+    ledger: LedgerService = Depends(get_ledger_service),
+) -> GovernanceImpactSimulator:
+    global _GOVERNANCE_IMPACT_SIMULATOR  # type: ignore[annotation-unchecked]
+    try:
+        return _GOVERNANCE_IMPACT_SIMULATOR
+    except NameError:
+        _GOVERNANCE_IMPACT_SIMULATOR = GovernanceImpactSimulator(
+            svc, votes, ledger, max_workers=int(os.getenv("GOVERNANCE_IMPACT_MAX_WORKERS", "0")) or None
+        )
+        return _GOVERNANCE_IMPACT_SIMULATOR
+
+
+def get_consensus_coalescer(
+    svc: ValidationSessionService = Depends(get_validation_session_service),
+    votes: VoteService = Depends(get_vote_service),
+) -> ConsensusCoalescer:
+    global _CONSENSUS_COALESCER  # type: ignore[annotation-unchecked]
+    try:
+        return _CONSENSUS_COALESCER
+    except NameError:
+        _CONSENSUS_COALESCER = ConsensusCoalescer(
+            svc, votes, max_entries=int(os.getenv("CONSENSUS_CACHE_MAX_ENTRIES", "10000"))
+        )
+        return _CONSENSUS_COALESCER
+
+
 router = APIRouter(prefix="/validation", tags=["validation"])
 
 
 @router.get("/claims/{claim_id}/consensus")
 async def get_claim_consensus(
     claim_id: uuid.UUID,
-    svc: ValidationSessionService = Depends(get_validation_session_service),
-    votes: VoteService = Depends(get_vote_service),
-    reputation: ReputationEngine = Depends(get_reputation_engine),
-    ledger: LedgerService = Depends(get_ledger_service),
+    coalescer: ConsensusCoalescer = Depends(get_consensus_coalescer),
 ) -> dict:
-    session = svc.compute_consensus(claim_id)
-
-    # If we have a strong outcome, apply it to the claim and update reputations.
-    if session.outcome in ("accepted", "rejected") and session.confidence > 0.0:
-        # Update claim status and confidence in the ledger (append-only via new version).
-        ledger.apply_consensus(claim_id, session.outcome, session.confidence)
-
-        # Update validator reputations based on alignment with outcome.
-        from core.reputation.models import ReputationUpdateRequest
-
-        vote_list = votes.list_votes_for_claim(claim_id)
-        for v in vote_list:
-            if not v.signature_valid or v.vote_type == "uncertain":
-                continue
-            was_correct = (v.vote_type == "approve" and session.outcome == "accepted") or (
-                v.vote_type == "reject" and session.outcome == "rejected"
-            )
-            req = ReputationUpdateRequest(
-                validator_id=v.validator_id,
-                was_correct=was_correct,
-                was_minority=False,  # minority detection will be added later
-            )
-            reputation.apply_outcome(req)
+    # Evaluated on the event loop and cached until the claim's votes change.
+    # Ledger, reputation and stake updates are applied by the session service
+    # exactly once, when the claim is finalized.
+    session = coalescer.get_consensus(claim_id)
 
     return {
         "claim_id": str(session.claim_id),
@@ -103,5 +283,32 @@ async def get_claim_consensus(
         "outcome": session.outcome,
         "confidence": session.confidence,
         "created_at": session.created_at.isoformat(),
+        "finalized": session.finalized,
+        "votes_used": session.votes_used,
+        "votes_saved": session.votes_saved,
+        "params_version": session.params_version,
     }
 
+
+@router.post("/consensus/batch")
+async def batch_consensus(
+    payload: BatchConsensusRequest,
+    evaluator: BatchConsensusEvaluator = Depends(get_batch_consensus_evaluator),
+) -> dict:
+    claim_ids = None if payload.claim_ids == "all_pending" else payload.claim_ids
+    # Chunks are built and outcomes applied on the loop; only the arithmetic runs off it.
+    results = await evaluator.evaluate_async(claim_ids, workers=payload.workers)
+    return {
+        "evaluated": len(results),
+        "finalized": sum(1 for r in results if r.finalized),
+        "results": [
+            {
+                "claim_id": str(r.claim_id),
+                "outcome": r.outcome,
+                "confidence": r.confidence,
+                "finalized": r.finalized,
+                "params_version": r.params_version,
+            }
+            for r in results
+        ],
+    }
@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from core.validation.models import Vote
+
+from .service import AuditEngine
+
+
+logger = logging.getLogger(__name__)
+
+# Stored edge weights are scaled to an epoch; past this exponent they are rebased.
+_MAX_EXPONENT = 256.0
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class CollusionDetector:
+    """
+    Streaming bloc-voting detector over accepted votes.
+
+    Two validators casting the same positional vote (approve/reject) on a
+    claim within ``window_seconds`` of each other gain one unit of edge
+    weight in a co-voting graph. Edge weights decay with
+    ``half_life_seconds``; decay is uniform, so weights are stored scaled to
+    a common epoch and never rewritten as time passes.
+
+    Edges at or above ``min_edge_weight`` form the strong graph, whose
+    k-core (k = ``min_cluster_size`` - 1: every member has at least k strong
+    ties inside the group) is maintained incrementally. Adding a strong edge
+    peels only the non-core region around its endpoints. Losing one
+    (decayed below the threshold, found through a heap of expiry times)
+    cascades removals outward from its endpoints. When validators join the
+    core, their connected cluster is reported to ``AuditEngine.record_anomaly``
+    with the cluster's strong-edge density as severity; each validator is
+    reported at most once per ``flag_cooldown_seconds``.
+
+    Memory is bounded and maintained incrementally. Per-claim vote windows
+    keep ``max_votes_per_claim`` votes for the ``max_tracked_claims`` most
+    recent claims. Every edge has one entry in a heap of the times its
+    decayed weight falls below ``min_tracked_weight``. Entries are refreshed
+    lazily when popped, so increments never push. Due edges are forgotten as
+    time advances, and past ``max_edges`` the weakest edge is evicted from
+    the top of the same heap. Validator slots are reference-counted by edges
+    and vote windows and reused once free. Flag times are dropped once their
+    cooldown has passed.
+    Time is taken from vote timestamps, which are client-supplied: a
+    timestamp more than ``max_clock_skew_seconds`` ahead of ``clock`` is
+    clamped to that bound, so a forged future vote cannot pin the
+    detector's time and starve every later edge.
+    """
+
+    def __init__(
+        self,
+        audit: AuditEngine,
+        *,
+        window_seconds: float = 300.0,
+        half_life_seconds: float = 6 * 3600.0,
+        min_edge_weight: float = 5.0,
+        min_cluster_size: int = 4,
+        max_votes_per_claim: int = 64,
+        max_tracked_claims: int = 100_000,
+        max_edges: int = 1_000_000,
+        min_tracked_weight: float = 0.1,
+        flag_cooldown_seconds: float = 3600.0,
+        max_clock_skew_seconds: float = 300.0,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        if min_cluster_size < 2:
+            raise ValueError("min_cluster_size must be >= 2")
+        if half_life_seconds <= 0 or min_edge_weight <= 0:
+            raise ValueError("half_life_seconds and min_edge_weight must be > 0")
+        if not 0 < min_tracked_weight < min_edge_weight:
+            raise ValueError("min_tracked_weight must be in (0, min_edge_weight)")
+        self._audit = audit
+        self.window_seconds = window_seconds
+        self.half_life_seconds = half_life_seconds
+        self.min_edge_weight = min_edge_weight
+        self.min_cluster_size = min_cluster_size
+        self.k = min_cluster_size - 1
+        self.max_votes_per_claim = max_votes_per_claim
+        self.max_tracked_claims = max_tracked_claims
+        self.max_edges = max_edges
+        self.min_tracked_weight = min_tracked_weight
+        self.flag_cooldown_seconds = flag_cooldown_seconds
+        self.max_clock_skew_seconds = max_clock_skew_seconds
+        self._clock = clock
+
+        self._ids: Dict[uuid.UUID, int] = {}
+        self._validators: List[Optional[uuid.UUID]] = []
+        self._refs: List[int] = []  # edges and window entries per validator slot
+        self._free: List[int] = []
+        # claim -> recent (ts, validator index, vote type), oldest claims evicted first.
+        self._recent: "OrderedDict[uuid.UUID, Deque[Tuple[float, int, str]]]" = OrderedDict()
+        self._epoch: Optional[float] = None
+        self._now = -math.inf
+        self._edges: Dict[int, float] = {}
+        self._strong: Dict[int, Set[int]] = {}
+        # Lazy heaps whose entries may be earlier than the real time after
+        # later increments. Every edge has exactly one forget entry, and edges
+        # are only dropped when it is popped. Strong edges have one expiry
+        # entry, live while it matches ``_expiry_at``.
+        self._expiries: List[Tuple[float, int]] = []
+        self._expiry_at: Dict[int, float] = {}
+        self._forget: List[Tuple[float, int]] = []
+        self._core: Dict[int, int] = {}  # member -> strong neighbours inside the core
+        # validator -> last flag time, oldest first.
+        self._flagged_at: "OrderedDict[uuid.UUID, float]" = OrderedDict()
+        self.clusters_flagged = 0
+
+    # ---- Ingestion ----
+
+    def observe_vote(self, vote: Vote) -> None:
+        """
+        VoteService listener: fold one vote into the co-voting graph.
+
+        Detection is best effort; a failure here is logged and never
+        propagates into vote submission.
+        """
+        if not vote.signature_valid or vote.vote_type not in ("approve", "reject"):
+            return
+        try:
+            self._observe(vote)
+        except Exception:
+            logger.exception("collusion detector failed on vote %s", vote.id)
+
+    def _observe(self, vote: Vote) -> None:
+        ts = min(vote.timestamp.timestamp(), self._clock().timestamp() + self.max_clock_skew_seconds)
+        if ts > self._now:
+            self._advance(ts)
+        me = self._index(vote.validator_id)
+        self._refs[me] += 1  # pinned until the vote is folded in
+
+        recent = self._recent.get(vote.claim_id)
+        if recent is None:
+            recent = deque(maxlen=self.max_votes_per_claim)
+            self._recent[vote.claim_id] = recent
+            if len(self._recent) > self.max_tracked_claims:
+                for _, evicted, _ in self._recent.popitem(last=False)[1]:
+                    self._release(evicted)
+
+        joined: List[int] = []
+        paired: Set[int] = set()
+        try:
+            for other_ts, other, other_type in recent:
+                if other == me or other in paired or abs(ts - other_ts) > self.window_seconds:
+                    continue
+                if other_type == vote.vote_type:
+                    paired.add(other)
+                    joined.extend(self._add_weight(me, other, ts))
+            if len(recent) == recent.maxlen:
+                self._release(recent[0][1])
+            recent.append((ts, me, vote.vote_type))
+            self._refs[me] += 1
+
+            while len(self._edges) > self.max_edges:
+                self._evict_weakest()
+        finally:
+            self._release(me)
+        if joined:
+            self._report(joined)
+
+    def _index(self, validator_id: uuid.UUID) -> int:
+        idx = self._ids.get(validator_id)
+        if idx is None:
+            if self._free:
+                idx = self._free.pop()
+                self._validators[idx] = validator_id
+            else:
+                idx = len(self._validators)
+                self._validators.append(validator_id)
+                self._refs.append(0)
+            self._ids[validator_id] = idx
+        return idx
+
+    def _release(self, idx: int) -> None:
+        self._refs[idx] -= 1
+        if self._refs[idx] == 0:
+            # No edges and no window entries left: the slot can be reused.
+            del self._ids[self._validators[idx]]
+            self._validators[idx] = None
+            self._strong.pop(idx, None)
+            self._free.append(idx)
+
+    def _scale(self, ts: float) -> float:
+        # Callers keep ts within _MAX_EXPONENT half-lives after the epoch.
+        return 2.0 ** ((ts - self._epoch) / self.half_life_seconds)
+
+    def _time_below(self, weight: float, floor: float) -> float:
+        """
+        Time at which a stored (epoch-scaled) weight decays below ``floor``.
+        """
+        if weight <= 0:
+            return -math.inf
+        return self._epoch + self.half_life_seconds * math.log2(weight / floor)
+
+    def _advance(self, ts: float) -> None:
+        self._now = ts
+        if self._epoch is None:
+            self._epoch = ts
+        elif (ts - self._epoch) / self.half_life_seconds > _MAX_EXPONENT:
+            # Rebase with a negative exponent: an arbitrarily long gap
+            # underflows weights to 0 instead of overflowing the factor.
+            factor = 2.0 ** (-(ts - self._epoch) / self.half_life_seconds)
+            for key in self._edges:
+                self._edges[key] *= factor
+            self._epoch = ts
+        # Strong edges whose decayed weight fell below the threshold. An
+        # entry recorded before later increments is re-queued at its real time.
+        while self._expiries and self._expiries[0][0] <= ts:
+            at, key = heapq.heappop(self._expiries)
+            if self._expiry_at.get(key) != at:
+                continue
+            expiry = self._time_below(self._edges[key], self.min_edge_weight)
+            if expiry > ts:
+                self._expiry_at[key] = expiry
+                heapq.heappush(self._expiries, (expiry, key))
+            else:
+                del self._expiry_at[key]
+                a, b = divmod(key, 1 << 32)
+                self._remove_strong(a, b)
+        # Edges that decayed below the tracking floor are forgotten.
+        while self._forget and self._forget[0][0] <= ts:
+            self._pop_forget(ts)
+        # Flags past their cooldown no longer suppress reports.
+        cooldown = ts - self.flag_cooldown_seconds
+        while self._flagged_at and next(iter(self._flagged_at.values())) <= cooldown:
+            self._flagged_at.popitem(last=False)
+
+    def _pop_forget(self, now: float) -> None:
+        """
+        Pop the forget heap's top: drop the edge if it is due at ``now``,
+        otherwise re-queue it at its real time.
+        """
+        _, key = heapq.heappop(self._forget)
+        forget = self._time_below(self._edges[key], self.min_tracked_weight)
+        if forget > now:
+            heapq.heappush(self._forget, (forget, key))
+        else:
+            self._drop_edge(key)
+
+    def _evict_weakest(self) -> None:
+        # Entries are never later than their edge's real forget time, so once
+        # the top entry is exact (popping it at its own time does not re-queue
+        # it) it belongs to the weakest edge, which is dropped.
+        self._pop_forget(self._forget[0][0])
+
+    def _drop_edge(self, key: int) -> None:
+        del self._edges[key]
+        a, b = divmod(key, 1 << 32)
+        if self._expiry_at.pop(key, None) is not None:
+            self._remove_strong(a, b)
+        self._release(a)
+        self._release(b)
+
+    def _add_weight(self, a: int, b: int, ts: float) -> List[int]:
+        key = (min(a, b) << 32) | max(a, b)
+        old = self._edges.get(key)
+        weight = (old or 0.0) + self._scale(ts)
+        self._edges[key] = weight
+        if old is None:
+            self._refs[a] += 1
+            self._refs[b] += 1
+            heapq.heappush(self._forget, (self._time_below(weight, self.min_tracked_weight), key))
+        if weight < self.min_edge_weight * self._scale(self._now):
+            return []
+        if key in self._expiry_at:
+            return []  # already strong; its expiry entry is refreshed when popped
+        expiry = self._time_below(weight, self.min_edge_weight)
+        self._expiry_at[key] = expiry
+        heapq.heappush(self._expiries, (expiry, key))
+        return self._add_strong(a, b)
+
+    # ---- k-core maintenance ----
+
+    def _add_strong(self, a: int, b: int) -> List[int]:
+        """
+        Insert a strong edge; returns validators that joined the core.
+        """
+        self._strong.setdefault(a, set()).add(b)
+        self._strong.setdefault(b, set()).add(a)
+        core = self._core
+        if a in core and b in core:
+            core[a] += 1
+            core[b] += 1
+            return []
+
+        # Only non-core vertices with enough strong ties, connected to the
+        # new edge through other such vertices, can join.
+        k = self.k
+        candidates: Set[int] = set()
+        stack = [v for v in (a, b) if v not in core and len(self._strong[v]) >= k]
+        while stack:
+            v = stack.pop()
+            if v in candidates:
+                continue
+            candidates.add(v)
+            for u in self._strong[v]:
+                if u not in core and u not in candidates and len(self._strong[u]) >= k:
+                    stack.append(u)
+        if not candidates:
+            return []
+
+        support = {v: sum(1 for u in self._strong[v] if u in core or u in candidates) for v in candidates}
+        peel = [v for v, count in support.items() if count < k]
+        while peel:
+            v = peel.pop()
+            if v not in candidates:
+                continue
+            candidates.discard(v)
+            for u in self._strong[v]:
+                if u in candidates:
+                    support[u] -= 1
+                    if support[u] == k - 1:
+                        peel.append(u)
+
+        for v in candidates:
+            core[v] = support[v]
+            for u in self._strong[v]:
+                if u in core and u not in candidates:
+                    core[u] += 1
+        return list(candidates)
+
+    def _remove_strong(self, a: int, b: int) -> None:
+        self._strong[a].discard(b)
+        self._strong[b].discard(a)
+        core = self._core
+        if a not in core or b not in core:
+            return
+        core[a] -= 1
+        core[b] -= 1
+        stack = [a, b]
+        while stack:
+            v = stack.pop()
+            if v not in core or core[v] >= self.k:
+                continue
+            del core[v]
+            for u in self._strong[v]:
+                if u in core:
+                    core[u] -= 1
+                    stack.append(u)
+
+    # ---- Reporting ----
+
+    def _component(self, start: int) -> Set[int]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            v = stack.pop()
+            for u in self._strong[v]:
+                if u in self._core and u not in seen:
+                    seen.add(u)
+                    stack.append(u)
+        return seen
+
+    def _report(self, joined: List[int]) -> None:
+        done: Set[int] = set()
+        for v in joined:
+            if v in done or v not in self._core:
+                continue
+            members = self._component(v)
+            done |= members
+            cooldown = self._now - self.flag_cooldown_seconds
+            fresh = [
+                self._validators[m]
+                for m in members
+                if self._flagged_at.get(self._validators[m], -math.inf) <= cooldown
+            ]
+            if not fresh:
+                continue
+            edges = sum(len(self._strong[m] & members) for m in members) / 2
+            density = edges / (len(members) * (len(members) - 1) / 2)
+            for validator_id in fresh:
+                self._flagged_at[validator_id] = self._now
+                self._flagged_at.move_to_end(validator_id)
+                self._audit.record_anomaly(str(validator_id), "collusion_cluster", density)
+            self.clusters_flagged += 1
+
+    # ---- Reads ----
+
+    def edge_weight(self, a: uuid.UUID, b: uuid.UUID, now: Optional[datetime] = None) -> float:
+        """
+        Decayed co-voting weight of a pair (0 if untracked).
+        """
+        ia, ib = self._ids.get(a), self._ids.get(b)
+        if ia is None or ib is None or self._epoch is None:
+            return 0.0
+        weight = self._edges.get((min(ia, ib) << 32) | max(ia, ib), 0.0)
+        ts = now.timestamp() if now is not None else self._now
+        return weight * 2.0 ** (-(ts - self._epoch) / self.half_life_seconds)
+
+    def clusters(self) -> List[List[uuid.UUID]]:
+        """
+        Current dense clusters (connected components of the strong k-core), largest first.
+        """
+        seen: Set[int] = set()
+        result: List[List[uuid.UUID]] = []
+        for v in self._core:
+            if v not in seen:
+                members = self._component(v)
+                seen |= members
+                result.append([self._validators[m] for m in members])
+        result.sort(key=len, reverse=True)
+        return result
+
+    def edge_count(self) -> int:
+        return len(self._edges)
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Dict, List
+from datetime import datetime, timezone
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+from .sketch import WindowedDigest
+
+
+T = TypeVar("T")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 @dataclass
 class DriftSignal:
     domain: str
     drift_score: float
+    timestamp: Optional[datetime] = None
+    change_point: bool = False
 
 
 @dataclass
@@ -15,6 +28,126 @@ class AnomalySignal:
     validator_id: str
     reason: str
     severity: float
+    timestamp: Optional[datetime] = None
+
+
+@dataclass
+class DriftSummary:
+    domain: str
+    count: int
+    last_score: float
+    last_at: datetime
+    ewma: float
+    ewma_std: float
+    p50: Optional[float]
+    p90: Optional[float]
+    p99: Optional[float]
+    change_points: int
+    last_change_at: Optional[datetime]
+
+
+class _TimeRing(Generic[T]):
+    """
+    Fixed-capacity ring of timestamped items; the oldest are overwritten.
+
+    Items arrive in (non-decreasing) time order, so a time range is found
+    with two binary searches over the ring's logical positions.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._items: List[Optional[T]] = [None] * capacity
+        self._times: List[float] = [0.0] * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, item: T, ts: float) -> None:
+        if self._size and ts < self._times[(self._start + self._size - 1) % self.capacity]:
+            # Clock went backwards; keep the ring sorted.
+            ts = self._times[(self._start + self._size - 1) % self.capacity]
+        if self._size < self.capacity:
+            slot = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._items[slot] = item
+        self._times[slot] = ts
+
+    def _lower_bound(self, ts: float) -> int:
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._times[(self._start + mid) % self.capacity] < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def range(self, since: Optional[float], until: Optional[float], limit: Optional[int]) -> List[T]:
+        """
+        Items with ``since <= ts < until``, newest first.
+        """
+        start = 0 if since is None else self._lower_bound(since)
+        end = self._size if until is None else self._lower_bound(until)
+        if limit is not None:
+            start = max(start, end - limit)
+        return [self._items[(self._start + i) % self.capacity] for i in range(end - 1, start - 1, -1)]
+
+
+class _DomainDrift:
+    """
+    Streaming drift statistics for one domain.
+
+    Keeps an EWMA of the score and of its variance, a sliding-window
+    quantile digest, and a two-sided CUSUM on the standardized deviation
+    from the EWMA. A change point is flagged when either CUSUM arm exceeds
+    ``threshold``; both arms then reset so one shift is flagged once.
+    """
+
+    def __init__(self, engine: AuditEngine) -> None:
+        self.count = 0
+        self.last_score = 0.0
+        self.last_at: datetime = datetime.min.replace(tzinfo=timezone.utc)
+        self.mean = 0.0
+        self.var = 0.0
+        self.cusum_high = 0.0
+        self.cusum_low = 0.0
+        self.change_points = 0
+        self.last_change_at: Optional[datetime] = None
+        self.window = WindowedDigest(engine.window_seconds, buckets=engine.window_buckets)
+        self.signals: _TimeRing[DriftSignal] = _TimeRing(engine.max_signals_per_domain)
+
+    def observe(self, score: float, now: datetime, engine: AuditEngine) -> bool:
+        changed = False
+        if self.count >= engine.warmup:
+            std = math.sqrt(self.var)
+            z = (score - self.mean) / std if std > 0 else 0.0
+            self.cusum_high = max(0.0, self.cusum_high + z - engine.cusum_slack)
+            self.cusum_low = max(0.0, self.cusum_low - z - engine.cusum_slack)
+            if self.cusum_high > engine.cusum_threshold or self.cusum_low > engine.cusum_threshold:
+                changed = True
+                self.change_points += 1
+                self.last_change_at = now
+                self.cusum_high = self.cusum_low = 0.0
+
+        if self.count == 0:
+            self.mean = score
+        else:
+            alpha = engine.ewma_alpha
+            delta = score - self.mean
+            self.mean += alpha * delta
+            self.var = (1 - alpha) * (self.var + alpha * delta * delta)
+        self.count += 1
+        self.last_score = score
+        self.last_at = now
+        self.window.add(score, now.timestamp())
+        return changed
 
 
 class AuditEngine:
@@ -23,21 +156,124 @@ class AuditEngine:
 
     Phase 3 will extend this to use Neo4j for correlation graphs and
     store findings in PostgreSQL.
+
+    Drift scores are folded into per-domain streaming statistics (EWMA,
+    sliding-window quantiles, CUSUM change points; see ``drift_summary``).
+    Raw drift and anomaly signals are kept in fixed-size rings indexed by
+    time, so memory stays bounded and a time-range read costs two binary
+    searches plus the items returned. Timestamps come from ``clock``.
     """
 
-    def __init__(self) -> None:
-        self._drift_signals: List[DriftSignal] = []
-        self._anomaly_signals: List[AnomalySignal] = []
+    def __init__(
+        self,
+        *,
+        ewma_alpha: float = 0.1,
+        window_seconds: float = 3600.0,
+        window_buckets: int = 12,
+        cusum_slack: float = 0.5,
+        cusum_threshold: float = 5.0,
+        warmup: int = 10,
+        max_signals_per_domain: int = 1024,
+        max_anomalies: int = 10_000,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        if not 0.0 < ewma_alpha <= 1.0:
+            raise ValueError("ewma_alpha must be in (0, 1]")
+        self.ewma_alpha = ewma_alpha
+        self.window_seconds = window_seconds
+        self.window_buckets = window_buckets
+        self.cusum_slack = cusum_slack
+        self.cusum_threshold = cusum_threshold
+        self.warmup = warmup
+        self.max_signals_per_domain = max_signals_per_domain
+        self._clock = clock
+        self._drift: Dict[str, _DomainDrift] = {}
+        self._anomaly_signals: _TimeRing[AnomalySignal] = _TimeRing(max_anomalies)
 
-    def record_drift(self, domain: str, drift_score: float) -> None:
-        self._drift_signals.append(DriftSignal(domain=domain, drift_score=drift_score))
+    def record_drift(self, domain: str, drift_score: float) -> bool:
+        """
+        Record a drift score; returns True if it completes a change point.
+        """
+        now = self._clock()
+        stats = self._drift.get(domain)
+        if stats is None:
+            stats = self._drift[domain] = _DomainDrift(self)
+        changed = stats.observe(drift_score, now, self)
+        stats.signals.append(
+            DriftSignal(domain=domain, drift_score=drift_score, timestamp=now, change_point=changed),
+            now.timestamp(),
+        )
+        return changed
 
     def record_anomaly(self, validator_id: str, reason: str, severity: float) -> None:
-        self._anomaly_signals.append(AnomalySignal(validator_id=validator_id, reason=reason, severity=severity))
+        now = self._clock()
+        self._anomaly_signals.append(
+            AnomalySignal(validator_id=validator_id, reason=reason, severity=severity, timestamp=now),
+            now.timestamp(),
+        )
+
+    def domains(self) -> List[str]:
+        return list(self._drift)
 
-    def get_recent_drift(self) -> List[DriftSignal]:
-        return list(self._drift_signals)
+    def drift_summary(self, domain: str) -> Optional[DriftSummary]:
+        """
+        Current statistics for one domain; None if it has no drift signals.
+        """
+        stats = self._drift.get(domain)
+        if stats is None:
+            return None
+        digest = stats.window.digest(self._clock().timestamp())
+        return DriftSummary(
+            domain=domain,
+            count=stats.count,
+            last_score=stats.last_score,
+            last_at=stats.last_at,
+            ewma=stats.mean,
+            ewma_std=math.sqrt(stats.var),
+            p50=digest.quantile(0.5),
+            p90=digest.quantile(0.9),
+            p99=digest.quantile(0.99),
+            change_points=stats.change_points,
+            last_change_at=stats.last_change_at,
+        )
 
-    def get_recent_anomalies(self) -> List[AnomalySignal]:
-        return list(self._anomaly_signals)
+    def get_recent_drift(
+        self,
+        domain: Optional[str] = None,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[DriftSignal]:
+        """
+        Retained drift signals in ``[since, until)``, newest first, for one
+        domain or all of them.
+        """
+        since_ts = since.timestamp() if since is not None else None
+        until_ts = until.timestamp() if until is not None else None
+        if domain is not None:
+            stats = self._drift.get(domain)
+            return stats.signals.range(since_ts, until_ts, limit) if stats is not None else []
+        signals = [
+            signal
+            for stats in self._drift.values()
+            for signal in stats.signals.range(since_ts, until_ts, limit)
+        ]
+        signals.sort(key=lambda signal: signal.timestamp, reverse=True)
+        return signals[:limit] if limit is not None else signals
 
+    def get_recent_anomalies(
+        self,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[AnomalySignal]:
+        """
+        Retained anomaly signals in ``[since, until)``, newest first.
+        """
+        return self._anomaly_signals.range(
+            since.timestamp() if since is not None else None,
+            until.timestamp() if until is not None else None,
+            limit,
+        )
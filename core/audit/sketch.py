@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Tuple
+
+
+class TDigest:
+    """
+    Merging t-digest (Dunning & Ertl) for streaming quantiles.
+
+    Values are buffered and periodically merged into at most about
+    ``compression`` centroids, sized by the arcsine scale function so the
+    tails stay accurate. Memory is O(compression) regardless of how many
+    values were added.
+    """
+
+    def __init__(self, compression: float = 100.0) -> None:
+        if compression < 10:
+            raise ValueError("compression must be >= 10")
+        self.compression = compression
+        self._means: List[float] = []
+        self._weights: List[float] = []
+        self._buffer: List[Tuple[float, float]] = []
+        self._buffer_limit = int(5 * compression)
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        self._buffer.append((value, weight))
+        self.count += weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._buffer) >= self._buffer_limit:
+            self._compress()
+
+    def update(self, other: TDigest) -> None:
+        """
+        Fold another digest's centroids into this one.
+        """
+        other._compress()
+        self._buffer.extend(zip(other._means, other._weights))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    @classmethod
+    def merged(cls, digests: Iterable[TDigest], compression: float = 100.0) -> TDigest:
+        result = cls(compression)
+        for digest in digests:
+            if digest.count:
+                result.update(digest)
+        return result
+
+    def _k(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+        points = sorted(list(zip(self._means, self._weights)) + self._buffer)
+        self._buffer = []
+        total = sum(weight for _, weight in points)
+        means: List[float] = []
+        weights: List[float] = []
+        mean, weight = points[0]
+        seen = 0.0
+        k_left = self._k(0.0)
+        for value, w in points[1:]:
+            if self._k(min(1.0, (seen + weight + w) / total)) - k_left <= 1.0:
+                mean += (value - mean) * w / (weight + w)
+                weight += w
+                continue
+            means.append(mean)
+            weights.append(weight)
+            seen += weight
+            k_left = self._k(min(1.0, seen / total))
+            mean, weight = value, w
+        means.append(mean)
+        weights.append(weight)
+        self._means = means
+        self._weights = weights
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimated ``q``-quantile, or None when the digest is empty.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1]")
+        self._compress()
+        if not self._means:
+            return None
+        if len(self._means) == 1:
+            return self._means[0]
+        target = q * self.count
+        # Centroid i covers cumulative weight [left_i, left_i + w_i]; its mean
+        # sits at the midpoint. Interpolate between neighbouring midpoints,
+        # and towards min/max beyond the first/last one.
+        cumulative = 0.0
+        previous_mid = 0.0
+        previous_mean = self.min
+        for mean, weight in zip(self._means, self._weights):
+            mid = cumulative + weight / 2
+            if target <= mid:
+                span = mid - previous_mid
+                frac = (target - previous_mid) / span if span > 0 else 0.0
+                return previous_mean + frac * (mean - previous_mean)
+            cumulative += weight
+            previous_mid, previous_mean = mid, mean
+        span = self.count - previous_mid
+        frac = (target - previous_mid) / span if span > 0 else 1.0
+        return previous_mean + frac * (self.max - previous_mean)
+
+
+class WindowedDigest:
+    """
+    Quantiles over a sliding time window.
+
+    The window is split into ``buckets`` sub-windows, each with its own
+    digest; expired sub-windows are dropped as time advances. A quantile
+    read merges the live sub-window digests, at most ``buckets`` of them,
+    and the merge is cached until the next add or rotation.
+    """
+
+    def __init__(self, window_seconds: float, *, buckets: int = 12, compression: float = 100.0) -> None:
+        if window_seconds <= 0 or buckets < 1:
+            raise ValueError("window_seconds must be > 0 and buckets >= 1")
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / buckets
+        self.compression = compression
+        self._starts: List[int] = []
+        self._digests: List[TDigest] = []
+        self._merged: Optional[TDigest] = None
+
+    def _expire(self, ts: float) -> None:
+        oldest = math.floor((ts - self.window_seconds) / self.bucket_seconds) + 1
+        drop = bisect_right(self._starts, oldest - 1)
+        if drop:
+            del self._starts[:drop]
+            del self._digests[:drop]
+            self._merged = None
+
+    def add(self, value: float, ts: float) -> None:
+        self._expire(ts)
+        bucket = math.floor(ts / self.bucket_seconds)
+        if not self._starts or bucket > self._starts[-1]:
+            self._starts.append(bucket)
+            self._digests.append(TDigest(self.compression))
+        # Late values fold into the newest sub-window.
+        self._digests[-1].add(value)
+        self._merged = None
+
+    def digest(self, ts: float) -> TDigest:
+        self._expire(ts)
+        if self._merged is None:
+            self._merged = TDigest.merged(self._digests, self.compression)
+        return self._merged
+
+    def quantile(self, q: float, ts: float) -> Optional[float]:
+        return self.digest(ts).quantile(q)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, BigInteger, Boolean, Column, DateTime, Float, ForeignKey, Integer, SmallInteger, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -58,6 +58,21 @@ class StakeStateORM(Base):
     total_locked: Mapped[float] = mapped_column(Float, nullable=False)
     effective_stake: Mapped[float] = mapped_column(Float, nullable=False)
     last_updated: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    slash_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_slashed: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    last_slashed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class StakeLockORM(Base):
+    __tablename__ = "stake_locks"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    validator_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("validators.id"), nullable=False, index=True
+    )
+    amount: Mapped[float] = mapped_column(Float, nullable=False)
+    lock_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
 class ReputationStateORM(Base):
@@ -70,6 +85,21 @@ class ReputationStateORM(Base):
     last_updated: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
+class ReplayEventORM(Base):
+    """
+    One ``EventLog`` row; ``seq`` is the row's position in the log.
+    """
+
+    __tablename__ = "replay_events"
+
+    seq: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    kind: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    validator_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    timestamp: Mapped[float] = mapped_column(Float, nullable=False)
+    value: Mapped[float] = mapped_column(Float, nullable=False)
+    reason: Mapped[str | None] = mapped_column(String, nullable=True)
+
+
 class GovernanceParamsORM(Base):
     __tablename__ = "governance_params"
 
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import uuid
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Set
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from core.identity.service import IdentityService
+from core.replay.log import SLASH, EventLog
+from core.reputation.models import ReputationState
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLock, StakeState
+from core.stake.service import StakeManager
+
+from .models import ReplayEventORM, ReputationStateORM, StakeLockORM, StakeStateORM, ValidatorORM
+
+
+logger = logging.getLogger(__name__)
+
+
+class StateWriteBehind:
+    """
+    Write-behind persistence for reputation and stake state.
+
+    ``ReputationEngine`` and ``StakeManager`` listeners only record which
+    validators changed, so requests never wait on the database. A background
+    task flushes dirty validators every ``flush_interval`` seconds, or as
+    soon as ``max_dirty`` validators are pending, reading their current
+    in-memory state and writing it with batched upserts of at most
+    ``batch_size`` rows. A flushed stake row carries the slashing summary,
+    and the validator's pending locks replace its ``stake_locks`` rows. A
+    failed flush puts its ids back so they are retried on the next one.
+    ``restore`` loads persisted state and reschedules the pending locks on
+    startup, so restored stake still expires.
+
+    When ``identity`` is given, the matching ``validators`` rows are upserted
+    first so the state tables' foreign keys hold; changes for validators the
+    registry does not know are dropped.
+
+    When ``event_log`` is given (the log both engines append to), its rows
+    are appended to ``replay_events`` in the same flushes, keyed by their
+    position in the log so a retried batch is written once, and ``restore``
+    reads them back into the log so history survives restarts for replay.
+    """
+
+    def __init__(
+        self,
+        reputation: ReputationEngine,
+        stake: StakeManager,
+        session_factory: Callable[[], Session],
+        *,
+        identity: Optional[IdentityService] = None,
+        event_log: Optional[EventLog] = None,
+        flush_interval: float = 1.0,
+        batch_size: int = 1_000,
+        max_dirty: int = 10_000,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self._reputation = reputation
+        self._stake = stake
+        self._session_factory = session_factory
+        self._identity = identity
+        self._event_log = event_log
+        # Rows of ``event_log`` before this offset are in the database.
+        self._events_written = 0
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_dirty = max_dirty
+        # Insertion-ordered sets so the oldest changes are flushed first.
+        self._dirty_reputation: Dict[uuid.UUID, None] = {}
+        self._dirty_stake: Dict[uuid.UUID, None] = {}
+        self._persisted_validators: Set[uuid.UUID] = set()
+        self._lock = threading.Lock()
+        self._restoring = False
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        reputation.add_listener(self._on_reputation_change)
+        stake.add_listener(self._on_stake_change)
+
+    # ---- Change tracking ----
+
+    def _on_reputation_change(self, state: ReputationState) -> None:
+        if not self._restoring:
+            with self._lock:
+                self._dirty_reputation[state.validator_id] = None
+            self._maybe_wake()
+
+    def _on_stake_change(self, state: StakeState) -> None:
+        if not self._restoring:
+            with self._lock:
+                self._dirty_stake[state.validator_id] = None
+            self._maybe_wake()
+
+    def _maybe_wake(self) -> None:
+        if self._wakeup is not None and self.pending() >= self.max_dirty:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def pending(self) -> int:
+        return len(self._dirty_reputation) + len(self._dirty_stake) + self._pending_events()
+
+    def _pending_events(self) -> int:
+        return len(self._event_log) - self._events_written if self._event_log is not None else 0
+
+    def _take(self, dirty: Dict[uuid.UUID, None], limit: int) -> List[uuid.UUID]:
+        ids = list(islice(dirty, limit))
+        for validator_id in ids:
+            del dirty[validator_id]
+        return ids
+
+    # ---- Flushing ----
+
+    def flush(self) -> int:
+        """
+        Write up to ``batch_size`` dirty reputation and stake rows and logged
+        events each; returns rows written.
+        """
+        with self._lock:
+            reputation_ids = self._take(self._dirty_reputation, self.batch_size)
+            stake_ids = self._take(self._dirty_stake, self.batch_size)
+        events_start = self._events_written
+        events_end = events_start + min(self._pending_events(), self.batch_size)
+        if not reputation_ids and not stake_ids and events_end == events_start:
+            return 0
+
+        new_validators: Set[uuid.UUID] = set()
+        try:
+            with self._session_factory() as db:
+                written = self._write(db, reputation_ids, stake_ids, new_validators)
+                written += self._write_events(db, events_start, events_end)
+                db.commit()
+        except Exception:
+            with self._lock:
+                for validator_id in reputation_ids:
+                    self._dirty_reputation.setdefault(validator_id, None)
+                for validator_id in stake_ids:
+                    self._dirty_stake.setdefault(validator_id, None)
+            raise
+        self._persisted_validators.update(new_validators)
+        self._events_written = max(self._events_written, events_end)
+        return written
+
+    def flush_all(self) -> int:
+        written = 0
+        while self.pending():
+            written += self.flush()
+        return written
+
+    def _write(
+        self,
+        db: Session,
+        reputation_ids: List[uuid.UUID],
+        stake_ids: List[uuid.UUID],
+        new_validators: Set[uuid.UUID],
+    ) -> int:
+        if self._identity is not None:
+            reputation_ids = self._persist_validators(db, reputation_ids, new_validators)
+            stake_ids = self._persist_validators(db, stake_ids, new_validators)
+
+        # Persist each score decayed to ``now`` together with ``now`` itself, so
+        # restoring it does not apply the decay since the last update twice.
+        now = datetime.now(timezone.utc)
+        reputation_rows = []
+        for validator_id in reputation_ids:
+            reputation_rows.append(
+                {"validator_id": validator_id, "score": self._reputation.score(validator_id, now), "last_updated": now}
+            )
+        stake_rows = []
+        lock_rows = []
+        for validator_id in stake_ids:
+            state = self._stake.get_state(validator_id)
+            if state is not None:
+                stake_rows.append(
+                    {
+                        "validator_id": validator_id,
+                        "total_locked": state.total_locked,
+                        "effective_stake": state.effective_stake,
+                        "last_updated": state.last_updated,
+                        "slash_count": state.slash_count,
+                        "total_slashed": state.total_slashed,
+                        "last_slashed_at": state.last_slashed_at,
+                    }
+                )
+                for record in self._stake.locks(validator_id):
+                    lock_rows.append(
+                        {
+                            "id": record.id,
+                            "validator_id": validator_id,
+                            "amount": record.amount,
+                            "lock_until": record.lock_until,
+                            "created_at": record.created_at,
+                        }
+                    )
+        _upsert(db, ReputationStateORM, reputation_rows)
+        _upsert(db, StakeStateORM, stake_rows)
+        # Locks are released and shrink with slashes, so each flushed
+        # validator's lock set is replaced as a whole.
+        if stake_ids:
+            db.execute(delete(StakeLockORM).where(StakeLockORM.validator_id.in_(stake_ids)))
+        if lock_rows:
+            db.execute(StakeLockORM.__table__.insert(), lock_rows)
+        return len(reputation_rows) + len(stake_rows)
+
+    def _write_events(self, db: Session, start: int, end: int) -> int:
+        log = self._event_log
+        if log is None or end <= start:
+            return 0
+        ids = log.validator_ids
+        rows = [
+            {
+                "seq": row,
+                "kind": log.kinds[row],
+                "validator_id": ids[log.validators[row]],
+                "timestamp": log.timestamps[row],
+                "value": log.values[row],
+                "reason": log.slash_reasons.get(row) if log.kinds[row] == SLASH else None,
+            }
+            for row in range(start, end)
+        ]
+        _upsert(db, ReplayEventORM, rows, key="seq", update=False)
+        return len(rows)
+
+    def _persist_validators(
+        self, db: Session, validator_ids: List[uuid.UUID], new_validators: Set[uuid.UUID]
+    ) -> List[uuid.UUID]:
+        known: List[uuid.UUID] = []
+        rows = []
+        for validator_id in validator_ids:
+            if validator_id in self._persisted_validators or validator_id in new_validators:
+                known.append(validator_id)
+                continue
+            validator = self._identity.get_validator(str(validator_id))
+            if validator is None:
+                continue
+            rows.append(
+                {
+                    "id": validator.id,
+                    "public_key": validator.public_key,
+                    "model_family": validator.model_family,
+                    "region": validator.region,
+                    "domain_focus": validator.domain_focus,
+                    "created_at": validator.created_at,
+                    "is_active": validator.is_active,
+                }
+            )
+            known.append(validator_id)
+        _upsert(db, ValidatorORM, rows, key="id", update=False)
+        new_validators.update(row["id"] for row in rows)
+        return known
+
+    # ---- Recovery ----
+
+    def restore(self) -> int:
+        """
+        Load persisted reputation and stake state into memory; returns rows loaded.
+
+        Persisted events are appended to ``event_log``, which must still be
+        empty, in their original order.
+        """
+        loaded = 0
+        self._restoring = True
+        try:
+            with self._session_factory() as db:
+                for row in db.scalars(select(ReputationStateORM)):
+                    self._reputation.load_state(row.validator_id, row.score, _as_utc(row.last_updated))
+                    self._persisted_validators.add(row.validator_id)
+                    loaded += 1
+                for row in db.scalars(select(StakeStateORM)):
+                    self._stake.load_state(
+                        row.validator_id,
+                        row.total_locked,
+                        row.effective_stake,
+                        _as_utc(row.last_updated),
+                        slash_count=row.slash_count,
+                        total_slashed=row.total_slashed,
+                        last_slashed_at=_as_utc(row.last_slashed_at) if row.last_slashed_at else None,
+                    )
+                    self._persisted_validators.add(row.validator_id)
+                    loaded += 1
+                for row in db.scalars(select(StakeLockORM)):
+                    self._stake.load_lock(
+                        StakeLock(
+                            id=row.id,
+                            validator_id=row.validator_id,
+                            amount=row.amount,
+                            lock_until=_as_utc(row.lock_until),
+                            created_at=_as_utc(row.created_at),
+                        )
+                    )
+                if self._event_log is not None:
+                    loaded += self._restore_events(db)
+        finally:
+            self._restoring = False
+        return loaded
+
+    def _restore_events(self, db: Session) -> int:
+        log = self._event_log
+        if len(log):
+            raise RuntimeError("restore the event log before any events are recorded")
+        rows = db.scalars(select(ReplayEventORM).order_by(ReplayEventORM.seq).execution_options(yield_per=10_000))
+        for row in rows:
+            log.append_event(row.kind, row.validator_id, row.timestamp, row.value, row.reason)
+        self._events_written = len(log)
+        return len(log)
+
+    # ---- Background task ----
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self.pending():
+                try:
+                    await loop.run_in_executor(None, self.flush)
+                except Exception:
+                    logger.exception("reputation/stake write-behind flush failed; will retry")
+                    break
+                if self.pending() < self.max_dirty:
+                    break
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = self._loop.create_task(self.run())
+
+    async def stop(self) -> None:
+        """
+        Stop the background task and flush everything still pending.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._wakeup = None
+        await asyncio.get_running_loop().run_in_executor(None, self.flush_all)
+
+
+def _upsert(db: Session, orm, rows: List[dict], key: str = "validator_id", update: bool = True) -> None:
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"write-behind upserts are not implemented for {dialect}")
+    stmt = insert(orm.__table__).values(rows)
+    if update:
+        columns = [name for name in rows[0] if name != key]
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[key], set_={name: stmt.excluded[name] for name in columns}
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[key])
+    db.execute(stmt)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Backends without timezone support (SQLite) return naive UTC datetimes.
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import math
+import os
+import threading
+import uuid
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.ledger.service import LedgerService
+from core.validation.batch import OUTCOMES, VOTE_CODES
+from core.validation.influence import ValidatorInfluenceContext, compute_influence_weight
+from core.validation.service import VoteService
+from core.validation.session import ValidationSessionService, decide_outcome
+
+from .models import DomainImpact, GovernanceParams, ProposalImpact, next_params
+from .service import GovernanceService
+
+
+UNKNOWN_DOMAIN = "unknown"
+
+
+@dataclass
+class ImpactChunk:
+    """
+    Compact, picklable input for one worker.
+
+    Same layout as ``ConsensusChunk``, with two weights per distinct
+    validator (under the current and the candidate params) and one index
+    into the domain names per claim.
+    """
+
+    offsets: array  # 'q', len = n_claims + 1
+    validator_index: array  # 'l', one per vote
+    vote_codes: array  # 'b', one per vote (see VOTE_CODES)
+    confidences: array  # 'd', one per vote
+    current_influence: array  # 'd', one per distinct validator
+    candidate_influence: array  # 'd', one per distinct validator
+    domains: array  # 'l', one per claim
+
+
+ChunkImpact = Tuple[Dict[int, int], Dict[Tuple[int, int, int], int], array]
+
+
+def simulate_chunk(chunk: ImpactChunk, confidence_threshold: float) -> ChunkImpact:
+    """
+    Worker entry point: decide every claim of a chunk under both weightings.
+
+    Returns (claims per domain, flips per (domain, current outcome code,
+    candidate outcome code), chunk-local indexes of the flipped claims).
+    """
+    claims: Dict[int, int] = {}
+    for domain in chunk.domains:
+        claims[domain] = claims.get(domain, 0) + 1
+    flips: Dict[Tuple[int, int, int], int] = {}
+    flipped = array("l")
+    if chunk.current_influence == chunk.candidate_influence:
+        # The diff does not touch any weight these claims depend on.
+        return claims, flips, flipped
+
+    offsets = chunk.offsets
+    vidx = chunk.validator_index
+    codes = chunk.vote_codes
+    conf = chunk.confidences
+    current = chunk.current_influence
+    candidate = chunk.candidate_influence
+    for i in range(len(offsets) - 1):
+        before = [0.0, 0.0, 0.0]
+        after = [0.0, 0.0, 0.0]
+        for j in range(offsets[i], offsets[i + 1]):
+            k = vidx[j]
+            code = codes[j]
+            before[code] += current[k] * conf[j]
+            after[code] += candidate[k] * conf[j]
+        if before == after:
+            continue
+        old = OUTCOMES.index(decide_outcome(before[0], before[1], before[2], confidence_threshold)[0])
+        new = OUTCOMES.index(decide_outcome(after[0], after[1], after[2], confidence_threshold)[0])
+        if old != new:
+            key = (chunk.domains[i], old, new)
+            flips[key] = flips.get(key, 0) + 1
+            flipped.append(i)
+    return claims, flips, flipped
+
+
+def _weight(ctx: ValidatorInfluenceContext, params: GovernanceParams) -> float:
+    return compute_influence_weight(ctx, max_weight_cap=params.max_influence_weight, stake_cap=params.stake_cap)
+
+
+class GovernanceImpactSimulator:
+    """
+    What-if analysis of a parameter diff over stored votes.
+
+    Every claim's stored votes are re-weighed with influence computed under
+    the active params and under the candidate params (the active params with
+    the diff applied), and both are decided with the threshold rule. Both
+    sides use today's stake, reputation and identity state, so a flip is
+    caused by the diff alone. Votes already cast do not depend on sampling,
+    so the diversity caps cannot flip a stored outcome.
+
+    As in ``BatchConsensusEvaluator``, influence contexts are computed once
+    per distinct validator in the parent process and claims are partitioned
+    into compact array chunks that are decided on a process pool.
+
+    Simulations are serialized on one lock, so however many requests arrive
+    at once there is at most one pool alive and it never exceeds
+    ``max_workers`` processes (the CPU count by default). A request that
+    waited on the lock reuses the report the previous holder attached.
+    """
+
+    def __init__(
+        self,
+        sessions: ValidationSessionService,
+        votes: VoteService,
+        ledger: Optional[LedgerService] = None,
+        *,
+        chunks_per_worker: int = 4,
+        min_parallel_claims: int = 1000,
+        max_flipped_claims: int = 100,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self._sessions = sessions
+        self._votes = votes
+        self._ledger = ledger
+        self.chunks_per_worker = chunks_per_worker
+        self.min_parallel_claims = min_parallel_claims
+        self.max_flipped_claims = max_flipped_claims
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._lock = threading.RLock()
+
+    def simulate(
+        self,
+        parameters_diff: Dict[str, float],
+        claim_ids: Optional[Sequence[uuid.UUID]] = None,
+        *,
+        workers: Optional[int] = None,
+        now: Optional[datetime] = None,
+        proposal_id: Optional[uuid.UUID] = None,
+    ) -> ProposalImpact:
+        """
+        Outcome deltas of ``parameters_diff`` over ``claim_ids`` (every claim with votes if None).
+        """
+        if claim_ids is None:
+            claim_ids = self._votes.list_claim_ids()
+        now = now or datetime.now(timezone.utc)
+        workers = min(workers or self.max_workers, self.max_workers)
+        current = self._sessions.params()
+        candidate = next_params(current, parameters_diff)
+
+        domain_names: List[str] = []
+        domain_index: Dict[str, int] = {}
+        weights: Dict[uuid.UUID, Tuple[float, float]] = {}
+        n_chunks = 1 if workers <= 1 else workers * self.chunks_per_worker
+        size = max(1, math.ceil(len(claim_ids) / n_chunks))
+        partitions = [claim_ids[i : i + size] for i in range(0, len(claim_ids), size)]
+        chunks = [
+            self._build_chunk(part, weights, domain_names, domain_index, now, current, candidate)
+            for part in partitions
+        ]
+
+        threshold = self._sessions.confidence_threshold
+        if workers <= 1 or len(claim_ids) < self.min_parallel_claims:
+            outputs = [simulate_chunk(chunk, threshold) for chunk in chunks]
+        else:
+            with self._lock, ProcessPoolExecutor(max_workers=workers) as pool:
+                outputs = list(pool.map(simulate_chunk, chunks, [threshold] * len(chunks)))
+
+        claims: Dict[int, int] = {}
+        flips: Dict[Tuple[int, int, int], int] = {}
+        flipped_claims: List[uuid.UUID] = []
+        for part, (chunk_claims, chunk_flips, chunk_flipped) in zip(partitions, outputs):
+            for domain, count in chunk_claims.items():
+                claims[domain] = claims.get(domain, 0) + count
+            for key, count in chunk_flips.items():
+                flips[key] = flips.get(key, 0) + count
+            for i in chunk_flipped[: self.max_flipped_claims - len(flipped_claims)]:
+                flipped_claims.append(part[i])
+
+        domains: Dict[int, DomainImpact] = {
+            code: DomainImpact(domain=domain_names[code], claims=count, flipped=0) for code, count in claims.items()
+        }
+        for (code, old, new), count in sorted(flips.items()):
+            row = domains[code]
+            row.flipped += count
+            row.transitions[f"{OUTCOMES[old]}->{OUTCOMES[new]}"] = count
+        return ProposalImpact(
+            proposal_id=proposal_id,
+            base_version=current.version,
+            claims_evaluated=len(claim_ids),
+            claims_flipped=sum(flips.values()),
+            domains=sorted(domains.values(), key=lambda row: (-row.flipped, row.domain)),
+            flipped_claims=flipped_claims,
+            computed_at=now,
+        )
+
+    def proposal_impact(
+        self,
+        governance: GovernanceService,
+        proposal_id: uuid.UUID,
+        *,
+        refresh: bool = False,
+        workers: Optional[int] = None,
+    ) -> Optional[ProposalImpact]:
+        """
+        Impact of a proposal, attached to it and reused while the active params
+        version is unchanged. Enacted proposals keep the report computed before
+        enactment. None for an unknown proposal.
+
+        The report is not invalidated by votes cast after it was computed; it
+        stays stale until ``refresh`` or a params change.
+        """
+        proposal = governance.get_proposal(proposal_id)
+        if proposal is None:
+            return None
+        with self._lock:
+            cached = proposal.impact
+            if cached is not None and not refresh:
+                if proposal.enacted or cached.base_version == governance.get_params().version:
+                    return cached
+            proposal.impact = self.simulate(proposal.parameters_diff, workers=workers, proposal_id=proposal_id)
+            return proposal.impact
+
+    def _build_chunk(
+        self,
+        claim_ids: Sequence[uuid.UUID],
+        weights: Dict[uuid.UUID, Tuple[float, float]],
+        domain_names: List[str],
+        domain_index: Dict[str, int],
+        now: datetime,
+        current: GovernanceParams,
+        candidate: GovernanceParams,
+    ) -> ImpactChunk:
+        offsets = array("q", [0])
+        validator_index = array("l")
+        vote_codes = array("b")
+        confidences = array("d")
+        current_influence = array("d")
+        candidate_influence = array("d")
+        domains = array("l")
+        local_index: Dict[uuid.UUID, int] = {}
+
+        for cid in claim_ids:
+            domain = (self._ledger.claim_domain(cid) if self._ledger is not None else None) or UNKNOWN_DOMAIN
+            code = domain_index.get(domain)
+            if code is None:
+                code = domain_index[domain] = len(domain_names)
+                domain_names.append(domain)
+            domains.append(code)
+            for v in self._votes.raw_votes_for_claim(cid):
+                if not v.signature_valid:
+                    continue
+                idx = local_index.get(v.validator_id)
+                if idx is None:
+                    pair = weights.get(v.validator_id)
+                    if pair is None:
+                        ctx = self._sessions.influence_context(v.validator_id, now)
+                        pair = weights[v.validator_id] = (_weight(ctx, current), _weight(ctx, candidate))
+                    idx = len(current_influence)
+                    local_index[v.validator_id] = idx
+                    current_influence.append(pair[0])
+                    candidate_influence.append(pair[1])
+                validator_index.append(idx)
+                vote_codes.append(VOTE_CODES.get(v.vote_type, VOTE_CODES["uncertain"]))
+                confidences.append(v.confidence)
+            offsets.append(len(vote_codes))
+
+        return ImpactChunk(
+            offsets=offsets,
+            validator_index=validator_index,
+            vote_codes=vote_codes,
+            confidences=confidences,
+            current_influence=current_influence,
+            candidate_influence=candidate_influence,
+            domains=domains,
+        )
@@ -3,19 +3,54 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 
 class GovernanceParams(BaseModel):
-    version: int = 1
+    """
+    One immutable, versioned snapshot of the protocol parameters.
+
+    Enacting a proposal builds a new snapshot and swaps the active reference,
+    so a reader holding a snapshot sees one consistent version throughout.
+    Snapshots are always built through validation (see ``next_params``).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    version: int = Field(default=1, ge=1)
     description: str = "Default governance parameters"
-    max_influence_weight: float = 1e6
-    stake_cap: float = 1e9
-    diversity_model_cap: float = 0.6
-    diversity_region_cap: float = 0.7
-    slashing_confirmation_rounds: int = 2
+    max_influence_weight: float = Field(default=1e6, gt=0)
+    stake_cap: float = Field(default=1e9, gt=0)
+    diversity_model_cap: float = Field(default=0.3, gt=0, le=1)
+    diversity_region_cap: float = Field(default=0.4, gt=0, le=1)
+    slashing_confirmation_rounds: int = Field(default=2, ge=1)
+
+
+DEFAULT_PARAMS = GovernanceParams()
+
+
+def params_overrides(parameters_diff: Dict[str, float]) -> Dict[str, float]:
+    """
+    The entries of a proposal diff that name a GovernanceParams field; ``version`` is never overridden.
+    """
+    return {
+        key: value
+        for key, value in parameters_diff.items()
+        if key in GovernanceParams.model_fields and key != "version"
+    }
+
+
+def next_params(current: GovernanceParams, parameters_diff: Dict[str, float]) -> GovernanceParams:
+    """
+    The validated snapshot that follows ``current`` once ``parameters_diff`` is applied.
+
+    Raises ``pydantic.ValidationError`` if an override is out of range or of the wrong type.
+    """
+    return GovernanceParams.model_validate(
+        {**current.model_dump(), **params_overrides(parameters_diff), "version": current.version + 1}
+    )
 
 
 class ProposalCreateRequest(BaseModel):
@@ -26,6 +61,47 @@ class ProposalCreateRequest(BaseModel):
     )
     activation_delay_hours: int = Field(default=24, ge=1)
 
+    @field_validator("parameters_diff")
+    @classmethod
+    def _check_parameters_diff(cls, diff: Dict[str, float]) -> Dict[str, float]:
+        # Reject bad values when proposed rather than when enacted.
+        try:
+            next_params(DEFAULT_PARAMS, diff)
+        except ValidationError as exc:
+            raise ValueError(f"invalid parameters_diff: {exc}") from exc
+        return diff
+
+
+class DomainImpact(BaseModel):
+    domain: str
+    claims: int
+    flipped: int
+    transitions: Dict[str, int] = Field(
+        default_factory=dict, description="Flip counts keyed \"<current outcome>-><candidate outcome>\"."
+    )
+
+
+class ProposalImpact(BaseModel):
+    """
+    Outcome deltas of a proposal over stored votes, as of ``computed_at``.
+
+    Reports are cached per proposal and active params version. Votes cast
+    after ``computed_at`` are not reflected until the report is recomputed
+    with ``refresh=true``.
+    """
+
+    proposal_id: Optional[uuid.UUID] = None
+    base_version: int = Field(..., description="Version of the active params the candidate was compared against.")
+    claims_evaluated: int
+    claims_flipped: int
+    domains: List[DomainImpact]
+    flipped_claims: List[uuid.UUID] = Field(
+        default_factory=list, description="A bounded sample of claims whose outcome would change."
+    )
+    computed_at: datetime = Field(
+        ..., description="When the report was computed; later votes are only counted after refresh=true."
+    )
+
 
 @dataclass
 class Proposal:
@@ -36,10 +112,19 @@ class Proposal:
     created_at: datetime
     activation_time: datetime
     enacted: bool = False
+    impact: Optional[ProposalImpact] = None
 
 
 @dataclass
 class GovernanceState:
+    """
+    Pending proposals are indexed by id and queued in a min-heap of
+    ``(activation timestamp, creation sequence, id)``; once enacted they move
+    to ``archive``.
+    """
+
     active_params: GovernanceParams
-    proposals: Dict[uuid.UUID, Proposal]
+    pending: Dict[uuid.UUID, Proposal]
+    archive: Dict[uuid.UUID, Proposal]
+    queue: List[Tuple[float, int, uuid.UUID]]
 
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+from .models import Proposal
+from .service import GovernanceService
+
+
+class ProposalEnactmentScheduler:
+    """
+    Background task enacting governance proposals when they become due.
+
+    Instead of polling, it sleeps until the earliest pending activation
+    time. Creating a proposal wakes it so it can re-arm for an earlier
+    deadline; with nothing pending it sleeps until the next proposal arrives.
+    """
+
+    def __init__(self, governance: GovernanceService) -> None:
+        self._governance = governance
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake = asyncio.Event()
+        governance.add_listener(self._on_proposal_created)
+
+    def _on_proposal_created(self, proposal: Proposal) -> None:
+        # Proposals may be created off the loop thread; hand the wake-up to the loop.
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def run_once(self) -> List[Proposal]:
+        return self._governance.maybe_enact_proposals()
+
+    async def run(self) -> None:
+        while True:
+            self._wake.clear()
+            self.run_once()
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._governance.seconds_until_next_activation())
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._task = self._loop.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._loop = None
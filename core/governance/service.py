@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
-from .models import GovernanceParams, GovernanceState, Proposal, ProposalCreateRequest
+from .models import GovernanceParams, GovernanceState, Proposal, ProposalCreateRequest, next_params, params_overrides
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class GovernanceService:
@@ -13,19 +19,42 @@ class GovernanceService:
 
     Phase 4 will attach this to validation results for proposal voting and
     record all changes in the ledger.
+
+    Pending proposals wait in a min-heap keyed by activation time, so
+    ``maybe_enact_proposals`` only touches proposals that are due; enacted
+    proposals are moved to an archive. Timestamps come from ``clock``.
     """
 
-    def __init__(self, initial_params: Optional[GovernanceParams] = None) -> None:
+    def __init__(
+        self,
+        initial_params: Optional[GovernanceParams] = None,
+        *,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
         self._state = GovernanceState(
             active_params=initial_params or GovernanceParams(),
-            proposals={},
+            pending={},
+            archive={},
+            queue=[],
         )
+        self._clock = clock
+        self._seq = itertools.count()
+        self._listeners: List[Callable[[Proposal], None]] = []
+
+    def add_listener(self, listener: Callable[[Proposal], None]) -> None:
+        """
+        Register a callback invoked after a proposal is created.
+        """
+        self._listeners.append(listener)
 
     def get_params(self) -> GovernanceParams:
+        """
+        The active snapshot; a single reference load, safe without locks.
+        """
         return self._state.active_params
 
     def create_proposal(self, req: ProposalCreateRequest) -> Proposal:
-        now = datetime.now(timezone.utc)
+        now = self._clock()
         activation_time = now + timedelta(hours=req.activation_delay_hours)
         proposal = Proposal(
             id=uuid.uuid4(),
@@ -36,29 +65,50 @@ class GovernanceService:
             activation_time=activation_time,
             enacted=False,
         )
-        self._state.proposals[proposal.id] = proposal
+        self._state.pending[proposal.id] = proposal
+        heapq.heappush(self._state.queue, (activation_time.timestamp(), next(self._seq), proposal.id))
+        for listener in self._listeners:
+            listener(proposal)
         return proposal
 
+    def get_proposal(self, proposal_id: uuid.UUID) -> Optional[Proposal]:
+        return self._state.pending.get(proposal_id) or self._state.archive.get(proposal_id)
+
     def list_proposals(self) -> Dict[uuid.UUID, Proposal]:
-        return dict(self._state.proposals)
+        return {**self._state.archive, **self._state.pending}
 
-    def maybe_enact_proposals(self, now: Optional[datetime] = None) -> None:
+    def pending_count(self) -> int:
+        return len(self._state.pending)
+
+    def seconds_until_next_activation(self, now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Time until the earliest pending proposal is due (0 if overdue), or None when nothing is pending.
         """
-        Enact proposals whose activation time has passed.
+        queue = self._state.queue
+        if not queue:
+            return None
+        return max(0.0, queue[0][0] - (now or self._clock()).timestamp())
+
+    def maybe_enact_proposals(self, now: Optional[datetime] = None) -> List[Proposal]:
+        """
+        Enact proposals whose activation time has passed, in activation order,
+        and return them.
         In a full implementation, this would be guarded by governance voting.
         """
-        now = now or datetime.now(timezone.utc)
-        params = self._state.active_params.model_copy()
-        changed = False
-        for proposal in self._state.proposals.values():
-            if proposal.enacted or proposal.activation_time > now:
-                continue
-            for key, value in proposal.parameters_diff.items():
-                if hasattr(params, key):
-                    setattr(params, key, value)
-                    changed = True
+        now_ts = (now or self._clock()).timestamp()
+        state = self._state
+        queue = state.queue
+        enacted: List[Proposal] = []
+        updates: Dict[str, float] = {}
+        while queue and queue[0][0] <= now_ts:
+            _, _, proposal_id = heapq.heappop(queue)
+            proposal = state.pending.pop(proposal_id)
+            updates.update(params_overrides(proposal.parameters_diff))
             proposal.enacted = True
-        if changed:
-            params.version += 1
-            self._state.active_params = params
-
+            state.archive[proposal_id] = proposal
+            enacted.append(proposal)
+        if updates:
+            # Build the next snapshot completely, then publish it with one
+            # reference swap; readers never observe a half-applied change.
+            state.active_params = next_params(state.active_params, updates)
+        return enacted
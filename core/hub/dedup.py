@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+from core.observability.metrics import record_gossip_dedup_evictions, record_gossip_dedup_hit
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over a ``bytearray``.
+
+    Sized for ``capacity`` items at ``false_positive_rate``; bit positions
+    come from double hashing, so callers can compute them once and probe
+    several filters of the same shape.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate must be in (0, 1)")
+        self.capacity = capacity
+        self.num_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def positions(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def contains(self, positions: List[int]) -> bool:
+        bits = self.bits
+        for pos in positions:
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def add(self, positions: List[int]) -> None:
+        bits = self.bits
+        for pos in positions:
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def clear(self) -> None:
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+
+class SeenMessageCache:
+    """
+    Bounded set of recently seen gossip message ids.
+
+    Two tiers:
+
+    - an exact TTL-LRU of at most ``max_entries`` ids, each dropped once it
+      has not been seen for ``ttl_seconds``;
+    - a pair of rotating Bloom filters. Every id is added to the current
+      filter, which is retired once it holds ``bloom_capacity`` ids or is
+      ``ttl_seconds`` old. The previous filter is then discarded and the
+      current one becomes the previous one.
+
+    An id is therefore remembered for at least one full filter generation
+    after it was last added: ``ttl_seconds`` or ``bloom_capacity`` later
+    ids, whichever comes first. Lookups that miss the LRU fall back to the
+    filters, whose combined false-positive rate stays within
+    ``false_positive_rate``; a false positive drops a new message as a
+    duplicate. Memory is fixed by ``max_entries`` and ``bloom_capacity``,
+    whatever the traffic. Setting ``bloom_capacity`` to 0 disables the
+    filters and leaves an exact, smaller-horizon cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 100_000,
+        ttl_seconds: float = 600.0,
+        bloom_capacity: int = 1_000_000,
+        false_positive_rate: float = 1e-6,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.false_positive_rate = false_positive_rate
+        self._clock = clock
+        self._entries: "OrderedDict[str, float]" = OrderedDict()  # id -> last seen, oldest first
+        self._bloom_enabled = bloom_capacity > 0
+        if self._bloom_enabled:
+            # Both generations are probed, so split the budget between them.
+            per_filter = 1.0 - math.sqrt(1.0 - false_positive_rate)
+            self._current = BloomFilter(bloom_capacity, per_filter)
+            self._previous = BloomFilter(bloom_capacity, per_filter)
+            self._generation_started = clock()
+        self.lru_hits = 0
+        self.bloom_hits = 0
+        self.misses = 0
+        self.evictions: Dict[str, int] = {"ttl": 0, "capacity": 0, "rotation": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def check_and_add(self, message_id: str) -> bool:
+        """
+        Record ``message_id``; returns True if it was (probably) seen before.
+        """
+        now = self._clock()
+        self._expire(now)
+        entries = self._entries
+        if message_id in entries:
+            entries.move_to_end(message_id)
+            entries[message_id] = now
+            self.lru_hits += 1
+            record_gossip_dedup_hit("lru")
+            return True
+
+        seen = False
+        if self._bloom_enabled:
+            positions = self._current.positions(message_id)
+            if self._current.contains(positions) or self._previous.contains(positions):
+                seen = True
+                self.bloom_hits += 1
+                record_gossip_dedup_hit("bloom")
+            else:
+                self.misses += 1
+                self._current.add(positions)
+        else:
+            self.misses += 1
+
+        entries[message_id] = now
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self._evicted("capacity", 1)
+        return seen
+
+    def add(self, message_id: str) -> None:
+        self.check_and_add(message_id)
+
+    def _expire(self, now: float) -> None:
+        entries = self._entries
+        cutoff = now - self.ttl_seconds
+        expired = 0
+        while entries:
+            oldest = next(iter(entries.values()))
+            if oldest > cutoff:
+                break
+            entries.popitem(last=False)
+            expired += 1
+        if expired:
+            self._evicted("ttl", expired)
+
+        if self._bloom_enabled and (
+            self._current.count >= self._current.capacity or now - self._generation_started >= self.ttl_seconds
+        ):
+            dropped = self._previous.count
+            self._previous.clear()
+            self._previous, self._current = self._current, self._previous
+            self._generation_started = now
+            if dropped:
+                self._evicted("rotation", dropped)
+
+    def _evicted(self, reason: str, count: int) -> None:
+        self.evictions[reason] += count
+        record_gossip_dedup_evictions(reason, count)
+
+    def memory_bytes(self) -> int:
+        """
+        Size of the Bloom filter bit arrays (fixed at construction).
+        """
+        if not self._bloom_enabled:
+            return 0
+        return len(self._current.bits) + len(self._previous.bits)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "lru_hits": self.lru_hits,
+            "bloom_hits": self.bloom_hits,
+            "misses": self.misses,
+            "evictions": dict(self.evictions),
+            "bloom_bytes": self.memory_bytes(),
+        }
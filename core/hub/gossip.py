@@ -3,9 +3,11 @@ from __future__ import annotations
 import asyncio
 import json
 import random
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
 from enum import Enum
 import uuid
 
@@ -13,6 +15,15 @@ import websockets
 from websockets.server import WebSocketServerProtocol
 from websockets.exceptions import ConnectionClosed
 
+from core.observability.metrics import (
+    clear_gossip_peer_metrics,
+    record_gossip_peer_drop,
+    record_gossip_peer_send,
+    update_gossip_peer_queue,
+)
+
+from .dedup import SeenMessageCache
+
 
 class MessageType(Enum):
     """Types of gossip messages exchanged between hubs"""
@@ -34,6 +45,12 @@ class HubConfig:
     gossip_interval: float = 0.5
     health_check_interval: float = 30.0
     propagation_timeout: float = 5.0
+    dedup_max_entries: int = 100_000
+    dedup_ttl: float = 600.0
+    dedup_bloom_capacity: int = 1_000_000
+    dedup_false_positive_rate: float = 1e-6
+    peer_queue_size: int = 1000
+    peer_overflow_policy: str = "drop_oldest"  # or "drop_newest", "disconnect"
 
 
 @dataclass
@@ -47,15 +64,125 @@ class GossipMessage:
     ttl: int = 5
 
 
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+
+class PeerConnection:
+    """
+    Outbound side of one peer connection.
+
+    Messages are queued without blocking and sent by the peer's own writer
+    task, so a slow peer only delays itself. The queue holds at most
+    ``peer_queue_size`` messages; on overflow the oldest or newest message is
+    dropped, or, with the ``disconnect`` policy, the peer is reported to
+    ``on_failure`` and dropped. A send that fails or takes longer than
+    ``propagation_timeout`` also reports the peer to ``on_failure``.
+    """
+
+    def __init__(
+        self,
+        peer_id: str,
+        websocket: WebSocketServerProtocol,
+        config: HubConfig,
+        on_failure: Callable[[str], None],
+    ):
+        if config.peer_overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"peer_overflow_policy must be one of {OVERFLOW_POLICIES}")
+        self.peer_id = peer_id
+        self.websocket = websocket
+        self.max_queue = config.peer_queue_size
+        self.overflow_policy = config.peer_overflow_policy
+        self.send_timeout = config.propagation_timeout
+        self._on_failure = on_failure
+        self._queue: Deque[Tuple[float, str]] = deque()  # (enqueued_at, payload)
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.dropped = 0
+        self.last_lag = 0.0
+
+    def start(self):
+        """Start the writer task on the running loop"""
+        self._task = asyncio.get_running_loop().create_task(self._writer())
+
+    def enqueue(self, payload: str) -> bool:
+        """Queue a message for sending; returns False if the peer must be disconnected"""
+        if len(self._queue) >= self.max_queue:
+            record_gossip_peer_drop(self.overflow_policy)
+            if self.overflow_policy == "disconnect":
+                return False
+            self.dropped += 1
+            if self.overflow_policy == "drop_newest":
+                return True
+            self._queue.popleft()
+        self._queue.append((time.monotonic(), payload))
+        self._ready.set()
+        update_gossip_peer_queue(self.peer_id, len(self._queue))
+        return True
+
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def lag(self) -> float:
+        """Seconds the oldest queued message has been waiting"""
+        return time.monotonic() - self._queue[0][0] if self._queue else 0.0
+
+    async def _writer(self):
+        while True:
+            while not self._queue:
+                self._ready.clear()
+                await self._ready.wait()
+            enqueued_at, payload = self._queue.popleft()
+            try:
+                await asyncio.wait_for(self.websocket.send(payload), timeout=self.send_timeout)
+            except Exception as e:
+                print(f"Error sending to peer {self.peer_id}: {e!r}")
+                self._on_failure(self.peer_id)
+                return
+            self.sent += 1
+            self.last_lag = time.monotonic() - enqueued_at
+            record_gossip_peer_send(self.peer_id, self.last_lag, len(self._queue))
+
+    async def close(self):
+        """Stop the writer and close the websocket"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        try:
+            await self.websocket.close()
+        except Exception:
+            pass
+
+    def status(self) -> dict:
+        return {
+            "queued": len(self._queue),
+            "lag_seconds": self.lag(),
+            "last_send_lag_seconds": self.last_lag,
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
+
+
 class GossipProtocol:
     """Gossip protocol implementation for inter-hub communication"""
     
     def __init__(self, config: HubConfig):
         self.config = config
-        self.peers: Dict[str, WebSocketServerProtocol] = {}
+        self.peers: Dict[str, PeerConnection] = {}
         self.known_peers: Set[str] = set()
-        self.sent_messages: Set[str] = set()
-        self.received_messages: Set[str] = set()
+        # Bounded by count and age; our own broadcasts are recorded too so
+        # their echoes from peers are dropped.
+        self.seen_messages = SeenMessageCache(
+            max_entries=config.dedup_max_entries,
+            ttl_seconds=config.dedup_ttl,
+            bloom_capacity=config.dedup_bloom_capacity,
+            false_positive_rate=config.dedup_false_positive_rate,
+        )
+        self.sent_count = 0
+        self.received_count = 0
         self.running = False
         self.server: Optional[websockets.server.Server] = None
         
@@ -81,16 +208,18 @@ class GossipProtocol:
             self.server.close()
             await self.server.wait_closed()
             
-        for peer_ws in self.peers.values():
-            await peer_ws.close()
-            
+        peers = list(self.peers.values())
         self.peers.clear()
+        for peer in peers:
+            clear_gossip_peer_metrics(peer.peer_id)
+            await peer.close()
+            
         print("Gossip server stopped")
         
     async def _handle_connection(self, websocket: WebSocketServerProtocol, path: str):
         """Handle incoming connections from other hubs"""
         peer_id = str(uuid.uuid4())
-        self.peers[peer_id] = websocket
+        self._add_peer(peer_id, websocket)
         
         try:
             async for message in websocket:
@@ -98,9 +227,24 @@ class GossipProtocol:
         except ConnectionClosed:
             pass
         finally:
-            del self.peers[peer_id]
+            self._drop_peer(peer_id)
             print(f"Disconnected from peer: {peer_id}")
             
+    def _add_peer(self, peer_id: str, websocket: WebSocketServerProtocol) -> PeerConnection:
+        """Register a connected peer and start its writer task"""
+        peer = PeerConnection(peer_id, websocket, self.config, self._drop_peer)
+        peer.start()
+        self.peers[peer_id] = peer
+        return peer
+        
+    def _drop_peer(self, peer_id: str):
+        """Forget a peer and close its connection in the background (idempotent)"""
+        peer = self.peers.pop(peer_id, None)
+        if peer is None:
+            return
+        clear_gossip_peer_metrics(peer_id)
+        asyncio.get_running_loop().create_task(peer.close())
+            
     async def _handle_message(self, peer_id: str, raw_message: str):
         """Handle incoming gossip messages"""
         try:
@@ -108,17 +252,17 @@ class GossipProtocol:
             message = GossipMessage(**message_data)
             
             # Ignore messages we've already seen
-            if message.message_id in self.received_messages:
+            if self.seen_messages.check_and_add(message.message_id):
                 return
                 
-            self.received_messages.add(message.message_id)
+            self.received_count += 1
             
             # Process the message
             await self._process_message(message)
             
             # Propagate to other peers if TTL > 0
             if message.ttl > 0:
-                await self._propagate_message(message)
+                await self._propagate_message(message, exclude=peer_id)
                 
         except Exception as e:
             print(f"Error processing message from {peer_id}: {e}")
@@ -192,8 +336,8 @@ class GossipProtocol:
         """Handle health check messages"""
         print(f"Health check from {message.source_hub}: {message.data['status']}")
         
-    async def _propagate_message(self, message: GossipMessage):
-        """Propagate message to all connected peers"""
+    async def _propagate_message(self, message: GossipMessage, exclude: Optional[str] = None):
+        """Queue message for every connected peer except the one it came from"""
         # Create new message with TTL decremented
         propagate_message = GossipMessage(
             message_id=message.message_id,
@@ -207,13 +351,15 @@ class GossipProtocol:
         # Serialize message
         serialized = json.dumps(propagate_message.__dict__)
         
-        # Send to all connected peers except the source
-        for peer_id, peer_ws in list(self.peers.items()):
-            try:
-                await peer_ws.send(serialized)
-            except Exception as e:
-                print(f"Error sending to peer {peer_id}: {e}")
-                del self.peers[peer_id]
+        # Enqueue without blocking; each peer's writer task does the sending
+        overflowed = [
+            peer_id
+            for peer_id, peer in self.peers.items()
+            if peer_id != exclude and not peer.enqueue(serialized)
+        ]
+        for peer_id in overflowed:
+            print(f"Outbound queue full for peer {peer_id}; disconnecting")
+            self._drop_peer(peer_id)
                 
     async def broadcast(self, message_type: MessageType, data: dict):
         """Broadcast a message to all peers"""
@@ -226,7 +372,8 @@ class GossipProtocol:
             ttl=5
         )
         
-        self.sent_messages.add(message.message_id)
+        self.seen_messages.add(message.message_id)
+        self.sent_count += 1
         await self._propagate_message(message)
         
     async def _periodic_peer_discovery(self):
@@ -266,7 +413,7 @@ class GossipProtocol:
             websocket = await websockets.connect(uri)
             
             peer_id = str(uuid.uuid4())
-            self.peers[peer_id] = websocket
+            self._add_peer(peer_id, websocket)
             
             # Send initial discovery message
             await self.broadcast(
@@ -295,8 +442,7 @@ class GossipProtocol:
         except Exception as e:
             print(f"Error in peer connection {peer_id}: {e}")
         finally:
-            if peer_id in self.peers:
-                del self.peers[peer_id]
+            self._drop_peer(peer_id)
                 
     def get_status(self) -> dict:
         """Get current gossip protocol status"""
@@ -307,8 +453,10 @@ class GossipProtocol:
             "running": self.running,
             "active_peers": len(self.peers),
             "known_peers": list(self.known_peers),
-            "sent_messages": len(self.sent_messages),
-            "received_messages": len(self.received_messages),
+            "sent_messages": self.sent_count,
+            "received_messages": self.received_count,
+            "dedup": self.seen_messages.stats(),
+            "peer_queues": {peer_id: peer.status() for peer_id, peer in self.peers.items()},
             "config": {
                 "max_peers": self.config.max_peers,
                 "gossip_interval": self.config.gossip_interval,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict, List
 
 from .models import ValidatorIdentity, ValidatorRegistrationRequest, ValidatorResponse
 
@@ -15,6 +15,13 @@ class IdentityService:
 
     def __init__(self) -> None:
         self._validators: Dict[str, ValidatorIdentity] = {}
+        self._listeners: List[Callable[[ValidatorIdentity], None]] = []
+
+    def add_listener(self, listener: Callable[[ValidatorIdentity], None]) -> None:
+        """
+        Register a callback invoked after a validator is registered or deactivated.
+        """
+        self._listeners.append(listener)
 
     def register_validator(self, req: ValidatorRegistrationRequest) -> ValidatorResponse:
         identity = ValidatorIdentity.new(
@@ -24,14 +31,38 @@ class IdentityService:
             domain_focus=req.domain_focus,
         )
         self._validators[str(identity.id)] = identity
+        self._notify(identity)
         return ValidatorResponse(**identity.to_dict())
 
+    def deactivate_validator(self, validator_id: str) -> bool:
+        """
+        Mark a validator inactive and notify listeners.
+        """
+        identity = self._validators.get(validator_id)
+        if not identity or not identity.is_active:
+            return False
+        identity.is_active = False
+        self._notify(identity)
+        return True
+
     def get_validator(self, validator_id: str) -> ValidatorResponse | None:
         identity = self._validators.get(validator_id)
         if not identity:
             return None
         return ValidatorResponse(**identity.to_dict())
 
+    def list_validators(self) -> List[ValidatorResponse]:
+        """
+        Return all active validators in registration order.
+        """
+        return [ValidatorResponse(**v.to_dict()) for v in self._validators.values() if v.is_active]
+
+    def active_identities(self) -> List[ValidatorIdentity]:
+        """
+        Return the records of all active validators in registration order.
+        """
+        return [v for v in self._validators.values() if v.is_active]
+
     def get_public_key(self, validator_id: str) -> str | None:
         """
         Return the raw public key string for a validator, if known.
@@ -41,4 +72,6 @@ class IdentityService:
             return None
         return identity.public_key
 
-
+    def _notify(self, identity: ValidatorIdentity) -> None:
+        for listener in self._listeners:
+            listener(identity)
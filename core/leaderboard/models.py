@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import uuid
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class LeaderboardEntry(BaseModel):
+    validator_id: uuid.UUID
+    rank: int
+    value: float
+
+
+class LeaderboardResponse(BaseModel):
+    board: str
+    size: int
+    entries: List[LeaderboardEntry]
+    top_share: Optional[float] = Field(
+        default=None, description="Share of total stake or influence held by the listed validators."
+    )
+
+
+class LeaderboardRankResponse(BaseModel):
+    board: str
+    size: int
+    validator_id: uuid.UUID
+    rank: int
+    value: float
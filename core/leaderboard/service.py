@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import math
+import uuid
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, List, Literal, Optional, Tuple
+
+from core.reputation.models import ReputationState
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeState
+from core.stake.service import StakeManager
+
+
+BoardName = Literal["reputation", "stake", "influence"]
+
+_Entry = Tuple[float, uuid.UUID]
+
+# Stake board keys are scaled by at most 2**this before the epoch is moved.
+_MAX_STAKE_EXPONENT = 256.0
+
+
+class Leaderboard:
+    """
+    Ranked set of validators keyed by a float, highest first.
+
+    Entries are kept as ``(-key, validator_id)`` in a list of sorted
+    sublists of at most ``2 * load`` entries, with a Fenwick tree over the
+    sublist lengths. Updates, removals and rank lookups cost O(log n) for the
+    searches plus an O(load) list shift; ``top(k)`` walks the first k
+    entries.
+    """
+
+    def __init__(self, load: int = 256) -> None:
+        self._load = load
+        self._lists: List[List[_Entry]] = []
+        self._maxes: List[_Entry] = []
+        self._tree: List[int] = []
+        self._entries: Dict[uuid.UUID, _Entry] = {}
+        self._total = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, validator_id: uuid.UUID) -> bool:
+        return validator_id in self._entries
+
+    @property
+    def total(self) -> float:
+        """Sum of all keys."""
+        return self._total
+
+    def key(self, validator_id: uuid.UUID) -> Optional[float]:
+        entry = self._entries.get(validator_id)
+        return -entry[0] if entry is not None else None
+
+    def update(self, validator_id: uuid.UUID, key: float) -> None:
+        entry = self._entries.get(validator_id)
+        if entry is not None:
+            if entry[0] == -key:
+                return
+            self._discard(entry)
+        entry = (-key, validator_id)
+        self._entries[validator_id] = entry
+        self._total += key
+        self._insert(entry)
+
+    def remove(self, validator_id: uuid.UUID) -> None:
+        entry = self._entries.get(validator_id)
+        if entry is not None:
+            self._discard(entry)
+
+    def top(self, k: int) -> List[Tuple[uuid.UUID, float]]:
+        result: List[Tuple[uuid.UUID, float]] = []
+        for sub in self._lists:
+            for neg_key, validator_id in sub:
+                if len(result) >= k:
+                    return result
+                result.append((validator_id, -neg_key))
+        return result
+
+    def rescale(self, factor: float) -> None:
+        """Multiply every key by ``factor`` (> 0), which preserves the order."""
+        self._lists = [[(neg_key * factor, vid) for neg_key, vid in sub] for sub in self._lists]
+        self._maxes = [sub[-1] for sub in self._lists]
+        self._entries = {entry[1]: entry for sub in self._lists for entry in sub}
+        self._total *= factor
+
+    def rank(self, validator_id: uuid.UUID) -> Optional[int]:
+        """1-based rank, or None for validators not on the board."""
+        entry = self._entries.get(validator_id)
+        if entry is None:
+            return None
+        i = bisect_left(self._maxes, entry)
+        return self._prefix(i) + bisect_left(self._lists[i], entry) + 1
+
+    # ---- Internals ----
+
+    def _insert(self, entry: _Entry) -> None:
+        if not self._lists:
+            self._lists.append([entry])
+            self._maxes.append(entry)
+            self._rebuild_tree()
+            return
+        i = bisect_left(self._maxes, entry)
+        if i == len(self._maxes):
+            i -= 1
+        sub = self._lists[i]
+        insort(sub, entry)
+        self._maxes[i] = sub[-1]
+        if len(sub) > 2 * self._load:
+            self._lists[i : i + 1] = [sub[: self._load], sub[self._load :]]
+            self._maxes[i : i + 1] = [sub[self._load - 1], sub[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(i, 1)
+
+    def _discard(self, entry: _Entry) -> None:
+        del self._entries[entry[1]]
+        self._total += entry[0]
+        i = bisect_left(self._maxes, entry)
+        sub = self._lists[i]
+        del sub[bisect_left(sub, entry)]
+        if sub:
+            self._maxes[i] = sub[-1]
+            self._tree_add(i, -1)
+        else:
+            del self._lists[i]
+            del self._maxes[i]
+            self._rebuild_tree()
+
+    def _rebuild_tree(self) -> None:
+        tree = [len(sub) for sub in self._lists]
+        for i in range(len(tree)):
+            parent = i | (i + 1)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, i: int, delta: int) -> None:
+        tree = self._tree
+        while i < len(tree):
+            tree[i] += delta
+            i |= i + 1
+
+    def _prefix(self, end: int) -> int:
+        """Number of entries in sublists before ``end``."""
+        total = 0
+        i = end - 1
+        while i >= 0:
+            total += self._tree[i]
+            i = (i & (i + 1)) - 1
+        return total
+
+
+class LeaderboardService:
+    """
+    Incrementally maintained reputation, effective-stake and influence boards.
+
+    The reputation and stake boards follow ``ReputationEngine`` and
+    ``StakeManager`` through their listeners. Reputation decays toward
+    ``min_score`` at the same rate for everyone, so validators are ranked by
+    ``log(score - min_score) + rate * last_update_days``, which orders
+    validators exactly as their current decayed scores do without re-keying
+    anyone as time passes. Effective stake likewise halves at one rate, so
+    the stake board holds stake scaled to a common epoch,
+    ``effective_stake * 2 ** ((last_updated - epoch) / half_life)``, which
+    keeps both the order and ``top_share`` exact (up to the 1.0 stake floor)
+    as stake decays. Influence is pushed by ``ValidationSessionService``
+    whenever it recomputes a validator's weight.
+    """
+
+    def __init__(self, reputation: ReputationEngine, stake: StakeManager, *, load: int = 256) -> None:
+        self._reputation = reputation
+        self._stake = stake
+        self._boards: Dict[str, Leaderboard] = {
+            "reputation": Leaderboard(load),
+            "stake": Leaderboard(load),
+            "influence": Leaderboard(load),
+        }
+        self._stake_epoch: Optional[float] = None
+        reputation.add_listener(self.on_reputation_change)
+        stake.add_listener(self.on_stake_change)
+
+    def board(self, name: BoardName) -> Leaderboard:
+        try:
+            return self._boards[name]
+        except KeyError:
+            raise ValueError(f"unknown leaderboard {name!r}; expected one of {sorted(self._boards)}") from None
+
+    def on_reputation_change(self, state: ReputationState) -> None:
+        # Validators at the floor tie at the bottom instead of taking log(0).
+        excess = max(state.score - self._reputation.min_score, 1e-300)
+        key = math.log(excess) + self._reputation.decay_rate_per_day * state.last_updated.timestamp() / 86400.0
+        self._boards["reputation"].update(state.validator_id, key)
+
+    def on_stake_change(self, state: StakeState) -> None:
+        anchor = state.last_updated.timestamp()
+        if self._stake_epoch is None:
+            self._stake_epoch = anchor
+        exponent = (anchor - self._stake_epoch) / self._stake.half_life_seconds
+        if exponent > _MAX_STAKE_EXPONENT:
+            # Move the epoch forward before scaled keys overflow.
+            self._boards["stake"].rescale(2.0**-exponent)
+            self._stake_epoch = anchor
+            exponent = 0.0
+        self._boards["stake"].update(state.validator_id, state.effective_stake * 2.0**exponent)
+
+    def record_influence(self, validator_id: uuid.UUID, influence: float) -> None:
+        self._boards["influence"].update(validator_id, influence)
+
+    def value(self, name: BoardName, validator_id: uuid.UUID, now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Current value behind a validator's position (decayed score for reputation).
+        """
+        board = self.board(name)
+        if validator_id not in board:
+            return None
+        if name == "reputation":
+            return self._reputation.score(validator_id, now)
+        if name == "stake":
+            return self._stake.effective_stake(validator_id, now)
+        return board.key(validator_id)
+
+    def top(self, name: BoardName, k: int, now: Optional[datetime] = None) -> List[Tuple[uuid.UUID, float]]:
+        board = self.board(name)
+        if name == "reputation":
+            return [(vid, self._reputation.score(vid, now)) for vid, _ in board.top(k)]
+        if name == "stake":
+            return [(vid, self._stake.effective_stake(vid, now)) for vid, _ in board.top(k)]
+        return board.top(k)
+
+    def rank(self, name: BoardName, validator_id: uuid.UUID) -> Optional[int]:
+        return self.board(name).rank(validator_id)
+
+    def top_share(self, name: BoardName, k: int) -> Optional[float]:
+        """
+        Fraction of total stake or influence held by the top ``k`` validators.
+        """
+        if name == "reputation":
+            return None
+        board = self.board(name)
+        if board.total <= 0:
+            return 0.0
+        return sum(value for _, value in board.top(k)) / board.total
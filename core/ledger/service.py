@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .models import Claim, ClaimCreateRequest, ClaimResponse, LedgerEntry, hash_claim
 
@@ -57,6 +57,10 @@ class LedgerService:
             return None
         return ClaimResponse(**claim.__dict__)
 
+    def claim_domain(self, claim_id: uuid.UUID) -> Optional[str]:
+        claim = self._claims.get(claim_id)
+        return claim.domain if claim else None
+
     def apply_consensus(
         self,
         claim_id: uuid.UUID,
@@ -67,6 +71,29 @@ class LedgerService:
         Record a consensus outcome for a claim by creating a new version and
         appending a ledger entry. The latest version is kept in _claims.
         """
+        updated = self._append_consensus_version(claim_id, outcome, confidence)
+        if updated is None:
+            return None
+        self._recompute_merkle_root()
+        return ClaimResponse(**updated.__dict__)
+
+    def apply_consensus_batch(self, outcomes: Iterable[Tuple[uuid.UUID, str, float]]) -> int:
+        """
+        Record many consensus outcomes at once.
+
+        Each (claim_id, outcome, confidence) appends a new claim version as in
+        apply_consensus, but the Merkle root is recomputed only once for the
+        whole batch. Returns the number of claims updated.
+        """
+        updated = 0
+        for claim_id, outcome, confidence in outcomes:
+            if self._append_consensus_version(claim_id, outcome, confidence) is not None:
+                updated += 1
+        if updated:
+            self._recompute_merkle_root()
+        return updated
+
+    def _append_consensus_version(self, claim_id: uuid.UUID, outcome: str, confidence: float) -> Optional[Claim]:
         existing = self._claims.get(claim_id)
         if existing is None:
             return None
@@ -87,8 +114,7 @@ class LedgerService:
 
         self._claims[claim_id] = updated
         self._append_ledger_entry(updated)
-        self._recompute_merkle_root()
-        return ClaimResponse(**updated.__dict__)
+        return updated
 
     # ---- Ledger & Merkle tree ----
 
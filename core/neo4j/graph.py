@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from neo4j import Driver, RoutingControl
+
+
+@dataclass
+class CoVoteEdge:
+    a: str
+    b: str
+    co_votes: int
+    agreements: int
+    updated_at: str
+
+
+class InMemoryGraphBackend:
+    """
+    Local correlation graph with the same interface as ``Neo4jGraphBackend``.
+
+    Used by tests and by nodes running without a Neo4j server.
+    """
+
+    def __init__(self) -> None:
+        self._validators: Dict[str, Dict[str, Any]] = {}
+        self._edges: Dict[Tuple[str, str], CoVoteEdge] = {}
+        self._adjacency: Dict[str, Dict[str, None]] = {}
+
+    def ensure_schema(self) -> None:
+        return None
+
+    def write_validators(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            self._validators.setdefault(row["id"], {}).update(row)
+
+    def write_co_votes(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            a, b = row["a"], row["b"]
+            for validator_id in (a, b):
+                self._validators.setdefault(validator_id, {"id": validator_id})
+            edge = self._edges.get((a, b))
+            if edge is None:
+                edge = self._edges[(a, b)] = CoVoteEdge(a, b, 0, 0, row["updated_at"])
+                self._adjacency.setdefault(a, {})[b] = None
+                self._adjacency.setdefault(b, {})[a] = None
+            edge.co_votes += row["co_votes"]
+            edge.agreements += row["agreements"]
+            edge.updated_at = row["updated_at"]
+
+    def validator(self, validator_id: str) -> Optional[Dict[str, Any]]:
+        row = self._validators.get(validator_id)
+        return dict(row) if row is not None else None
+
+    def pair(self, a: str, b: str) -> Optional[CoVoteEdge]:
+        return self._edges.get((a, b) if a <= b else (b, a))
+
+    def co_voters(self, validator_id: str, limit: int = 10) -> List[CoVoteEdge]:
+        edges = [self.pair(validator_id, partner) for partner in self._adjacency.get(validator_id, ())]
+        edges.sort(key=lambda edge: edge.co_votes, reverse=True)
+        return edges[:limit]
+
+    def counts(self) -> Tuple[int, int]:
+        return len(self._validators), len(self._edges)
+
+
+_SCHEMA = "CREATE CONSTRAINT validator_id IF NOT EXISTS FOR (v:Validator) REQUIRE v.id IS UNIQUE"
+
+_WRITE_VALIDATORS = """
+UNWIND $rows AS row
+MERGE (v:Validator {id: row.id})
+SET v += row
+"""
+
+# Pairs are written with a <= b, so each edge is stored once, directed a -> b.
+_WRITE_CO_VOTES = """
+UNWIND $rows AS row
+MERGE (a:Validator {id: row.a})
+MERGE (b:Validator {id: row.b})
+MERGE (a)-[r:CO_VOTED]->(b)
+ON CREATE SET r.co_votes = 0, r.agreements = 0
+SET r.co_votes = r.co_votes + row.co_votes,
+    r.agreements = r.agreements + row.agreements,
+    r.updated_at = row.updated_at
+"""
+
+_VALIDATOR = "MATCH (v:Validator {id: $id}) RETURN properties(v) AS v"
+
+_PAIR = """
+MATCH (:Validator {id: $a})-[r:CO_VOTED]->(:Validator {id: $b})
+RETURN $a AS a, $b AS b, r.co_votes AS co_votes, r.agreements AS agreements, r.updated_at AS updated_at
+"""
+
+_CO_VOTERS = """
+MATCH (v:Validator {id: $id})-[r:CO_VOTED]-(p:Validator)
+WITH v, p, r ORDER BY r.co_votes DESC LIMIT $limit
+RETURN CASE WHEN v.id <= p.id THEN v.id ELSE p.id END AS a,
+       CASE WHEN v.id <= p.id THEN p.id ELSE v.id END AS b,
+       r.co_votes AS co_votes, r.agreements AS agreements, r.updated_at AS updated_at
+"""
+
+_COUNTS = """
+MATCH (v:Validator) WITH count(v) AS nodes
+OPTIONAL MATCH ()-[r:CO_VOTED]->() RETURN nodes, count(r) AS edges
+"""
+
+
+class Neo4jGraphBackend:
+    """
+    Correlation graph stored in Neo4j.
+
+    ``Validator`` nodes are keyed by id and ``CO_VOTED`` relationships carry
+    co-vote and agreement counts. Every write is a single ``UNWIND`` query
+    over a batch of rows; ``driver.execute_query`` retries transient errors.
+    """
+
+    def __init__(self, driver: Driver, *, database: Optional[str] = None) -> None:
+        self._driver = driver
+        self._database = database
+
+    def _run(self, query: str, routing: RoutingControl = RoutingControl.READ, **parameters: Any):
+        return self._driver.execute_query(
+            query, parameters_=parameters, routing_=routing, database_=self._database
+        ).records
+
+    def ensure_schema(self) -> None:
+        self._run(_SCHEMA, RoutingControl.WRITE)
+
+    def write_validators(self, rows: List[Dict[str, Any]]) -> None:
+        self._run(_WRITE_VALIDATORS, RoutingControl.WRITE, rows=rows)
+
+    def write_co_votes(self, rows: List[Dict[str, Any]]) -> None:
+        self._run(_WRITE_CO_VOTES, RoutingControl.WRITE, rows=rows)
+
+    def validator(self, validator_id: str) -> Optional[Dict[str, Any]]:
+        records = self._run(_VALIDATOR, id=validator_id)
+        return dict(records[0]["v"]) if records else None
+
+    def pair(self, a: str, b: str) -> Optional[CoVoteEdge]:
+        a, b = (a, b) if a <= b else (b, a)
+        records = self._run(_PAIR, a=a, b=b)
+        return CoVoteEdge(**records[0].data()) if records else None
+
+    def co_voters(self, validator_id: str, limit: int = 10) -> List[CoVoteEdge]:
+        return [CoVoteEdge(**record.data()) for record in self._run(_CO_VOTERS, id=validator_id, limit=limit)]
+
+    def counts(self) -> Tuple[int, int]:
+        record = self._run(_COUNTS)[0]
+        return record["nodes"], record["edges"]
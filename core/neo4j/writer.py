@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import uuid
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from core.identity.models import ValidatorIdentity
+
+from .graph import InMemoryGraphBackend, Neo4jGraphBackend
+
+
+logger = logging.getLogger(__name__)
+
+GraphBackend = Union[InMemoryGraphBackend, Neo4jGraphBackend]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class CorrelationGraphWriter:
+    """
+    Buffered writer for the validator correlation graph.
+
+    Validator upserts and co-vote pairs (from ``VoteCorrelationEngine``
+    listeners) are buffered in memory; repeated pairs are coalesced into one
+    row with summed counts, so the graph sees one write per distinct pair per
+    flush. A background task flushes every ``flush_interval`` seconds, or as
+    soon as ``max_pending`` rows are buffered, in ``UNWIND`` batches of at
+    most ``batch_size`` rows; the backend schema is ensured before the first
+    one. A failed batch is merged back into the buffer
+    and retried with exponential backoff (``retry_backoff`` doubling up to
+    ``max_backoff`` seconds), so counts are neither lost nor double-counted.
+    """
+
+    def __init__(
+        self,
+        backend: GraphBackend,
+        *,
+        flush_interval: float = 1.0,
+        batch_size: int = 5_000,
+        max_pending: int = 50_000,
+        retry_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        # Insertion-ordered so the oldest changes are flushed first.
+        self._validators: Dict[str, Dict[str, Any]] = {}
+        self._co_votes: Dict[Tuple[uuid.UUID, uuid.UUID], List[Any]] = {}  # (a, b) -> [co_votes, agreements, updated_at]
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    # ---- Buffering ----
+
+    def record_validator(self, validator: ValidatorIdentity) -> None:
+        """
+        IdentityService listener.
+        """
+        row = {
+            "id": str(validator.id),
+            "model_family": validator.model_family,
+            "region": validator.region,
+            "domain_focus": validator.domain_focus,
+            "is_active": validator.is_active,
+        }
+        with self._lock:
+            self._validators[row["id"]] = row
+        self._maybe_wake()
+
+    def record_co_vote(self, a: uuid.UUID, b: uuid.UUID, agreed: bool) -> None:
+        """
+        VoteCorrelationEngine listener.
+        """
+        # UUID order matches the order of their string forms.
+        key = (a, b) if a.int <= b.int else (b, a)
+        now = self._clock()
+        with self._lock:
+            entry = self._co_votes.get(key)
+            if entry is None:
+                self._co_votes[key] = [1, 1 if agreed else 0, now]
+            else:
+                entry[0] += 1
+                entry[1] += 1 if agreed else 0
+                entry[2] = now
+        self._maybe_wake()
+
+    def _maybe_wake(self) -> None:
+        if self._wakeup is not None and self.pending() >= self.max_pending:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def pending(self) -> int:
+        return len(self._validators) + len(self._co_votes)
+
+    # ---- Flushing ----
+
+    def flush(self) -> int:
+        """
+        Write one batch of validators and one of co-vote edges; returns rows written.
+        """
+        with self._lock:
+            validator_keys = list(islice(self._validators, self.batch_size))
+            validators = [self._validators.pop(key) for key in validator_keys]
+            edge_keys = list(islice(self._co_votes, self.batch_size))
+            edges = [(key, self._co_votes.pop(key)) for key in edge_keys]
+        if not validators and not edges:
+            return 0
+
+        written = 0
+        try:
+            if not self._schema_ready:
+                self.backend.ensure_schema()
+                self._schema_ready = True
+            if validators:
+                self.backend.write_validators(validators)
+                written += len(validators)
+                validators = []
+            if edges:
+                self.backend.write_co_votes(
+                    [
+                        {
+                            "a": str(a),
+                            "b": str(b),
+                            "co_votes": co_votes,
+                            "agreements": agreements,
+                            "updated_at": updated_at.isoformat(),
+                        }
+                        for (a, b), (co_votes, agreements, updated_at) in edges
+                    ]
+                )
+                written += len(edges)
+        except Exception:
+            self._requeue(validators, edges)
+            raise
+        return written
+
+    def _requeue(
+        self, validators: List[Dict[str, Any]], edges: List[Tuple[Tuple[uuid.UUID, uuid.UUID], List[Any]]]
+    ) -> None:
+        with self._lock:
+            for row in validators:
+                # A newer upsert buffered meanwhile wins.
+                self._validators.setdefault(row["id"], row)
+            for key, (co_votes, agreements, updated_at) in edges:
+                entry = self._co_votes.get(key)
+                if entry is None:
+                    self._co_votes[key] = [co_votes, agreements, updated_at]
+                else:
+                    entry[0] += co_votes
+                    entry[1] += agreements
+
+    def flush_all(self) -> int:
+        written = 0
+        while self.pending():
+            written += self.flush()
+        return written
+
+    # ---- Background task ----
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        backoff = 0.0
+        while True:
+            if backoff:
+                # Back off even if the buffer fills up meanwhile.
+                await asyncio.sleep(backoff)
+            else:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            self._wakeup.clear()
+            while self.pending():
+                try:
+                    await loop.run_in_executor(None, self.flush)
+                except Exception:
+                    backoff = min(self.max_backoff, backoff * 2 if backoff else self.retry_backoff)
+                    logger.exception("correlation graph flush failed; retrying in %.1fs", backoff)
+                    break
+                backoff = 0.0
+                if self.pending() < self.max_pending:
+                    break
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = self._loop.create_task(self.run())
+
+    async def stop(self) -> None:
+        """
+        Stop the background task and try once to flush everything still pending.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._wakeup = None
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self.flush_all)
+        except Exception:
+            logger.exception("final correlation graph flush failed; %d rows dropped", self.pending())
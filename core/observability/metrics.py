@@ -6,7 +6,7 @@ from prometheus_client import Counter, Gauge, Histogram, Summary
 from prometheus_client import start_http_server
 import time
 from functools import wraps
-from typing import Callable, TypeVar, Any
+from typing import Callable, Iterable, Tuple, TypeVar, Any
 
 # Metrics registry configuration
 REGISTRY_PORT = 8001
@@ -83,6 +83,34 @@ CONSENSUS_CONFIDENCE = Histogram(
     buckets=[0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
 )
 
+CONSENSUS_QUEUE_DEPTH = Gauge(
+    'open_epistemic_consensus_queue_depth',
+    'Number of claims with pending votes awaiting consensus evaluation'
+)
+
+CONSENSUS_EVALUATION_LATENCY = Histogram(
+    'open_epistemic_consensus_evaluation_seconds',
+    'Latency of a single scheduled consensus evaluation',
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0]
+)
+
+CONSENSUS_BATCH_SIZE = Histogram(
+    'open_epistemic_consensus_batch_size',
+    'Number of claims evaluated per scheduler tick',
+    buckets=[1, 5, 10, 25, 50, 100, 250, 500]
+)
+
+CONSENSUS_REQUESTS = Counter(
+    'open_epistemic_consensus_requests_total',
+    'Consensus endpoint requests by how they were served (cached, computed)',
+    ['result']
+)
+
+CONSENSUS_VOTES_SAVED = Counter(
+    'open_epistemic_consensus_votes_saved_total',
+    'Votes not needed to finalize consensus (sequential early stopping)'
+)
+
 # Stake and reputation metrics
 STAKED_AMOUNT = Gauge(
     'open_epistemic_staked_amount',
@@ -102,6 +130,71 @@ SLASHING_COUNT = Counter(
     ['reason']
 )
 
+STAKE_LOCKS_EXPIRED = Counter(
+    'open_epistemic_stake_locks_expired_total',
+    'Total number of stake locks released on expiry'
+)
+
+STAKE_RELEASED = Counter(
+    'open_epistemic_stake_released_total',
+    'Total amount of stake released by expired locks'
+)
+
+STAKE_ACTIVE_LOCKS = Gauge(
+    'open_epistemic_stake_active_locks',
+    'Number of stake locks that have not yet expired'
+)
+
+# Population metrics (labelled by group, never by validator)
+POPULATION_VALIDATORS = Gauge(
+    'open_epistemic_population_validators',
+    'Active validators per region, model family or domain',
+    ['dimension', 'group']
+)
+
+POPULATION_STAKE_SHARE = Gauge(
+    'open_epistemic_population_stake_share',
+    'Share of total effective stake held per region, model family or domain',
+    ['dimension', 'group']
+)
+
+POPULATION_INFLUENCE_SHARE = Gauge(
+    'open_epistemic_population_influence_share',
+    'Share of total influence held per region, model family or domain',
+    ['dimension', 'group']
+)
+
+# Gossip metrics
+GOSSIP_DEDUP_HITS = Counter(
+    'open_epistemic_gossip_dedup_hits_total',
+    'Gossip messages dropped as already seen, by cache tier',
+    ['tier']
+)
+
+GOSSIP_DEDUP_EVICTIONS = Counter(
+    'open_epistemic_gossip_dedup_evictions_total',
+    'Message ids evicted from the gossip seen-message cache',
+    ['reason']
+)
+
+GOSSIP_PEER_QUEUE_DEPTH = Gauge(
+    'open_epistemic_gossip_peer_queue_depth',
+    'Messages waiting in a peer\'s outbound gossip queue',
+    ['peer_id']
+)
+
+GOSSIP_PEER_LAG = Gauge(
+    'open_epistemic_gossip_peer_lag_seconds',
+    'Time the last message sent to a peer spent in its outbound queue',
+    ['peer_id']
+)
+
+GOSSIP_PEER_DROPS = Counter(
+    'open_epistemic_gossip_peer_drops_total',
+    'Outbound gossip queue overflows, by overflow policy',
+    ['policy']
+)
+
 # Validation session metrics
 VALIDATION_SESSIONS = Gauge(
     'open_epistemic_validation_sessions',
@@ -183,6 +276,27 @@ def record_consensus(outcome: str, rounds: int, confidence: float):
     CONSENSUS_ROUNDS.observe(rounds)
     CONSENSUS_CONFIDENCE.observe(confidence)
 
+def update_consensus_queue_depth(depth: int):
+    """Update the consensus scheduler queue depth"""
+    CONSENSUS_QUEUE_DEPTH.set(depth)
+
+def record_consensus_evaluation(duration: float):
+    """Record the latency of one scheduled consensus evaluation"""
+    CONSENSUS_EVALUATION_LATENCY.observe(duration)
+
+def record_consensus_batch(size: int):
+    """Record the number of claims evaluated in one scheduler tick"""
+    CONSENSUS_BATCH_SIZE.observe(size)
+
+def record_consensus_request(result: str):
+    """Record how a consensus request was served"""
+    CONSENSUS_REQUESTS.labels(result=result).inc()
+
+def record_consensus_votes_saved(count: int):
+    """Record votes a finalized consensus did not need"""
+    if count > 0:
+        CONSENSUS_VOTES_SAVED.inc(count)
+
 def record_slashing(validator_id: str, amount: float, reason: str):
     """Record slashing metrics"""
     SLASHING_COUNT.labels(reason=reason).inc()
@@ -193,4 +307,61 @@ def update_validator_metrics(validator_id: str, influence: float, stake: float,
     """Update validator metrics"""
     VALIDATOR_INFLUENCE.labels(validator_id=validator_id).set(influence)
     STAKED_AMOUNT.labels(validator_id=validator_id).set(stake)
-    REPUTATION_SCORE.labels(validator_id=validator_id).set(reputation)
\ No newline at end of file
+    REPUTATION_SCORE.labels(validator_id=validator_id).set(reputation)
+
+def record_slashing_batch(count: int, reason: str):
+    """Record many slashing events with the same reason"""
+    if count:
+        SLASHING_COUNT.labels(reason=reason).inc(count)
+
+def record_lock_expiries(count: int, amount: float):
+    """Record stake locks released on expiry"""
+    if count:
+        STAKE_LOCKS_EXPIRED.inc(count)
+        STAKE_RELEASED.inc(amount)
+
+def update_active_stake_locks(count: int):
+    """Update the number of unexpired stake locks"""
+    STAKE_ACTIVE_LOCKS.set(count)
+
+def update_population_metrics(rows: Iterable[Tuple[str, str, int, float, float]]):
+    """Update population gauges from (dimension, group, validators, stake_share, influence_share) rows"""
+    for dimension, group, validators, stake_share, influence_share in rows:
+        POPULATION_VALIDATORS.labels(dimension=dimension, group=group).set(validators)
+        POPULATION_STAKE_SHARE.labels(dimension=dimension, group=group).set(stake_share)
+        POPULATION_INFLUENCE_SHARE.labels(dimension=dimension, group=group).set(influence_share)
+
+def update_validator_metrics_batch(rows: Iterable[Tuple[str, float, float, float]]):
+    """Update validator metrics from (validator_id, influence, stake, reputation) rows"""
+    for validator_id, influence, stake, reputation in rows:
+        update_validator_metrics(validator_id, influence, stake, reputation)
+
+def record_gossip_dedup_hit(tier: str):
+    """Record a duplicate gossip message caught by the seen-message cache"""
+    GOSSIP_DEDUP_HITS.labels(tier=tier).inc()
+
+def record_gossip_dedup_evictions(reason: str, count: int):
+    """Record message ids evicted from the seen-message cache"""
+    if count:
+        GOSSIP_DEDUP_EVICTIONS.labels(reason=reason).inc(count)
+
+def update_gossip_peer_queue(peer_id: str, depth: int):
+    """Update a peer's outbound queue depth"""
+    GOSSIP_PEER_QUEUE_DEPTH.labels(peer_id=peer_id).set(depth)
+
+def record_gossip_peer_send(peer_id: str, lag: float, depth: int):
+    """Record a message delivered to a peer after waiting ``lag`` seconds in its queue"""
+    GOSSIP_PEER_LAG.labels(peer_id=peer_id).set(lag)
+    GOSSIP_PEER_QUEUE_DEPTH.labels(peer_id=peer_id).set(depth)
+
+def record_gossip_peer_drop(policy: str):
+    """Record an outbound queue overflow handled with ``policy``"""
+    GOSSIP_PEER_DROPS.labels(policy=policy).inc()
+
+def clear_gossip_peer_metrics(peer_id: str):
+    """Remove the per-peer series of a disconnected peer"""
+    for gauge in (GOSSIP_PEER_QUEUE_DEPTH, GOSSIP_PEER_LAG):
+        try:
+            gauge.remove(peer_id)
+        except KeyError:
+            pass
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import List, Literal
+
+from pydantic import BaseModel
+
+
+Dimension = Literal["region", "model_family", "domain"]
+
+
+class PopulationGroup(BaseModel):
+    group: str
+    validators: int
+    stake: float
+    stake_share: float
+    influence: float
+    influence_share: float
+    mean_reputation: float
+
+
+class PopulationAggregatesResponse(BaseModel):
+    dimension: Dimension
+    validators: int
+    total_stake: float
+    total_influence: float
+    groups: List[PopulationGroup]
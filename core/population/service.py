@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+from core.identity.models import ValidatorIdentity
+from core.identity.service import IdentityService
+from core.observability.metrics import update_population_metrics
+from core.reputation.models import ReputationState
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeState
+from core.stake.service import StakeManager
+
+from .models import Dimension, PopulationGroup
+
+
+DIMENSIONS: Tuple[Dimension, ...] = ("region", "model_family", "domain")
+
+# Scaled sums are kept below e**this before the epoch is moved forward.
+_MAX_EXPONENT = 256.0
+
+# Metric label for groups folded together to bound series cardinality.
+OTHER_GROUP = "other"
+
+
+@dataclass
+class _Totals:
+    validators: int = 0
+    stake: float = 0.0
+    reputation_fixed: float = 0.0
+    reputation_scaled: float = 0.0
+    influence: float = 0.0
+
+    def add(self, member: "_Member", sign: int) -> None:
+        self.validators += sign
+        self.stake += sign * member.stake
+        self.reputation_fixed += sign * member.reputation_fixed
+        self.reputation_scaled += sign * member.reputation_scaled
+        self.influence += sign * member.influence
+
+
+@dataclass
+class _Member:
+    groups: Tuple[str, str, str]
+    stake: float = 0.0
+    reputation_fixed: float = 0.0
+    reputation_scaled: float = 0.0
+    influence: float = 0.0
+
+
+class PopulationAggregates:
+    """
+    Stake, reputation and influence totals per region, model family and domain.
+
+    Active validators from ``IdentityService`` are the population. Their
+    contributions are updated from the identity, stake and reputation
+    listeners, and from influence pushed by ``ValidationSessionService``;
+    each change adjusts one group per dimension, and reads cost O(groups).
+
+    Stake and reputation decay at one rate for everyone, so both are summed
+    scaled to a common epoch (stake by ``2 ** ((last_updated - epoch) /
+    half_life)``, reputation above ``min_score`` by ``exp(rate * days)``)
+    and unscaled at read time. The sums therefore stay exact as time passes
+    without touching any validator (stake's 1.0 floor aside), including
+    across ``StakeManager.apply_decay_all`` sweeps.
+
+    Gauges are republished at most every ``publish_interval`` seconds.
+    Group names come from validator registrations, so they are mapped to a
+    bounded label set first: domains outside ``metric_domains`` (when given)
+    and any group past the first ``max_metric_groups`` of its dimension are
+    reported together as ``other``. Reads are not affected.
+    """
+
+    def __init__(
+        self,
+        identity: IdentityService,
+        stake: StakeManager,
+        reputation: ReputationEngine,
+        *,
+        publish_interval: float = 5.0,
+        max_metric_groups: int = 50,
+        metric_domains: Optional[Collection[str]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._identity = identity
+        self._stake = stake
+        self._reputation = reputation
+        self.publish_interval = publish_interval
+        self.max_metric_groups = max_metric_groups
+        self.metric_domains = set(metric_domains) | {"none"} if metric_domains is not None else None
+        self._metric_labels: Dict[Dimension, Dict[str, str]] = {dim: {} for dim in DIMENSIONS}
+        self._named_labels: Dict[Dimension, int] = {dim: 0 for dim in DIMENSIONS}
+        self._clock = clock
+        self._published_at: Optional[float] = None
+        self._epoch: Optional[float] = None
+        self._members: Dict[uuid.UUID, _Member] = {}
+        self._groups: Dict[Dimension, Dict[str, _Totals]] = {dim: {} for dim in DIMENSIONS}
+        self._overall = _Totals()
+
+        for validator in identity.list_validators():
+            self._join(validator.id, (validator.region, validator.model_family, validator.domain_focus or "none"))
+        identity.add_listener(self.on_identity_change)
+        stake.add_listener(self.on_stake_change)
+        reputation.add_listener(self.on_reputation_change)
+
+    # ---- Scaling ----
+
+    def _anchor(self, ts: float) -> float:
+        if self._epoch is None:
+            self._epoch = ts
+        elif max(self._stake_exponent(ts), self._reputation_exponent(ts)) > _MAX_EXPONENT:
+            self._rebase(ts)
+        return ts - self._epoch
+
+    def _stake_exponent(self, ts: float) -> float:
+        return (ts - self._epoch) / self._stake.half_life_seconds * math.log(2.0)
+
+    def _reputation_exponent(self, ts: float) -> float:
+        return self._reputation.decay_rate_per_day * (ts - self._epoch) / 86400.0
+
+    def _rebase(self, ts: float) -> None:
+        stake_factor = math.exp(-self._stake_exponent(ts))
+        reputation_factor = math.exp(-self._reputation_exponent(ts))
+        for totals in [self._overall, *(t for groups in self._groups.values() for t in groups.values())]:
+            totals.stake *= stake_factor
+            totals.reputation_scaled *= reputation_factor
+        for member in self._members.values():
+            member.stake *= stake_factor
+            member.reputation_scaled *= reputation_factor
+        self._epoch = ts
+
+    # ---- Updates ----
+
+    def _update(self, validator_id: uuid.UUID, **values: float) -> None:
+        member = self._members.get(validator_id)
+        if member is None:
+            return
+        self._apply(member, -1)
+        for name, value in values.items():
+            setattr(member, name, value)
+        self._apply(member, +1)
+        self._maybe_publish()
+
+    def _apply(self, member: _Member, sign: int) -> None:
+        self._overall.add(member, sign)
+        for dim, group in zip(DIMENSIONS, member.groups):
+            self._groups[dim].setdefault(group, _Totals()).add(member, sign)
+
+    def _join(self, validator_id: uuid.UUID, groups: Tuple[str, str, str]) -> None:
+        member = _Member(groups=groups)
+        self._members[validator_id] = member
+        state = self._stake.get_state(validator_id)
+        if state is not None:
+            member.stake = self._scaled_stake(state)
+        member.reputation_fixed = self._reputation.initial_score
+        if validator_id in self._reputation:
+            snapshot = self._reputation.get_state(validator_id)
+            member.reputation_fixed, member.reputation_scaled = self._scaled_reputation(
+                validator_id, snapshot.last_updated
+            )
+        self._apply(member, +1)
+
+    def _scaled_stake(self, state: StakeState) -> float:
+        offset = self._anchor(state.last_updated.timestamp())
+        return state.effective_stake * 2.0 ** (offset / self._stake.half_life_seconds)
+
+    def _scaled_reputation(self, validator_id: uuid.UUID, at: datetime) -> Tuple[float, float]:
+        floor = self._reputation.min_score
+        score = self._reputation.score(validator_id, at)
+        offset = self._anchor(at.timestamp())
+        return floor, (score - floor) * math.exp(self._reputation.decay_rate_per_day * offset / 86400.0)
+
+    def on_identity_change(self, identity: ValidatorIdentity) -> None:
+        member = self._members.get(identity.id)
+        if identity.is_active and member is None:
+            self._join(identity.id, (identity.region, identity.model_family, identity.domain_focus or "none"))
+            self._maybe_publish()
+        elif not identity.is_active and member is not None:
+            self._apply(member, -1)
+            del self._members[identity.id]
+            self._maybe_publish()
+
+    def on_stake_change(self, state: StakeState) -> None:
+        if state.validator_id in self._members:
+            self._update(state.validator_id, stake=self._scaled_stake(state))
+
+    def on_reputation_change(self, state: ReputationState) -> None:
+        if state.validator_id in self._members:
+            floor = self._reputation.min_score
+            offset = self._anchor(state.last_updated.timestamp())
+            scaled = (state.score - floor) * math.exp(self._reputation.decay_rate_per_day * offset / 86400.0)
+            self._update(state.validator_id, reputation_fixed=floor, reputation_scaled=scaled)
+
+    def record_influence(self, validator_id: uuid.UUID, influence: float) -> None:
+        self._update(validator_id, influence=influence)
+
+    # ---- Reads ----
+
+    def _unscale(self, totals: _Totals, now_ts: float) -> Tuple[float, float]:
+        if self._epoch is None:
+            return totals.stake, totals.reputation_fixed
+        stake = totals.stake * math.exp(-self._stake_exponent(now_ts))
+        reputation = totals.reputation_fixed + totals.reputation_scaled * math.exp(-self._reputation_exponent(now_ts))
+        return stake, reputation
+
+    def totals(self, now: Optional[datetime] = None) -> Tuple[int, float, float]:
+        """
+        (validators, current stake, influence) over the whole population.
+        """
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        stake, _ = self._unscale(self._overall, now_ts)
+        return self._overall.validators, stake, self._overall.influence
+
+    def groups(self, dimension: Dimension, now: Optional[datetime] = None) -> List[PopulationGroup]:
+        """
+        Current per-group aggregates for one dimension, largest stake first.
+        """
+        if dimension not in self._groups:
+            raise ValueError(f"unknown dimension {dimension!r}; expected one of {list(DIMENSIONS)}")
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        total_stake, _ = self._unscale(self._overall, now_ts)
+        total_influence = self._overall.influence
+        result = []
+        for group, totals in self._groups[dimension].items():
+            if totals.validators <= 0:
+                continue
+            stake, reputation = self._unscale(totals, now_ts)
+            result.append(
+                PopulationGroup(
+                    group=group,
+                    validators=totals.validators,
+                    stake=stake,
+                    stake_share=stake / total_stake if total_stake > 0 else 0.0,
+                    influence=totals.influence,
+                    influence_share=totals.influence / total_influence if total_influence > 0 else 0.0,
+                    mean_reputation=reputation / totals.validators,
+                )
+            )
+        result.sort(key=lambda g: (-g.stake, g.group))
+        return result
+
+    # ---- Metrics ----
+
+    def _maybe_publish(self) -> None:
+        now = self._clock()
+        if self._published_at is None or now - self._published_at >= self.publish_interval:
+            self.publish_metrics()
+
+    def _metric_label(self, dim: Dimension, group: str) -> str:
+        labels = self._metric_labels[dim]
+        label = labels.get(group)
+        if label is None:
+            if dim == "domain" and self.metric_domains is not None and group not in self.metric_domains:
+                label = OTHER_GROUP
+            elif self._named_labels[dim] >= self.max_metric_groups:
+                label = OTHER_GROUP
+            else:
+                label = group
+                self._named_labels[dim] += 1
+            labels[group] = label
+        return label
+
+    def publish_metrics(self) -> None:
+        """
+        Set the per-group gauges; groups that emptied are published as zero.
+        """
+        self._published_at = self._clock()
+        now_ts = datetime.now(timezone.utc).timestamp()
+        total_stake, _ = self._unscale(self._overall, now_ts)
+        total_influence = self._overall.influence
+        rows = []
+        for dim, groups in self._groups.items():
+            labelled: Dict[str, List[float]] = {}
+            for group, totals in groups.items():
+                stake, _ = self._unscale(totals, now_ts)
+                row = labelled.setdefault(self._metric_label(dim, group), [0, 0.0, 0.0])
+                row[0] += max(totals.validators, 0)
+                row[1] += stake
+                row[2] += totals.influence
+            for label, (validators, stake, influence) in labelled.items():
+                rows.append(
+                    (
+                        dim,
+                        label,
+                        validators,
+                        stake / total_stake if total_stake > 0 else 0.0,
+                        influence / total_influence if total_influence > 0 else 0.0,
+                    )
+                )
+        update_population_metrics(rows)
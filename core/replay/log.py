@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import uuid
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+
+OUTCOME = 0
+LOCK = 1
+SLASH = 2
+RELEASE = 3
+
+# Outcome event values.
+INCORRECT = 0.0
+CORRECT = 1.0
+CORRECT_MINORITY = 2.0
+
+
+@dataclass
+class EventLog:
+    """
+    Append-only, columnar log of reputation and stake events.
+
+    One row per event: ``kinds`` (OUTCOME/LOCK/SLASH/RELEASE),
+    ``timestamps`` (POSIX seconds), ``validators`` (index into
+    ``validator_ids``) and ``values`` (the outcome code, the locked or
+    released amount, or the slashed fraction). Slash reasons are rare and
+    kept sparsely by row. Rows cost ~21 bytes, so large histories stay
+    compact and chunks pickle cheaply for workers.
+    """
+
+    kinds: array = field(default_factory=lambda: array("b"))
+    timestamps: array = field(default_factory=lambda: array("d"))
+    validators: array = field(default_factory=lambda: array("i"))
+    values: array = field(default_factory=lambda: array("d"))
+    validator_ids: List[uuid.UUID] = field(default_factory=list)
+    slash_reasons: Dict[int, str] = field(default_factory=dict)
+    _index: Dict[uuid.UUID, int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def validator_index(self, validator_id: uuid.UUID) -> int:
+        idx = self._index.get(validator_id)
+        if idx is None:
+            idx = len(self.validator_ids)
+            self._index[validator_id] = idx
+            self.validator_ids.append(validator_id)
+        return idx
+
+    def _append(self, kind: int, validator_id: uuid.UUID, ts: float, value: float) -> None:
+        self.kinds.append(kind)
+        self.timestamps.append(ts)
+        self.validators.append(self.validator_index(validator_id))
+        self.values.append(value)
+
+    def append_outcome(self, validator_id: uuid.UUID, was_correct: bool, was_minority: bool, ts: float) -> None:
+        value = (CORRECT_MINORITY if was_minority else CORRECT) if was_correct else INCORRECT
+        self._append(OUTCOME, validator_id, ts, value)
+
+    def append_lock(self, validator_id: uuid.UUID, amount: float, at: datetime) -> None:
+        self._append(LOCK, validator_id, at.timestamp(), amount)
+
+    def append_slash(self, validator_id: uuid.UUID, fraction: float, reason: str, at: datetime) -> None:
+        self.slash_reasons[len(self.kinds)] = reason
+        self._append(SLASH, validator_id, at.timestamp(), fraction)
+
+    def append_release(self, validator_id: uuid.UUID, amount: float, at: datetime) -> None:
+        self._append(RELEASE, validator_id, at.timestamp(), amount)
+
+    def append_event(
+        self, kind: int, validator_id: uuid.UUID, ts: float, value: float, reason: Optional[str] = None
+    ) -> None:
+        """
+        Append a raw row, e.g. one read back from persistent storage.
+        """
+        if kind == SLASH:
+            self.slash_reasons[len(self.kinds)] = reason or ""
+        self._append(kind, validator_id, ts, value)
+
+    def partition(self, n_chunks: int, start: int = 0, end: Optional[int] = None) -> Sequence["EventLog"]:
+        """
+        Split rows ``start:end`` into ``n_chunks`` logs by validator index.
+
+        Events of one validator always land in the same chunk, in order, and
+        validators never interact, so chunks can be replayed independently.
+        Each chunk gets its own ``validator_ids`` table holding only the
+        validators it contains, so chunks pickle in proportion to their rows.
+        """
+        chunks = [EventLog() for _ in range(n_chunks)]
+        local: List[Dict[int, int]] = [{} for _ in range(n_chunks)]
+        ids = self.validator_ids
+        kinds, timestamps, validators, values = self.kinds, self.timestamps, self.validators, self.values
+        for row in range(start, len(kinds) if end is None else end):
+            idx = validators[row]
+            chunk = chunks[idx % n_chunks]
+            chunk_index = local[idx % n_chunks]
+            local_idx = chunk_index.get(idx)
+            if local_idx is None:
+                local_idx = chunk_index[idx] = chunk.validator_index(ids[idx])
+            if kinds[row] == SLASH:
+                chunk.slash_reasons[len(chunk.kinds)] = self.slash_reasons.get(row, "")
+            chunk.kinds.append(kinds[row])
+            chunk.timestamps.append(timestamps[row])
+            chunk.validators.append(local_idx)
+            chunk.values.append(values[row])
+        return chunks
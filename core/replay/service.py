@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeState
+from core.stake.service import StakeManager
+
+from .log import CORRECT_MINORITY, INCORRECT, LOCK, OUTCOME, RELEASE, SLASH, EventLog
+
+
+@dataclass
+class ReplayCheckpoint:
+    """
+    Replay state after the first ``offset`` rows of a log.
+
+    Reputation rows are (validator_id, stored score, last update POSIX time),
+    i.e. undecayed, exactly as ``ReputationEngine.export_states`` returns them.
+    """
+
+    offset: int
+    reputation: List[Tuple[uuid.UUID, float, float]]
+    stake: List[StakeState]
+
+
+@dataclass
+class ReplayResult:
+    reputation: ReputationEngine
+    stake: StakeManager
+    events: int
+    checkpoint: Optional[ReplayCheckpoint] = None
+
+
+class ReplayClock:
+    """
+    Injected clock for replayed engines: returns the current event's time.
+    """
+
+    def __init__(self) -> None:
+        self.ts = 0.0
+
+    def __call__(self) -> datetime:
+        return datetime.fromtimestamp(self.ts, timezone.utc)
+
+
+def _build_engines(
+    reputation_params: Dict[str, Any], stake_params: Dict[str, Any]
+) -> Tuple[ReputationEngine, StakeManager, ReplayClock]:
+    clock = ReplayClock()
+    return (
+        ReputationEngine(clock=clock, **reputation_params),
+        StakeManager(clock=clock, **stake_params),
+        clock,
+    )
+
+
+def _load(
+    reputation: ReputationEngine,
+    stake: StakeManager,
+    reputation_rows: List[Tuple[uuid.UUID, float, float]],
+    stake_states: List[StakeState],
+) -> None:
+    for validator_id, score, ts in reputation_rows:
+        reputation.load_state(validator_id, score, datetime.fromtimestamp(ts, timezone.utc))
+    for state in stake_states:
+        stake.load_state(
+            state.validator_id,
+            state.total_locked,
+            state.effective_stake,
+            state.last_updated,
+            slash_count=state.slash_count,
+            total_slashed=state.total_slashed,
+            last_slashed_at=state.last_slashed_at,
+        )
+
+
+def fold_events(
+    log: EventLog,
+    reputation: ReputationEngine,
+    stake: StakeManager,
+    clock: ReplayClock,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> None:
+    """
+    Apply rows ``start:end`` of ``log`` through the engines' own update logic.
+    """
+    kinds, timestamps, validators, values = log.kinds, log.timestamps, log.validators, log.values
+    ids = log.validator_ids
+    reasons = log.slash_reasons
+    apply_outcome = reputation.apply_outcome_at
+    for row in range(start, len(kinds) if end is None else end):
+        kind = kinds[row]
+        validator_id = ids[validators[row]]
+        if kind == OUTCOME:
+            value = values[row]
+            apply_outcome(validator_id, value != INCORRECT, value == CORRECT_MINORITY, timestamps[row])
+        elif kind == LOCK:
+            clock.ts = timestamps[row]
+            stake.lock(validator_id, values[row])
+        elif kind == SLASH:
+            clock.ts = timestamps[row]
+            stake.slash_many((validator_id,), values[row], reasons.get(row, ""), now=clock())
+        elif kind == RELEASE:
+            clock.ts = timestamps[row]
+            stake.release(validator_id, values[row], now=clock())
+
+
+def replay_chunk(
+    log: EventLog,
+    reputation_params: Dict[str, Any],
+    stake_params: Dict[str, Any],
+    reputation_rows: List[Tuple[uuid.UUID, float, float]],
+    stake_states: List[StakeState],
+) -> ReplayCheckpoint:
+    """
+    Worker entry point: replay one validator partition from its initial state.
+    """
+    reputation, stake, clock = _build_engines(reputation_params, stake_params)
+    _load(reputation, stake, reputation_rows, stake_states)
+    fold_events(log, reputation, stake, clock)
+    return ReplayCheckpoint(len(log), reputation.export_states(), stake.export_states())
+
+
+class ReplayEngine:
+    """
+    Rebuild reputation and stake state from an ``EventLog``.
+
+    Events are folded through fresh ``ReputationEngine``/``StakeManager``
+    instances built from ``reputation_params``/``stake_params`` (so a
+    parameter fix can be replayed against the original history) with a
+    ``ReplayClock`` that reports each event's own timestamp.
+
+    The log is processed in windows of ``checkpoint_every`` rows; after each
+    window a ``ReplayCheckpoint`` is passed to ``on_checkpoint`` and the last
+    one is returned, so an interrupted replay can resume with ``start=``.
+    With more than one worker each window is partitioned by validator, which
+    is safe because every event touches exactly one validator, and the
+    partitions are replayed in a process pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        reputation_params: Optional[Dict[str, Any]] = None,
+        stake_params: Optional[Dict[str, Any]] = None,
+        chunks_per_worker: int = 2,
+    ) -> None:
+        self.reputation_params = dict(reputation_params or {})
+        self.stake_params = dict(stake_params or {})
+        self.chunks_per_worker = chunks_per_worker
+
+    def replay(
+        self,
+        log: EventLog,
+        *,
+        start: Optional[ReplayCheckpoint] = None,
+        checkpoint_every: Optional[int] = None,
+        on_checkpoint: Optional[Callable[[ReplayCheckpoint], None]] = None,
+        workers: Optional[int] = 1,
+    ) -> ReplayResult:
+        reputation, stake, clock = _build_engines(self.reputation_params, self.stake_params)
+        offset = 0
+        if start is not None:
+            _load(reputation, stake, start.reputation, start.stake)
+            offset = start.offset
+
+        workers = workers or os.cpu_count() or 1
+        window = checkpoint_every or max(1, len(log) - offset)
+        checkpoint: Optional[ReplayCheckpoint] = start
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            while offset < len(log):
+                end = min(len(log), offset + window)
+                if pool is None:
+                    fold_events(log, reputation, stake, clock, offset, end)
+                else:
+                    self._replay_window(pool, workers, log, reputation, stake, offset, end)
+                offset = end
+                if checkpoint_every:
+                    checkpoint = ReplayCheckpoint(offset, reputation.export_states(), stake.export_states())
+                    if on_checkpoint is not None:
+                        on_checkpoint(checkpoint)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return ReplayResult(reputation=reputation, stake=stake, events=len(log), checkpoint=checkpoint)
+
+    def _replay_window(
+        self,
+        pool: ProcessPoolExecutor,
+        workers: int,
+        log: EventLog,
+        reputation: ReputationEngine,
+        stake: StakeManager,
+        start: int,
+        end: int,
+    ) -> None:
+        n_chunks = workers * self.chunks_per_worker
+        chunks = log.partition(n_chunks, start, end)
+        index = log._index
+
+        # Ship each partition the current state of its own validators only.
+        reputation_rows: List[list] = [[] for _ in range(n_chunks)]
+        for row in reputation.export_states():
+            idx = index.get(row[0])
+            if idx is not None:
+                reputation_rows[idx % n_chunks].append(row)
+        stake_states: List[list] = [[] for _ in range(n_chunks)]
+        for state in stake.export_states():
+            idx = index.get(state.validator_id)
+            if idx is not None:
+                stake_states[idx % n_chunks].append(state)
+
+        futures = [
+            pool.submit(
+                replay_chunk, chunk, self.reputation_params, self.stake_params, reputation_rows[i], stake_states[i]
+            )
+            for i, chunk in enumerate(chunks)
+            if len(chunk)
+        ]
+        for future in futures:
+            result = future.result()
+            _load(reputation, stake, result.reputation, result.stake)
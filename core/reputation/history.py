@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import uuid
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .models import ReputationHistoryPoint
+
+
+# (resolution name, bucket width in seconds, buckets kept); width 0 keeps every update.
+DEFAULT_TIERS: Tuple[Tuple[str, int, int], ...] = (
+    ("raw", 0, 256),
+    ("minute", 60, 1_440),
+    ("hour", 3_600, 720),
+    ("day", 86_400, 730),
+)
+
+# (start, last, low, high, count)
+Bucket = Tuple[float, float, float, float, int]
+
+
+def _combine(older: Bucket, newer: Bucket) -> Bucket:
+    return (older[0], newer[1], min(older[2], newer[2]), max(older[3], newer[3]), older[4] + newer[4])
+
+
+class _Ring:
+    """
+    Fixed-capacity ring of (start, last, low, high, count) buckets.
+
+    Columns grow up to ``capacity`` and are then overwritten oldest first, so
+    a validator with few updates only pays for the buckets it has used.
+    """
+
+    __slots__ = ("width", "capacity", "head", "start", "last", "low", "high", "count")
+
+    def __init__(self, width: int, capacity: int) -> None:
+        self.width = width
+        self.capacity = capacity
+        self.head = 0  # next slot to overwrite once full
+        self.start = array("d")
+        self.last = array("d")
+        self.low = array("d")
+        self.high = array("d")
+        self.count = array("q")
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def _newest(self) -> int:
+        return (self.head - 1) % len(self.start)
+
+    def bucket(self, slot: int) -> Bucket:
+        return (self.start[slot], self.last[slot], self.low[slot], self.high[slot], self.count[slot])
+
+    def newest(self) -> Optional[Bucket]:
+        return self.bucket(self._newest()) if self.start else None
+
+    def bucket_start(self, ts: float) -> float:
+        return ts - ts % self.width if self.width else ts
+
+    def add(self, ts: float, last: float, low: float, high: float, count: int = 1) -> Optional[Bucket]:
+        """
+        Fold an update (or a finer bucket starting at ``ts``) into the ring.
+
+        Returns the previously open bucket when this opens a new one, so the
+        caller can roll it up into the next coarser ring.
+        """
+        start = self.bucket_start(ts)
+        closed: Optional[Bucket] = None
+        if self.start:
+            newest = self._newest()
+            # Late arrivals fold into the open bucket rather than reopening an old one.
+            if self.width and start <= self.start[newest]:
+                self.last[newest] = last
+                self.low[newest] = min(self.low[newest], low)
+                self.high[newest] = max(self.high[newest], high)
+                self.count[newest] += count
+                return None
+            closed = self.bucket(newest)
+        if len(self.start) < self.capacity:
+            self.start.append(start)
+            self.last.append(last)
+            self.low.append(low)
+            self.high.append(high)
+            self.count.append(count)
+            self.head = len(self.start) % self.capacity
+            return closed
+        slot = self.head
+        self.start[slot] = start
+        self.last[slot] = last
+        self.low[slot] = low
+        self.high[slot] = high
+        self.count[slot] = count
+        self.head = (slot + 1) % self.capacity
+        return closed
+
+    def newest_first(self, since: Optional[float], limit: Optional[int]) -> List[int]:
+        size = len(self.start)
+        slots: List[int] = []
+        for i in range(size):
+            if limit is not None and len(slots) >= limit:
+                break
+            slot = (self.head - 1 - i) % size
+            if since is not None and self.start[slot] + self.width <= since:
+                break
+            slots.append(slot)
+        return slots
+
+
+class ReputationHistory:
+    """
+    Bounded per-validator reputation time series with rollups.
+
+    Score changes are written to the finest tier only (``raw`` keeps the
+    latest individual updates). When a tier opens a new bucket, the bucket it
+    closed is rolled up into the next coarser tier, so minute buckets are
+    built from raw updates, hours from minutes and days from hours. Each
+    bucket holds the last, min and max score plus the update count. Every
+    tier is a fixed-capacity ring, so memory per validator is bounded no
+    matter how many updates it receives. Coarse tiers keep history long
+    after the finer rings have overwritten it.
+
+    Each finer tier's open bucket has not been rolled up yet, so queries
+    fold those (at most one per tier) into the newest point. A query walks
+    back from the newest bucket in O(points returned + tiers).
+    """
+
+    def __init__(self, tiers: Sequence[Tuple[str, int, int]] = DEFAULT_TIERS) -> None:
+        if not tiers:
+            raise ValueError("at least one tier is required")
+        self._tiers = tuple(tiers)
+        self._series: Dict[uuid.UUID, Tuple[_Ring, ...]] = {}
+
+    @property
+    def resolutions(self) -> List[str]:
+        return [name for name, _, _ in self._tiers]
+
+    def __contains__(self, validator_id: uuid.UUID) -> bool:
+        return validator_id in self._series
+
+    def record(self, validator_id: uuid.UUID, ts: float, score: float) -> None:
+        rings = self._series.get(validator_id)
+        if rings is None:
+            rings = tuple(_Ring(width, capacity) for _, width, capacity in self._tiers)
+            self._series[validator_id] = rings
+        closed = rings[0].add(ts, score, score, score)
+        for ring in rings[1:]:
+            if closed is None:
+                break
+            closed = ring.add(*closed)
+
+    def points(
+        self,
+        validator_id: uuid.UUID,
+        resolution: str = "raw",
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[ReputationHistoryPoint]:
+        """
+        Buckets at ``resolution`` overlapping ``since`` onwards, oldest first.
+
+        ``limit`` keeps the most recent buckets.
+        """
+        names = self.resolutions
+        if resolution not in names:
+            raise ValueError(f"unknown resolution {resolution!r}; expected one of {names}")
+        rings = self._series.get(validator_id)
+        if rings is None:
+            return []
+        tier = names.index(resolution)
+        ring = rings[tier]
+        since_ts = since.timestamp() if since is not None else None
+        slots = ring.newest_first(since_ts, limit)
+        buckets = [ring.bucket(slot) for slot in slots]
+
+        # Open buckets of the finer tiers, oldest (coarsest) first.
+        pending: Optional[Bucket] = None
+        for finer in reversed(rings[:tier]):
+            bucket = finer.newest()
+            if bucket is not None:
+                pending = bucket if pending is None else _combine(pending, bucket)
+        if pending is not None:
+            start = ring.bucket_start(pending[0])
+            if ring.width and len(ring) and start <= ring.start[ring._newest()]:
+                if slots and slots[0] == ring._newest():
+                    buckets[0] = _combine(buckets[0], pending)
+            elif since_ts is None or start + ring.width > since_ts:
+                buckets.insert(0, (start,) + pending[1:])
+                if limit is not None:
+                    del buckets[limit:]
+
+        return [
+            ReputationHistoryPoint(
+                timestamp=datetime.fromtimestamp(start, timezone.utc),
+                score=last,
+                min_score=low,
+                max_score=high,
+                updates=count,
+            )
+            for start, last, low, high, count in reversed(buckets)
+        ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import List
 
 from pydantic import BaseModel, Field
 
@@ -15,6 +16,20 @@ class ReputationUpdateRequest(BaseModel):
     )
 
 
+class ReputationHistoryPoint(BaseModel):
+    timestamp: datetime = Field(..., description="Update time (raw) or bucket start.")
+    score: float = Field(..., description="Last score in the bucket.")
+    min_score: float
+    max_score: float
+    updates: int
+
+
+class ReputationHistoryResponse(BaseModel):
+    validator_id: uuid.UUID
+    resolution: str
+    points: List[ReputationHistoryPoint]
+
+
 @dataclass
 class ReputationState:
     validator_id: uuid.UUID
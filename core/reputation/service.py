@@ -2,15 +2,35 @@ from __future__ import annotations
 
 import math
 import uuid
+from array import array
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from core.replay.log import EventLog
+
+from .history import ReputationHistory
 from .models import ReputationState, ReputationUpdateRequest
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class ReputationEngine:
     """
     Simple reputation engine with decay and minority boosts.
+
+    Scores live in flat arrays indexed through an id -> slot map: ``_scores``
+    holds each validator's score as of its last update and ``_updated`` the
+    POSIX time of that update. Decay toward ``min_score`` is exponential, so
+    the current score is computed in closed form at read time and nothing is
+    written back on reads. Unknown validators read as a fresh state and are
+    only stored once an outcome is applied to them.
+
+    When a ``history`` is given, every applied outcome is also recorded in
+    it (restores via ``load_state`` are not); likewise an ``event_log``
+    receives one OUTCOME event per applied outcome for later replay. All
+    default timestamps come from ``clock``.
     """
 
     def __init__(
@@ -22,46 +42,181 @@ class ReputationEngine:
         minority_boost_multiplier: float = 2.0,
         min_score: float = 1.0,
         max_score: float = 1e6,
+        initial_score: float = 1.0,
+        history: Optional[ReputationHistory] = None,
+        event_log: Optional[EventLog] = None,
+        clock: Callable[[], datetime] = _utcnow,
     ) -> None:
-        self._states: Dict[uuid.UUID, ReputationState] = {}
+        self._index: Dict[uuid.UUID, int] = {}
+        self._ids: List[uuid.UUID] = []
+        self._scores = array("d")
+        self._updated = array("d")
         self.decay_rate_per_day = decay_rate_per_day
         self.correct_reward = correct_reward
         self.incorrect_penalty = incorrect_penalty
         self.min_score = min_score
         self.max_score = max_score
         self.minority_boost_multiplier = minority_boost_multiplier
+        self.initial_score = initial_score
+        self.history = history
+        self.event_log = event_log
+        self._clock = clock
+        self._listeners: List[Callable[[ReputationState], None]] = []
 
-    def get_state(self, validator_id: uuid.UUID) -> ReputationState:
-        state = self._states.get(validator_id)
-        if state is None:
-            state = ReputationState.new(validator_id)
-            self._states[validator_id] = state
-        return state
+    def __len__(self) -> int:
+        return len(self._ids)
 
-    def _apply_decay(self, state: ReputationState, now: Optional[datetime] = None) -> ReputationState:
-        now = now or datetime.now(timezone.utc)
-        elapsed_days = (now - state.last_updated).total_seconds() / 86400.0
+    def __contains__(self, validator_id: uuid.UUID) -> bool:
+        return validator_id in self._index
+
+    def add_listener(self, listener: Callable[[ReputationState], None]) -> None:
+        """
+        Register a callback invoked with the new state after every score change.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, validator_id: uuid.UUID, score: float, now_ts: float) -> None:
+        if self._listeners:
+            state = ReputationState(
+                validator_id=validator_id,
+                score=score,
+                last_updated=datetime.fromtimestamp(now_ts, timezone.utc),
+            )
+            for listener in self._listeners:
+                listener(state)
+
+    # ---- Reads ----
+
+    def _decayed(self, slot: int, now_ts: float) -> float:
+        elapsed_days = (now_ts - self._updated[slot]) / 86400.0
+        score = self._scores[slot]
         if elapsed_days <= 0:
-            return state
-        # Exponential decay toward min_score.
-        decay_factor = math.exp(-self.decay_rate_per_day * elapsed_days)
-        state.score = max(self.min_score, self.min_score + (state.score - self.min_score) * decay_factor)
-        state.last_updated = now
-        return state
+            return score
+        return self.min_score + (score - self.min_score) * math.exp(-self.decay_rate_per_day * elapsed_days)
+
+    def score(self, validator_id: uuid.UUID, now: Optional[datetime] = None) -> float:
+        """
+        Current (decayed) score; ``initial_score`` for unknown validators.
+        """
+        slot = self._index.get(validator_id)
+        if slot is None:
+            return self.initial_score
+        return self._decayed(slot, (now or self._clock()).timestamp())
+
+    def scores(
+        self,
+        validator_ids: Sequence[uuid.UUID],
+        now: Optional[datetime] = None,
+        out: Optional[array] = None,
+    ) -> array:
+        """
+        Current scores for many validators in one pass.
+
+        Results are written into ``out`` (an ``array('d')`` of matching
+        length) when given, so repeated batch reads can reuse one buffer.
+        """
+        if out is None:
+            out = array("d", bytes(8 * len(validator_ids)))
+        now_ts = (now or self._clock()).timestamp()
+        rate = self.decay_rate_per_day / 86400.0
+        floor = self.min_score
+        index, scores, updated = self._index, self._scores, self._updated
+        for i, validator_id in enumerate(validator_ids):
+            slot = index.get(validator_id)
+            if slot is None:
+                out[i] = self.initial_score
+                continue
+            elapsed = now_ts - updated[slot]
+            score = scores[slot]
+            out[i] = floor + (score - floor) * math.exp(-rate * elapsed) if elapsed > 0 else score
+        return out
+
+    def get_state(self, validator_id: uuid.UUID, now: Optional[datetime] = None) -> ReputationState:
+        """
+        Snapshot of a validator's decayed score and time of last update.
+        """
+        now = now or self._clock()
+        slot = self._index.get(validator_id)
+        if slot is None:
+            return ReputationState(validator_id=validator_id, score=self.initial_score, last_updated=now)
+        return ReputationState(
+            validator_id=validator_id,
+            score=self._decayed(slot, now.timestamp()),
+            last_updated=datetime.fromtimestamp(self._updated[slot], timezone.utc),
+        )
+
+    # ---- Writes ----
+
+    def _slot(self, validator_id: uuid.UUID, now_ts: float) -> int:
+        slot = self._index.get(validator_id)
+        if slot is None:
+            slot = len(self._ids)
+            self._index[validator_id] = slot
+            self._ids.append(validator_id)
+            self._scores.append(self.initial_score)
+            self._updated.append(now_ts)
+        return slot
+
+    def load_state(self, validator_id: uuid.UUID, score: float, last_updated: datetime) -> None:
+        """
+        Set a validator's stored score and update time (e.g. when restoring state).
+        """
+        slot = self._slot(validator_id, last_updated.timestamp())
+        self._scores[slot] = score
+        self._updated[slot] = last_updated.timestamp()
+        self._notify(validator_id, score, last_updated.timestamp())
+
+    def _apply(self, validator_id: uuid.UUID, factor: float, now_ts: float) -> float:
+        slot = self._slot(validator_id, now_ts)
+        score = min(self.max_score, max(self.min_score, self._decayed(slot, now_ts) * factor))
+        self._scores[slot] = score
+        self._updated[slot] = now_ts
+        if self.history is not None:
+            self.history.record(validator_id, now_ts, score)
+        self._notify(validator_id, score, now_ts)
+        return score
 
     def apply_outcome(self, req: ReputationUpdateRequest, now: Optional[datetime] = None) -> ReputationState:
-        state = self.get_state(req.validator_id)
-        state = self._apply_decay(state, now)
+        now = now or self._clock()
+        score = self.apply_outcome_at(req.validator_id, req.was_correct, req.was_minority, now.timestamp())
+        return ReputationState(validator_id=req.validator_id, score=score, last_updated=now)
 
-        if req.was_correct:
+    def apply_outcome_at(self, validator_id: uuid.UUID, was_correct: bool, was_minority: bool, ts: float) -> float:
+        """
+        Apply one outcome at POSIX time ``ts`` and return the new score.
+
+        Lean form of ``apply_outcome`` used by batch callers and replay.
+        """
+        if was_correct:
             delta = self.correct_reward
-            if req.was_minority:
+            if was_minority:
                 delta *= self.minority_boost_multiplier
-            new_score = min(self.max_score, state.score * (1.0 + delta))
+            factor = 1.0 + delta
         else:
-            new_score = max(self.min_score, state.score * (1.0 - self.incorrect_penalty))
+            factor = 1.0 - self.incorrect_penalty
+        if self.event_log is not None:
+            self.event_log.append_outcome(validator_id, was_correct, was_minority, ts)
+        return self._apply(validator_id, factor, ts)
+
+    def apply_outcomes(
+        self, updates: Iterable[Tuple[uuid.UUID, bool, bool]], now: Optional[datetime] = None
+    ) -> List[ReputationState]:
+        """
+        Apply many (validator_id, was_correct, was_minority) updates at one timestamp.
 
-        state.score = new_score
-        state.last_updated = now or datetime.now(timezone.utc)
-        return state
+        Equivalent to calling ``apply_outcome`` for each entry in order, without
+        building a request model per vote.
+        """
+        now = now or self._clock()
+        now_ts = now.timestamp()
+        updated: List[ReputationState] = []
+        for validator_id, was_correct, was_minority in updates:
+            score = self.apply_outcome_at(validator_id, was_correct, was_minority, now_ts)
+            updated.append(ReputationState(validator_id=validator_id, score=score, last_updated=now))
+        return updated
 
+    def export_states(self) -> List[Tuple[uuid.UUID, float, float]]:
+        """
+        Stored (validator_id, score, last_update_ts) rows, undecayed, for checkpoints.
+        """
+        return list(zip(self._ids, self._scores, self._updated))
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+from core.observability.metrics import record_lock_expiries, update_active_stake_locks
+
+from .models import StakeLock
+from .service import StakeManager
+
+
+class LockExpiryScheduler:
+    """
+    Background task releasing expired stake locks.
+
+    Every ``tick_interval`` seconds it calls ``StakeManager.release_expired``,
+    whose expiry heap makes a tick cost proportional to the number of locks
+    that expired, and records the releases as metrics.
+    """
+
+    def __init__(self, stake: StakeManager, *, tick_interval: float = 1.0) -> None:
+        self._stake = stake
+        self.tick_interval = tick_interval
+        self._task: Optional[asyncio.Task] = None
+
+    def run_once(self) -> List[StakeLock]:
+        released = self._stake.release_expired()
+        record_lock_expiries(len(released), sum(record.amount for record in released))
+        update_active_stake_locks(self._stake.active_lock_count())
+        return released
+
+    async def run(self) -> None:
+        while True:
+            self.run_once()
+            await asyncio.sleep(self.tick_interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -22,6 +22,32 @@ class SlashingEventModel(BaseModel):
     created_at: datetime
 
 
+class SlashingEventsResponse(BaseModel):
+    events: List[SlashingEventModel]
+
+
+class SlashingTotals(BaseModel):
+    count: int
+    amount: float
+
+
+class SlashingSummaryResponse(BaseModel):
+    since: Optional[datetime]
+    until: Optional[datetime]
+    total: SlashingTotals
+    by_reason: Dict[str, SlashingTotals]
+
+
+class SlashedValidator(BaseModel):
+    validator_id: uuid.UUID
+    slash_count: int
+
+
+class RepeatOffendersResponse(BaseModel):
+    min_count: int
+    validators: List[SlashedValidator]
+
+
 @dataclass
 class SlashingEvent:
     id: uuid.UUID
@@ -31,13 +57,36 @@ class SlashingEvent:
     created_at: datetime
 
 
+@dataclass
+class StakeLock:
+    """
+    One lock of stake, released back out of ``total_locked`` at ``lock_until``.
+
+    ``amount`` shrinks with the validator's stake when it is slashed.
+    """
+
+    id: uuid.UUID
+    validator_id: uuid.UUID
+    amount: float
+    lock_until: datetime
+    created_at: datetime
+
+
 @dataclass
 class StakeState:
+    """
+    A validator's stake balances and a compact summary of its slashing.
+
+    Individual slashing events live in the manager's ``SlashingLog``.
+    """
+
     validator_id: uuid.UUID
     total_locked: float
     effective_stake: float
     last_updated: datetime
-    slashing_history: List[SlashingEvent]
+    slash_count: int = 0
+    total_slashed: float = 0.0
+    last_slashed_at: Optional[datetime] = None
 
     @classmethod
     def new(cls, validator_id: uuid.UUID, amount: float) -> "StakeState":
@@ -47,6 +96,5 @@ class StakeState:
             total_locked=amount,
             effective_stake=amount,
             last_updated=now,
-            slashing_history=[],
         )
 
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-import math
+import heapq
 import uuid
+from array import array
+from dataclasses import replace
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from .models import SlashingEvent, SlashingEventModel, StakeLockRequest, StakeState
+from core.replay.log import EventLog
+
+from .models import SlashingEvent, SlashingEventModel, StakeLock, StakeLockRequest, StakeState
+from .slashing import SlashingLog
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class StakeManager:
@@ -13,6 +22,24 @@ class StakeManager:
     In-memory stake manager with simple decay and slashing.
 
     Phase 2 implementation; backing store will be PostgreSQL later.
+
+    Timestamps come from ``clock``. When an ``event_log`` is given, locks and
+    slashes are appended to it for later replay.
+
+    Effective stake halves every ``decay_half_life_days`` (floored at 1.0).
+    Stored states hold the balance as of ``last_updated`` and decay is
+    applied in closed form: on read via ``effective_stake``/
+    ``effective_stakes``, and before every lock or slash, so callers never
+    see stale stake. ``apply_decay_all`` materializes decay for every
+    validator at once; since the closed form composes, this changes no
+    observable value and listeners are not notified.
+
+    Each lock with a ``lock_until`` is kept as a ``StakeLock`` record and
+    scheduled in a min-heap keyed by its expiry, so ``release_expired``
+    only touches locks that are due.
+
+    Slashing events go to ``slashing_log``; states keep only a count, the
+    total slashed and the time of the last slash.
     """
 
     def __init__(
@@ -20,10 +47,29 @@ class StakeManager:
         *,
         decay_half_life_days: float = 365.0,
         max_stake_cap: float = 1e9,
+        event_log: Optional[EventLog] = None,
+        slashing_log: Optional[SlashingLog] = None,
+        clock: Callable[[], datetime] = _utcnow,
     ) -> None:
         self._states: Dict[uuid.UUID, StakeState] = {}
         self.decay_half_life_days = decay_half_life_days
         self.max_stake_cap = max_stake_cap
+        self._listeners: List[Callable[[StakeState], None]] = []
+        self.event_log = event_log
+        self.slashing_log = slashing_log if slashing_log is not None else SlashingLog()
+        self._clock = clock
+        self._locks: Dict[uuid.UUID, Dict[uuid.UUID, StakeLock]] = {}
+        self._expiries: List[Tuple[float, uuid.UUID, uuid.UUID]] = []
+
+    def add_listener(self, listener: Callable[[StakeState], None]) -> None:
+        """
+        Register a callback invoked after a validator's stake changes.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, state: StakeState) -> None:
+        for listener in self._listeners:
+            listener(state)
 
     # ---- Stake locking ----
 
@@ -31,41 +77,238 @@ class StakeManager:
         """
         Lock stake for a validator. Stake is non-transferable; this simply increases locked stake.
         """
-        vid = req.validator_id
-        state = self._states.get(vid)
+        return self.lock(req.validator_id, req.amount, lock_until=req.lock_until)
+
+    def lock(self, validator_id: uuid.UUID, amount: float, lock_until: Optional[datetime] = None) -> StakeState:
+        """
+        Lean form of ``lock_stake`` for already validated amounts (batch callers, replay).
+
+        Without ``lock_until`` the stake stays locked indefinitely.
+        """
+        now = self._clock()
+        if self.event_log is not None:
+            self.event_log.append_lock(validator_id, amount, now)
+        state = self._states.get(validator_id)
         if state is None:
-            state = StakeState.new(validator_id=vid, amount=req.amount)
+            state = StakeState.new(validator_id=validator_id, amount=amount)
+            state.last_updated = now
+            self._states[validator_id] = state
+            added = amount
         else:
-            state.total_locked = min(state.total_locked + req.amount, self.max_stake_cap)
-            state.effective_stake = min(state.effective_stake + req.amount, self.max_stake_cap)
-            state.last_updated = datetime.now(timezone.utc)
-        self._states[vid] = state
+            self._materialize(state, now)
+            before = state.total_locked
+            state.total_locked = min(state.total_locked + amount, self.max_stake_cap)
+            state.effective_stake = min(state.effective_stake + amount, self.max_stake_cap)
+            added = state.total_locked - before
+        if lock_until is not None and added > 0:
+            record = StakeLock(
+                id=uuid.uuid4(), validator_id=validator_id, amount=added, lock_until=lock_until, created_at=now
+            )
+            self._locks.setdefault(validator_id, {})[record.id] = record
+            heapq.heappush(self._expiries, (lock_until.timestamp(), record.id, validator_id))
+        self._notify(state)
+        return state
+
+    def locks(self, validator_id: uuid.UUID) -> List[StakeLock]:
+        """
+        Unexpired locks of a validator, in the order they were made.
+        """
+        return list(self._locks.get(validator_id, {}).values())
+
+    def load_lock(self, record: StakeLock) -> None:
+        """
+        Reschedule a pending lock (e.g. when restoring persisted state).
+
+        Balances are not changed: the lock's amount is already part of the
+        restored ``total_locked``.
+        """
+        self._locks.setdefault(record.validator_id, {})[record.id] = record
+        heapq.heappush(self._expiries, (record.lock_until.timestamp(), record.id, record.validator_id))
+
+    def active_lock_count(self) -> int:
+        return len(self._expiries)
+
+    # ---- Lock expiry ----
+
+    def release_expired(self, now: Optional[datetime] = None) -> List[StakeLock]:
+        """
+        Release every lock whose ``lock_until`` has passed; returns the released locks.
+
+        Costs O(log n) per expired lock and nothing for the rest.
+        """
+        now = now or self._clock()
+        now_ts = now.timestamp()
+        released: List[StakeLock] = []
+        while self._expiries and self._expiries[0][0] <= now_ts:
+            _, lock_id, validator_id = heapq.heappop(self._expiries)
+            validator_locks = self._locks[validator_id]
+            record = validator_locks.pop(lock_id)
+            if not validator_locks:
+                del self._locks[validator_id]
+            self.release(validator_id, record.amount, now)
+            released.append(record)
+        return released
+
+    def release(self, validator_id: uuid.UUID, amount: float, now: Optional[datetime] = None) -> Optional[StakeState]:
+        """
+        Return ``amount`` of locked stake to the validator (lock expiry, replay).
+
+        Effective stake shrinks in proportion to the share of locked stake
+        released.
+        """
+        state = self._states.get(validator_id)
+        if state is None:
+            return None
+        now = now or self._clock()
+        if self.event_log is not None:
+            self.event_log.append_release(validator_id, amount, now)
+        self._materialize(state, now)
+        if state.total_locked > 0:
+            remaining = max(0.0, 1.0 - amount / state.total_locked)
+            state.effective_stake = max(1.0, state.effective_stake * remaining)
+        state.total_locked = max(0.0, state.total_locked - amount)
+        self._notify(state)
         return state
 
     def get_state(self, validator_id: uuid.UUID) -> Optional[StakeState]:
+        """
+        Stored state; ``effective_stake`` is as of ``last_updated``, not decayed to now.
+        """
         return self._states.get(validator_id)
 
+    def load_state(
+        self,
+        validator_id: uuid.UUID,
+        total_locked: float,
+        effective_stake: float,
+        last_updated: datetime,
+        slash_count: Optional[int] = None,
+        total_slashed: Optional[float] = None,
+        last_slashed_at: Optional[datetime] = None,
+    ) -> StakeState:
+        """
+        Set a validator's stake balances (e.g. when restoring persisted state).
+
+        The slashing summary is only overwritten when ``slash_count`` is given.
+        """
+        state = self._states.get(validator_id)
+        if state is None:
+            state = StakeState.new(validator_id=validator_id, amount=total_locked)
+            self._states[validator_id] = state
+        state.total_locked = total_locked
+        state.effective_stake = effective_stake
+        state.last_updated = last_updated
+        if slash_count is not None:
+            state.slash_count = slash_count
+            state.total_slashed = total_slashed or 0.0
+            state.last_slashed_at = last_slashed_at
+        self._notify(state)
+        return state
+
+    def export_states(self) -> List[StakeState]:
+        """
+        Copies of every validator's state, for checkpoints.
+        """
+        return [replace(state) for state in self._states.values()]
+
     # ---- Decay ----
 
+    @property
+    def half_life_seconds(self) -> float:
+        return max(self.decay_half_life_days, 1e-3) * 86400.0
+
+    def _decayed(self, state: StakeState, now_ts: float) -> float:
+        elapsed = now_ts - state.last_updated.timestamp()
+        if elapsed <= 0:
+            return state.effective_stake
+        # Exponential decay toward a floor of 1.0 (to keep log domain valid).
+        return max(1.0, state.effective_stake * 0.5 ** (elapsed / self.half_life_seconds))
+
+    def _materialize(self, state: StakeState, now: datetime) -> None:
+        # Never move the anchor backwards: decay up to a later anchor is already applied.
+        if now > state.last_updated:
+            state.effective_stake = self._decayed(state, now.timestamp())
+            state.last_updated = now
+
+    def effective_stake(self, validator_id: uuid.UUID, now: Optional[datetime] = None) -> float:
+        """
+        Current (decayed) effective stake; 1.0 for validators without stake.
+        """
+        state = self._states.get(validator_id)
+        if state is None:
+            return 1.0
+        return self._decayed(state, (now or self._clock()).timestamp())
+
+    def effective_stakes(
+        self,
+        validator_ids: Sequence[uuid.UUID],
+        now: Optional[datetime] = None,
+        out: Optional[array] = None,
+    ) -> array:
+        """
+        Current effective stakes for many validators in one pass.
+
+        Results are written into ``out`` (an ``array('d')`` of matching
+        length) when given, so repeated batch reads can reuse one buffer.
+        """
+        if out is None:
+            out = array("d", bytes(8 * len(validator_ids)))
+        now_ts = (now or self._clock()).timestamp()
+        inv_half_life = 1.0 / self.half_life_seconds
+        factors: Dict[datetime, float] = {}
+        states = self._states
+        for i, validator_id in enumerate(validator_ids):
+            state = states.get(validator_id)
+            if state is None:
+                out[i] = 1.0
+                continue
+            factor = factors.get(state.last_updated)
+            if factor is None:
+                elapsed = now_ts - state.last_updated.timestamp()
+                factor = factors[state.last_updated] = 0.5 ** (elapsed * inv_half_life) if elapsed > 0 else 1.0
+            effective = state.effective_stake * factor
+            out[i] = effective if effective > 1.0 else 1.0
+        return out
+
     def apply_decay(self, validator_id: uuid.UUID, now: Optional[datetime] = None) -> Optional[StakeState]:
         """
-        Apply time-based decay to effective stake. Total locked remains as an upper bound.
+        Materialize decay of one validator's effective stake. Total locked remains as an upper bound.
         """
         state = self._states.get(validator_id)
         if state is None:
             return None
-        now = now or datetime.now(timezone.utc)
-        elapsed_days = (now - state.last_updated).total_seconds() / 86400.0
-        if elapsed_days <= 0:
-            return state
-        # Exponential decay toward a floor of 1.0 (to keep log domain valid).
-        half_life = max(self.decay_half_life_days, 1e-3)
-        decay_factor = 0.5 ** (elapsed_days / half_life)
-        new_effective = max(1.0, state.effective_stake * decay_factor)
-        state.effective_stake = new_effective
-        state.last_updated = now
+        now = now or self._clock()
+        if now > state.last_updated:
+            self._materialize(state, now)
+            self._notify(state)
         return state
 
+    def apply_decay_all(self, now: Optional[datetime] = None) -> int:
+        """
+        Materialize decay for every validator at ``now``; returns states updated.
+
+        States sharing an anchor (e.g. everyone after a previous sweep, or a
+        batch slashed together) share one decay factor, so the sweep costs a
+        single multiply per validator rather than a ``pow`` each.
+        """
+        now = now or self._clock()
+        now_ts = now.timestamp()
+        inv_half_life = 1.0 / self.half_life_seconds
+        factors: Dict[datetime, float] = {}
+        updated = 0
+        for state in self._states.values():
+            anchor = state.last_updated
+            factor = factors.get(anchor)
+            if factor is None:
+                elapsed = now_ts - anchor.timestamp()
+                factor = factors[anchor] = 0.5 ** (elapsed * inv_half_life) if elapsed > 0 else 1.0
+            if factor < 1.0:
+                effective = state.effective_stake * factor
+                state.effective_stake = effective if effective > 1.0 else 1.0
+                state.last_updated = now
+                updated += 1
+        return updated
+
     # ---- Slashing ----
 
     def slash(
@@ -77,27 +320,64 @@ class StakeManager:
         """
         Slash a fraction of the validator's total_locked and effective_stake.
         """
-        if fraction <= 0.0:
-            raise ValueError("fraction must be > 0")
-        if fraction > 1.0:
-            raise ValueError("fraction must be <= 1")
-
+        _check_fraction(fraction)
         state = self._states.get(validator_id)
         if state is None:
             return None
+        ev = self._slash_state(state, fraction, reason, self._clock())
+        return SlashingEventModel(**ev.__dict__)
 
+    def slash_many(
+        self,
+        validator_ids: Iterable[uuid.UUID],
+        fraction: float,
+        reason: str,
+        now: Optional[datetime] = None,
+    ) -> List[SlashingEvent]:
+        """
+        Slash the same fraction from many validators at one timestamp.
+
+        Validators without stake are skipped, as in ``slash``. Returns the raw
+        events (no response models) since batch callers only aggregate them.
+        """
+        _check_fraction(fraction)
+        now = now or self._clock()
+        events: List[SlashingEvent] = []
+        for validator_id in validator_ids:
+            state = self._states.get(validator_id)
+            if state is not None:
+                events.append(self._slash_state(state, fraction, reason, now))
+        return events
+
+    def _slash_state(self, state: StakeState, fraction: float, reason: str, now: datetime) -> SlashingEvent:
+        if self.event_log is not None:
+            self.event_log.append_slash(state.validator_id, fraction, reason, now)
+        self._materialize(state, now)
         amount = state.total_locked * fraction
         state.total_locked = max(0.0, state.total_locked - amount)
         state.effective_stake = max(1.0, state.effective_stake - amount)
-        state.last_updated = datetime.now(timezone.utc)
+        # Pending locks return only what is left of them.
+        for record in self._locks.get(state.validator_id, {}).values():
+            record.amount *= 1.0 - fraction
 
         ev = SlashingEvent(
             id=uuid.uuid4(),
-            validator_id=validator_id,
+            validator_id=state.validator_id,
             amount_slashed=amount,
             reason=reason,
-            created_at=state.last_updated,
+            created_at=now,
         )
-        state.slashing_history.append(ev)
-        return SlashingEventModel(**ev.__dict__)
+        state.slash_count += 1
+        state.total_slashed += amount
+        state.last_slashed_at = now
+        self.slashing_log.append(ev)
+        self._notify(state)
+        return ev
+
+
+def _check_fraction(fraction: float) -> None:
+    if fraction <= 0.0:
+        raise ValueError("fraction must be > 0")
+    if fraction > 1.0:
+        raise ValueError("fraction must be <= 1")
 
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+from .models import SlashingEvent
+
+
+class _TimeIndex:
+    """
+    Rows ordered by time with a running prefix sum of slashed amounts.
+
+    Events almost always arrive in time order and are appended; an earlier
+    timestamp is inserted in place, which only rewrites the entries after it.
+    """
+
+    def __init__(self) -> None:
+        self.rows = array("i")
+        self.times = array("d")
+        self.prefix = array("d", [0.0])
+
+    def add(self, row: int, ts: float, amount: float) -> None:
+        if not self.times or ts >= self.times[-1]:
+            self.rows.append(row)
+            self.times.append(ts)
+            self.prefix.append(self.prefix[-1] + amount)
+            return
+        i = bisect_right(self.times, ts)
+        self.rows.insert(i, row)
+        self.times.insert(i, ts)
+        self.prefix.insert(i + 1, self.prefix[i] + amount)
+        for k in range(i + 2, len(self.prefix)):
+            self.prefix[k] += amount
+
+    def span(self, since: Optional[float], until: Optional[float]) -> Tuple[int, int]:
+        start = 0 if since is None else bisect_left(self.times, since)
+        end = len(self.times) if until is None else bisect_left(self.times, until)
+        return start, max(start, end)
+
+    def totals(self, since: Optional[float], until: Optional[float]) -> Tuple[int, float]:
+        start, end = self.span(since, until)
+        return end - start, self.prefix[end] - self.prefix[start]
+
+
+class SlashingLog:
+    """
+    Global append-only log of slashing events.
+
+    Events are stored column-wise and indexed by validator, by reason and by
+    time. The time indexes (one overall, one per reason) carry prefix sums,
+    so count and amount totals over any time window cost two binary
+    searches. Validators are also grouped by how often they were slashed,
+    which answers "slashed at least N times" without a scan.
+
+    Time windows are half-open: ``since <= created_at < until``.
+    """
+
+    def __init__(self) -> None:
+        self._event_ids: List[uuid.UUID] = []
+        self._validators: List[uuid.UUID] = []
+        self._amounts = array("d")
+        self._times = array("d")
+        self._reasons = array("i")
+        self._reason_names: List[str] = []
+        self._reason_codes: Dict[str, int] = {}
+        self._by_time = _TimeIndex()
+        self._by_reason: Dict[int, _TimeIndex] = {}
+        self._by_validator: Dict[uuid.UUID, array] = {}
+        self._counts: Dict[uuid.UUID, int] = {}
+        self._count_groups: Dict[int, Dict[uuid.UUID, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._event_ids)
+
+    def append(self, event: SlashingEvent) -> None:
+        row = len(self._event_ids)
+        ts = event.created_at.timestamp()
+        code = self._reason_codes.get(event.reason)
+        if code is None:
+            code = self._reason_codes[event.reason] = len(self._reason_names)
+            self._reason_names.append(event.reason)
+            self._by_reason[code] = _TimeIndex()
+
+        self._event_ids.append(event.id)
+        self._validators.append(event.validator_id)
+        self._amounts.append(event.amount_slashed)
+        self._times.append(ts)
+        self._reasons.append(code)
+        self._by_time.add(row, ts, event.amount_slashed)
+        self._by_reason[code].add(row, ts, event.amount_slashed)
+        self._by_validator.setdefault(event.validator_id, array("i")).append(row)
+
+        validator_id = event.validator_id
+        count = self._counts.get(validator_id, 0)
+        if count:
+            group = self._count_groups[count]
+            del group[validator_id]
+            if not group:
+                del self._count_groups[count]
+        self._counts[validator_id] = count + 1
+        self._count_groups.setdefault(count + 1, {})[validator_id] = None
+
+    def _event(self, row: int) -> SlashingEvent:
+        return SlashingEvent(
+            id=self._event_ids[row],
+            validator_id=self._validators[row],
+            amount_slashed=self._amounts[row],
+            reason=self._reason_names[self._reasons[row]],
+            created_at=datetime.fromtimestamp(self._times[row], timezone.utc),
+        )
+
+    # ---- Queries ----
+
+    def events(
+        self,
+        *,
+        validator_id: Optional[uuid.UUID] = None,
+        reason: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[SlashingEvent]:
+        """
+        Matching events, newest first.
+
+        A validator filter walks that validator's rows; otherwise the
+        reason's (or the overall) time index is cut to the window.
+        """
+        since_ts = since.timestamp() if since is not None else None
+        until_ts = until.timestamp() if until is not None else None
+        code = None
+        if reason is not None:
+            code = self._reason_codes.get(reason)
+            if code is None:
+                return []
+
+        if validator_id is not None:
+            rows = sorted(
+                (
+                    row
+                    for row in self._by_validator.get(validator_id, ())
+                    if (code is None or self._reasons[row] == code)
+                    and (since_ts is None or self._times[row] >= since_ts)
+                    and (until_ts is None or self._times[row] < until_ts)
+                ),
+                key=self._times.__getitem__,
+            )
+        else:
+            index = self._by_time if code is None else self._by_reason[code]
+            start, end = index.span(since_ts, until_ts)
+            if limit is not None:
+                start = max(start, end - limit)
+            rows = index.rows[start:end]
+
+        newest = list(reversed(rows))
+        if limit is not None:
+            newest = newest[:limit]
+        return [self._event(row) for row in newest]
+
+    def totals(
+        self,
+        *,
+        reason: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Tuple[int, float]:
+        """
+        (count, amount slashed) in the window, overall or for one reason.
+        """
+        if reason is None:
+            index = self._by_time
+        else:
+            code = self._reason_codes.get(reason)
+            if code is None:
+                return 0, 0.0
+            index = self._by_reason[code]
+        return index.totals(
+            since.timestamp() if since is not None else None,
+            until.timestamp() if until is not None else None,
+        )
+
+    def totals_by_reason(
+        self, *, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> Dict[str, Tuple[int, float]]:
+        """
+        (count, amount slashed) per reason in the window; reasons with no events are left out.
+        """
+        since_ts = since.timestamp() if since is not None else None
+        until_ts = until.timestamp() if until is not None else None
+        result: Dict[str, Tuple[int, float]] = {}
+        for code, index in self._by_reason.items():
+            count, amount = index.totals(since_ts, until_ts)
+            if count:
+                result[self._reason_names[code]] = (count, amount)
+        return result
+
+    def slash_count(self, validator_id: uuid.UUID) -> int:
+        return self._counts.get(validator_id, 0)
+
+    def repeat_offenders(self, min_count: int, limit: Optional[int] = None) -> List[Tuple[uuid.UUID, int]]:
+        """
+        Validators slashed at least ``min_count`` times, most slashed first;
+        at most ``limit`` of them, without visiting the rest.
+        """
+        result: List[Tuple[uuid.UUID, int]] = []
+        for count in sorted((c for c in self._count_groups if c >= min_count), reverse=True):
+            if limit is not None and len(result) >= limit:
+                break
+            group = self._count_groups[count]
+            remaining = None if limit is None else limit - len(result)
+            result.extend((validator_id, count) for validator_id in islice(group, remaining))
+        return result
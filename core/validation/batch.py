@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import uuid
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.governance.models import GovernanceParams
+
+from .service import VoteService
+from .session import ConsensusOutcome, ValidationSessionService, decide_outcome
+
+
+VOTE_CODES = {"approve": 0, "reject": 1, "uncertain": 2}
+OUTCOMES: Tuple[ConsensusOutcome, ...] = ("accepted", "rejected", "uncertain")
+
+
+@dataclass
+class ConsensusChunk:
+    """
+    Compact, picklable input for one worker.
+
+    Votes of claim ``i`` occupy ``offsets[i]:offsets[i + 1]`` in the per-vote
+    arrays. ``validator_index`` points into ``influence``, which holds one
+    weight per distinct validator of the chunk, so each weight is shipped once.
+    """
+
+    offsets: array  # 'q', len = n_claims + 1
+    validator_index: array  # 'l', one per vote
+    vote_codes: array  # 'b', one per vote (see VOTE_CODES)
+    confidences: array  # 'd', one per vote
+    influence: array  # 'd', one per distinct validator
+
+
+@dataclass
+class BatchConsensusResult:
+    claim_id: uuid.UUID
+    outcome: ConsensusOutcome
+    confidence: float
+    finalized: bool
+    params_version: Optional[int] = None
+
+
+@dataclass
+class _BatchPlan:
+    params: GovernanceParams
+    now: datetime
+    workers: int
+    partitions: List[List[uuid.UUID]]
+
+
+def evaluate_chunk(chunk: ConsensusChunk, confidence_threshold: float) -> Tuple[array, array]:
+    """
+    Worker entry point: influence-weighted consensus for every claim of a chunk.
+
+    Returns (outcome codes as indexes into OUTCOMES, confidences).
+    """
+    outcome_codes = array("b")
+    confidences = array("d")
+    offsets = chunk.offsets
+    vidx = chunk.validator_index
+    codes = chunk.vote_codes
+    conf = chunk.confidences
+    influence = chunk.influence
+    for i in range(len(offsets) - 1):
+        weights = [0.0, 0.0, 0.0]
+        for j in range(offsets[i], offsets[i + 1]):
+            weights[codes[j]] += influence[vidx[j]] * conf[j]
+        outcome, confidence = decide_outcome(weights[0], weights[1], weights[2], confidence_threshold)
+        outcome_codes.append(OUTCOMES.index(outcome))
+        confidences.append(confidence)
+    return outcome_codes, confidences
+
+
+class BatchConsensusEvaluator:
+    """
+    Evaluate consensus for many claims at once across a process pool.
+
+    Influence weights are computed once per distinct validator in the parent
+    process (they depend on in-memory stake, reputation and identity state),
+    then claims are partitioned into chunks of compact arrays and summed in
+    worker processes. Strong outcomes are merged back through
+    ``ValidationSessionService.finalize_outcomes``, which applies them exactly
+    once and appends all ledger versions under a single Merkle recompute.
+    One governance params snapshot is used for the whole batch. The pool
+    never exceeds ``max_workers`` processes (the CPU count by default),
+    whatever the caller asks for.
+
+    ``evaluate_async`` is the event-loop variant: chunks are built and
+    outcomes applied on the loop thread, which owns stake and reputation
+    state, and only the pure chunk arithmetic runs in an executor.
+    """
+
+    def __init__(
+        self,
+        sessions: ValidationSessionService,
+        votes: VoteService,
+        *,
+        chunks_per_worker: int = 4,
+        min_parallel_claims: int = 1000,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self._sessions = sessions
+        self._votes = votes
+        self.chunks_per_worker = chunks_per_worker
+        self.min_parallel_claims = min_parallel_claims
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def pending_claim_ids(self) -> List[uuid.UUID]:
+        return [cid for cid in self._votes.list_claim_ids() if not self._sessions.is_finalized(cid)]
+
+    def evaluate(
+        self,
+        claim_ids: Optional[Sequence[uuid.UUID]] = None,
+        *,
+        workers: Optional[int] = None,
+        apply: bool = True,
+        now: Optional[datetime] = None,
+    ) -> List[BatchConsensusResult]:
+        """
+        Evaluate ``claim_ids`` (all pending claims if None).
+
+        Already finalized claims are reported with their recorded outcome and
+        not re-evaluated. With ``apply=False`` outcomes are computed but not
+        written back, which is useful for dry runs and benchmarks.
+        """
+        results, plan = self._plan(claim_ids, workers, now)
+        if plan is None:
+            return results
+        influence_cache: Dict[uuid.UUID, float] = {}
+        chunks = [self._build_chunk(part, influence_cache, plan.now, plan.params) for part in plan.partitions]
+        outputs = self._run_chunks(chunks, plan.workers)
+        return results + self._merge(plan, outputs, apply)
+
+    async def evaluate_async(
+        self,
+        claim_ids: Optional[Sequence[uuid.UUID]] = None,
+        *,
+        workers: Optional[int] = None,
+        apply: bool = True,
+        now: Optional[datetime] = None,
+    ) -> List[BatchConsensusResult]:
+        """
+        ``evaluate`` without blocking the event loop.
+        """
+        results, plan = self._plan(claim_ids, workers, now)
+        if plan is None:
+            return results
+        influence_cache: Dict[uuid.UUID, float] = {}
+        chunks = []
+        for part in plan.partitions:
+            chunks.append(self._build_chunk(part, influence_cache, plan.now, plan.params))
+            await asyncio.sleep(0)
+        outputs = await asyncio.get_running_loop().run_in_executor(None, self._run_chunks, chunks, plan.workers)
+        return results + self._merge(plan, outputs, apply)
+
+    def _plan(
+        self,
+        claim_ids: Optional[Sequence[uuid.UUID]],
+        workers: Optional[int],
+        now: Optional[datetime],
+    ) -> Tuple[List[BatchConsensusResult], Optional[_BatchPlan]]:
+        if claim_ids is None:
+            claim_ids = self.pending_claim_ids()
+        workers = min(workers or self.max_workers, self.max_workers)
+
+        results: List[BatchConsensusResult] = []
+        to_evaluate: List[uuid.UUID] = []
+        for cid in claim_ids:
+            session = self._sessions.get_session(cid)
+            if session is not None and session.finalized:
+                results.append(
+                    BatchConsensusResult(cid, session.outcome, session.confidence, True, session.params_version)
+                )
+            else:
+                to_evaluate.append(cid)
+        if not to_evaluate:
+            return results, None
+
+        if len(to_evaluate) < self.min_parallel_claims:
+            workers = 1
+        n_chunks = 1 if workers <= 1 else workers * self.chunks_per_worker
+        size = max(1, math.ceil(len(to_evaluate) / n_chunks))
+        partitions = [to_evaluate[i : i + size] for i in range(0, len(to_evaluate), size)]
+        plan = _BatchPlan(
+            params=self._sessions.params(),
+            now=now or datetime.now(timezone.utc),
+            workers=workers,
+            partitions=partitions,
+        )
+        return results, plan
+
+    def _run_chunks(self, chunks: List[ConsensusChunk], workers: int) -> List[Tuple[array, array]]:
+        threshold = self._sessions.confidence_threshold
+        if workers <= 1:
+            return [evaluate_chunk(chunk, threshold) for chunk in chunks]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(evaluate_chunk, chunks, [threshold] * len(chunks)))
+
+    def _merge(
+        self, plan: _BatchPlan, outputs: List[Tuple[array, array]], apply: bool
+    ) -> List[BatchConsensusResult]:
+        evaluated: List[Tuple[uuid.UUID, ConsensusOutcome, float]] = []
+        for part, (outcome_codes, confidences) in zip(plan.partitions, outputs):
+            for cid, code, confidence in zip(part, outcome_codes, confidences):
+                evaluated.append((cid, OUTCOMES[code], confidence))
+
+        finalized_ids = set()
+        if apply:
+            finalized_ids = {s.claim_id for s in self._sessions.finalize_outcomes(evaluated, plan.params)}
+        return [
+            BatchConsensusResult(cid, outcome, confidence, cid in finalized_ids, plan.params.version)
+            for cid, outcome, confidence in evaluated
+        ]
+
+    def _build_chunk(
+        self,
+        claim_ids: Iterable[uuid.UUID],
+        influence_cache: Dict[uuid.UUID, float],
+        now: datetime,
+        params: GovernanceParams,
+    ) -> ConsensusChunk:
+        offsets = array("q", [0])
+        validator_index = array("l")
+        vote_codes = array("b")
+        confidences = array("d")
+        influence = array("d")
+        local_index: Dict[uuid.UUID, int] = {}
+
+        for cid in claim_ids:
+            for v in self._votes.raw_votes_for_claim(cid):
+                if not v.signature_valid:
+                    continue
+                idx = local_index.get(v.validator_id)
+                if idx is None:
+                    weight = influence_cache.get(v.validator_id)
+                    if weight is None:
+                        weight = self._sessions.influence_for_validator(v.validator_id, now, params)
+                        influence_cache[v.validator_id] = weight
+                    idx = len(influence)
+                    local_index[v.validator_id] = idx
+                    influence.append(weight)
+                validator_index.append(idx)
+                vote_codes.append(VOTE_CODES.get(v.vote_type, VOTE_CODES["uncertain"]))
+                confidences.append(v.confidence)
+            offsets.append(len(vote_codes))
+
+        return ConsensusChunk(
+            offsets=offsets,
+            validator_index=validator_index,
+            vote_codes=vote_codes,
+            confidences=confidences,
+            influence=influence,
+        )
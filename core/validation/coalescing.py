@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+from core.observability.metrics import record_consensus_request
+
+from .service import VoteService
+from .session import ValidationSession, ValidationSessionService
+
+
+@dataclass
+class CachedConsensus:
+    vote_version: int
+    session: ValidationSession
+
+
+class ConsensusCoalescer:
+    """
+    Per-claim consensus cache for the polling endpoint.
+
+    This is a cache, not single-flight: a miss evaluates synchronously on
+    the caller's thread, which must be the event loop. Evaluation finalizes
+    outcomes into stake, reputation, leaderboard and population state, and
+    that state is only touched on the loop. Since nothing awaits in between,
+    polls are served one at a time, and a burst of polls for a claim costs
+    one evaluation followed by cache hits.
+
+    A result is reused until the claim's vote set changes, as tracked by
+    ``VoteService.vote_count``. Finalized sessions are served directly
+    because their outcome can no longer change, and their entries are
+    dropped. At most ``max_entries`` unfinalized claims are kept; the least
+    recently polled is evicted first. Callers receive snapshots, never the
+    live session object.
+    """
+
+    def __init__(
+        self, sessions: ValidationSessionService, votes: VoteService, *, max_entries: int = 10_000
+    ) -> None:
+        self._sessions = sessions
+        self._votes = votes
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[uuid.UUID, CachedConsensus]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get_consensus(self, claim_id: uuid.UUID) -> ValidationSession:
+        session = self._sessions.get_session(claim_id)
+        if session is not None and session.finalized:
+            self._cache.pop(claim_id, None)
+            record_consensus_request("cached")
+            return _snapshot(session)
+
+        version = self._votes.vote_count(claim_id)
+        cached = self._cache.get(claim_id)
+        if cached is not None and cached.vote_version == version:
+            self._cache.move_to_end(claim_id)
+            record_consensus_request("cached")
+            return cached.session
+
+        record_consensus_request("computed")
+        session = _snapshot(self._sessions.compute_consensus(claim_id))
+        if session.finalized:
+            self._cache.pop(claim_id, None)
+        else:
+            self._cache[claim_id] = CachedConsensus(vote_version=version, session=session)
+            self._cache.move_to_end(claim_id)
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return session
+
+
+def _snapshot(session: ValidationSession) -> ValidationSession:
+    return replace(
+        session,
+        validators_sampled=list(session.validators_sampled),
+        sampled_ids=set(session.sampled_ids),
+    )
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import uuid
+from array import array
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from .models import Vote
+
+
+class CountMinSketch:
+    """
+    Fixed-size Count-Min sketch over byte keys.
+
+    Estimates never undercount; with ``width`` w and ``depth`` d the
+    overestimate is at most 2N/w with probability 1 - 2^-d for N total
+    increments.
+    """
+
+    def __init__(self, width: int = 1 << 16, depth: int = 4) -> None:
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be >= 1")
+        self.width = width
+        self.depth = depth
+        self._rows: List[array] = [array("l", [0]) * width for _ in range(depth)]
+
+    def _slots(self, key: bytes) -> List[int]:
+        digest = hashlib.blake2b(key, digest_size=8 * self.depth).digest()
+        return [int.from_bytes(digest[8 * i : 8 * i + 8], "little") % self.width for i in range(self.depth)]
+
+    def add(self, key: bytes, count: int = 1) -> int:
+        """
+        Increment ``key`` and return its new estimate.
+        """
+        estimate = None
+        for row, slot in zip(self._rows, self._slots(key)):
+            row[slot] += count
+            value = row[slot]
+            estimate = value if estimate is None else min(estimate, value)
+        return estimate or 0
+
+    def estimate(self, key: bytes) -> int:
+        return min(row[slot] for row, slot in zip(self._rows, self._slots(key)))
+
+
+class VoteCorrelationEngine:
+    """
+    Incremental pairwise vote-agreement tracker with bounded memory.
+
+    Every accepted vote is paired with the most recent ``window`` positional
+    votes (approve/reject) on the same claim. Co-vote and agreement counts
+    for every pair go into two Count-Min sketches; each validator also keeps
+    exact counts for its ``top_k`` most frequent co-voters (Space-Saving style:
+    a new partner replaces the least frequent one once its sketch estimate is
+    larger, starting from that estimate).
+
+    A validator's correlation score is the co-vote-weighted agreement with its
+    top co-voters, measured above the ``baseline`` agreement rate expected by
+    chance and mapped to [0, 1]. Scores are refreshed on every update (O(K))
+    so ``score`` is an O(1) read suitable for the influence path via
+    ``compute_correlation_penalty``.
+    """
+
+    def __init__(
+        self,
+        *,
+        top_k: int = 32,
+        window: int = 64,
+        max_tracked_claims: int = 100_000,
+        min_co_votes: int = 5,
+        baseline: float = 0.5,
+        sketch_width: int = 1 << 16,
+        sketch_depth: int = 4,
+    ) -> None:
+        if not 0.0 <= baseline < 1.0:
+            raise ValueError("baseline must be in [0, 1)")
+        self.top_k = top_k
+        self.window = window
+        self.max_tracked_claims = max_tracked_claims
+        self.min_co_votes = min_co_votes
+        self.baseline = baseline
+        self._co_votes = CountMinSketch(sketch_width, sketch_depth)
+        self._agreements = CountMinSketch(sketch_width, sketch_depth)
+        # claim -> recent (validator_id, vote_type), oldest claims evicted first.
+        self._recent: "OrderedDict[uuid.UUID, Deque[Tuple[uuid.UUID, str]]]" = OrderedDict()
+        # validator -> partner -> [agreements, co_votes]
+        self._top: Dict[uuid.UUID, Dict[uuid.UUID, List[int]]] = {}
+        self._scores: Dict[uuid.UUID, float] = {}
+        self._listeners: List[Callable[[uuid.UUID, uuid.UUID, bool], None]] = []
+
+    def add_listener(self, listener: Callable[[uuid.UUID, uuid.UUID, bool], None]) -> None:
+        """
+        Register a callback invoked with (validator, co-voter, agreed) for every recorded pair.
+        """
+        self._listeners.append(listener)
+
+    # ---- Ingestion ----
+
+    def observe_vote(self, vote: Vote) -> None:
+        """
+        VoteService listener: fold one vote into the pairwise statistics.
+        """
+        if not vote.signature_valid or vote.vote_type not in ("approve", "reject"):
+            return
+        recent = self._recent.get(vote.claim_id)
+        if recent is None:
+            recent = deque(maxlen=self.window)
+            self._recent[vote.claim_id] = recent
+            if len(self._recent) > self.max_tracked_claims:
+                self._recent.popitem(last=False)
+
+        touched = set()
+        for other_id, other_type in recent:
+            if other_id == vote.validator_id:
+                continue
+            self._record_pair(vote.validator_id, other_id, other_type == vote.vote_type)
+            touched.add(other_id)
+        recent.append((vote.validator_id, vote.vote_type))
+
+        if touched:
+            self._refresh_score(vote.validator_id)
+            for other_id in touched:
+                self._refresh_score(other_id)
+
+    def _record_pair(self, a: uuid.UUID, b: uuid.UUID, agreed: bool) -> None:
+        key = _pair_key(a, b)
+        co_votes = self._co_votes.add(key)
+        agreements = self._agreements.add(key, 1 if agreed else 0)
+        for owner, partner in ((a, b), (b, a)):
+            self._update_top(owner, partner, agreed, agreements, co_votes)
+        for listener in self._listeners:
+            listener(a, b, agreed)
+
+    def _update_top(
+        self, owner: uuid.UUID, partner: uuid.UUID, agreed: bool, est_agreements: int, est_co_votes: int
+    ) -> None:
+        top = self._top.setdefault(owner, {})
+        entry = top.get(partner)
+        if entry is not None:
+            entry[0] += 1 if agreed else 0
+            entry[1] += 1
+            return
+        if len(top) < self.top_k:
+            top[partner] = [1 if agreed else 0, 1]
+            return
+        weakest = min(top, key=lambda p: top[p][1])
+        if est_co_votes > top[weakest][1]:
+            del top[weakest]
+            top[partner] = [min(est_agreements, est_co_votes), est_co_votes]
+
+    def _refresh_score(self, validator_id: uuid.UUID) -> None:
+        top = self._top.get(validator_id)
+        if not top:
+            return
+        agreements = 0
+        co_votes = 0
+        for agree, total in top.values():
+            if total >= self.min_co_votes:
+                agreements += agree
+                co_votes += total
+        if co_votes == 0:
+            self._scores.pop(validator_id, None)
+            return
+        excess = (agreements / co_votes - self.baseline) / (1.0 - self.baseline)
+        self._scores[validator_id] = max(0.0, min(1.0, excess))
+
+    # ---- Reads ----
+
+    def score(self, validator_id: uuid.UUID) -> float:
+        """
+        Correlation score in [0, 1]; 0 for validators without enough co-votes.
+        """
+        return self._scores.get(validator_id, 0.0)
+
+    def pair_agreement(self, a: uuid.UUID, b: uuid.UUID) -> Optional[float]:
+        """
+        Agreement rate of a pair from the sketches (upper-biased estimate).
+        """
+        key = _pair_key(a, b)
+        co_votes = self._co_votes.estimate(key)
+        if co_votes == 0:
+            return None
+        return min(1.0, self._agreements.estimate(key) / co_votes)
+
+    def top_partners(self, validator_id: uuid.UUID) -> List[Tuple[uuid.UUID, int, int]]:
+        """
+        (partner, agreements, co_votes) for a validator's tracked co-voters.
+        """
+        top = self._top.get(validator_id, {})
+        return sorted(((p, a, t) for p, (a, t) in top.items()), key=lambda x: -x[2])
+
+
+def _pair_key(a: uuid.UUID, b: uuid.UUID) -> bytes:
+    return a.bytes + b.bytes if a.bytes <= b.bytes else b.bytes + a.bytes
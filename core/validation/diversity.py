@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import math
+import random
 import uuid
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 
 @dataclass
@@ -12,6 +26,9 @@ class ValidatorProfile:
     region: str
 
 
+V = TypeVar("V")
+
+
 def compute_correlation_penalty(correlation: float, *, max_penalty: float = 0.5) -> float:
     """
     Map correlation in [0,1] to a multiplicative penalty in [1-max_penalty, 1].
@@ -26,37 +43,248 @@ def diversity_aware_sample(
     max_same_model_fraction: float = 0.4,
     max_same_region_fraction: float = 0.5,
     target_count: int = 10,
+    weight: Optional[Callable[[ValidatorProfile], float]] = None,
+    seed: int = 0,
 ) -> List[ValidatorProfile]:
     """
-    Simple diversity-aware sampler:
-    - Greedily picks validators while ensuring per-model and per-region caps.
+    Diversity-aware sampler:
+    - Draws validators at random, proportionally to ``weight`` (uniform when
+      omitted), so selection does not depend on iteration order.
+    - At most ``max(1, floor(fraction * target_count))`` picks share a model
+      family or a region.
+    - Draws are reproducible for a given population, weights and ``seed``.
+
+    For repeated sampling over a long-lived population, keep a
+    WeightedValidatorSampler instead of rebuilding one per call.
     """
-    population = list(validators)
-    if not population or target_count <= 0:
+    if target_count <= 0:
         return []
+    sampler: WeightedValidatorSampler[ValidatorProfile] = WeightedValidatorSampler()
+    for v in validators:
+        sampler.upsert(v, weight(v) if weight is not None else 1.0)
+    return sampler.sample(
+        target_count=target_count,
+        max_same_model_fraction=max_same_model_fraction,
+        max_same_region_fraction=max_same_region_fraction,
+        rng=random.Random(seed),
+    )
+
+
+class AliasTable:
+    """
+    Walker alias table (Vose's construction) for O(1) weighted draws.
+    """
+
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        n = len(weights)
+        self.prob = array("d", [0.0]) * n
+        self.alias = array("l", [0]) * n
+        total = math.fsum(weights)
+        if n == 0 or total <= 0:
+            return
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s_i = small.pop()
+            l_i = large[-1]
+            self.prob[s_i] = scaled[s_i]
+            self.alias[s_i] = l_i
+            scaled[l_i] = (scaled[l_i] + scaled[s_i]) - 1.0
+            if scaled[l_i] < 1.0:
+                small.append(large.pop())
+        for i in large:
+            self.prob[i] = 1.0
+            self.alias[i] = i
+        # Leftovers from floating-point drift are certain picks.
+        for i in small:
+            self.prob[i] = 1.0
+            self.alias[i] = i
+
+    def draw(self, rng: random.Random) -> int:
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+@dataclass
+class _WeightedBucket(Generic[V]):
+    members: List[V]
+    weights: array
+    total: float = 0.0
+    table: Optional[AliasTable] = None
+
+
+class WeightedValidatorSampler(Generic[V]):
+    """
+    Influence-weighted sampler with per-model and per-region caps.
+
+    Validators are grouped by (model_family, region); each bucket keeps a
+    Walker alias table over its members' weights. A pick chooses an eligible
+    bucket proportionally to its remaining weight (O(B) over B buckets) and
+    then draws a member in O(1). Picks are without replacement: drawn and
+    excluded members are removed from the bucket's remaining weight for the
+    rest of the sample.
+
+    Weight changes only invalidate the affected bucket; its alias table is
+    rebuilt lazily on the next draw from that bucket. Changes within
+    ``tolerance`` (relative) are ignored to avoid rebuild churn.
+    """
 
-    selected: List[ValidatorProfile] = []
-    model_counts: Dict[str, int] = {}
-    region_counts: Dict[str, int] = {}
+    def __init__(self, *, min_weight: float = 0.0, tolerance: float = 0.0) -> None:
+        self.min_weight = min_weight
+        self.tolerance = tolerance
+        self._buckets: Dict[Tuple[str, str], _WeightedBucket[V]] = {}
+        self._index: Dict[str, Tuple[Tuple[str, str], int]] = {}
 
-    def within_caps(candidate: ValidatorProfile) -> bool:
-        next_total = len(selected) + 1
-        next_model_count = model_counts.get(candidate.model_family, 0) + 1
-        next_region_count = region_counts.get(candidate.region, 0) + 1
+    def __len__(self) -> int:
+        return len(self._index)
 
-        if next_model_count / next_total > max_same_model_fraction:
+    def __contains__(self, validator_id: str) -> bool:
+        return validator_id in self._index
+
+    def weight(self, validator_id: str) -> Optional[float]:
+        loc = self._index.get(validator_id)
+        if loc is None:
+            return None
+        key, pos = loc
+        return self._buckets[key].weights[pos]
+
+    def upsert(self, validator: V, weight: float) -> None:
+        vid = str(validator.id)  # type: ignore[attr-defined]
+        if vid in self._index:
+            self.update_weight(vid, weight)
+            return
+        key = (validator.model_family, validator.region)  # type: ignore[attr-defined]
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _WeightedBucket(members=[], weights=array("d"))
+            self._buckets[key] = bucket
+        weight = max(self.min_weight, weight)
+        self._index[vid] = (key, len(bucket.members))
+        bucket.members.append(validator)
+        bucket.weights.append(weight)
+        bucket.total += weight
+        bucket.table = None
+
+    def update_weight(self, validator_id: str, weight: float) -> bool:
+        """
+        Set a validator's weight; returns False if unknown or within tolerance.
+        """
+        loc = self._index.get(validator_id)
+        if loc is None:
             return False
-        if next_region_count / next_total > max_same_region_fraction:
+        key, pos = loc
+        bucket = self._buckets[key]
+        weight = max(self.min_weight, weight)
+        old = bucket.weights[pos]
+        if abs(weight - old) <= self.tolerance * max(abs(old), 1e-12):
             return False
+        bucket.weights[pos] = weight
+        bucket.total += weight - old
+        bucket.table = None
         return True
 
-    for v in population:
-        if len(selected) >= target_count:
-            break
-        if within_caps(v):
-            selected.append(v)
-            model_counts[v.model_family] = model_counts.get(v.model_family, 0) + 1
-            region_counts[v.region] = region_counts.get(v.region, 0) + 1
+    def remove(self, validator_id: str) -> bool:
+        loc = self._index.pop(validator_id, None)
+        if loc is None:
+            return False
+        key, pos = loc
+        bucket = self._buckets[key]
+        bucket.total -= bucket.weights[pos]
+        last_member = bucket.members.pop()
+        last_weight = bucket.weights.pop()
+        if pos < len(bucket.members):
+            bucket.members[pos] = last_member
+            bucket.weights[pos] = last_weight
+            self._index[str(last_member.id)] = (key, pos)  # type: ignore[attr-defined]
+        bucket.table = None
+        if not bucket.members:
+            del self._buckets[key]
+        return True
+
+    def sample(
+        self,
+        *,
+        target_count: int,
+        max_same_model_fraction: float = 0.4,
+        max_same_region_fraction: float = 0.5,
+        exclude: AbstractSet[str] = frozenset(),
+        rng: Optional[random.Random] = None,
+    ) -> List[V]:
+        if target_count <= 0 or not self._buckets:
+            return []
+        rng = rng or random.Random()
+        model_cap = max(1, int(max_same_model_fraction * target_count))
+        region_cap = max(1, int(max_same_region_fraction * target_count))
+
+        model_counts: Dict[str, int] = {}
+        region_counts: Dict[str, int] = {}
+        taken: Dict[Tuple[str, str], float] = {}
+        seen: Dict[Tuple[str, str], set] = {}
+        exhausted: set = set()
+        selected: List[V] = []
+
+        while len(selected) < target_count:
+            eligible: List[Tuple[Tuple[str, str], float]] = []
+            total = 0.0
+            for key, bucket in self._buckets.items():
+                if key in exhausted:
+                    continue
+                model, region = key
+                if model_counts.get(model, 0) >= model_cap or region_counts.get(region, 0) >= region_cap:
+                    continue
+                remaining = bucket.total - taken.get(key, 0.0)
+                if remaining <= bucket.total * 1e-12:
+                    continue
+                eligible.append((key, remaining))
+                total += remaining
+            if not eligible:
+                break
+
+            point = rng.random() * total
+            for key, remaining in eligible:
+                if point < remaining:
+                    break
+                point -= remaining
+
+            pos = self._draw_from_bucket(key, seen.setdefault(key, set()), rng)
+            if pos is None:
+                exhausted.add(key)
+                continue
+            bucket = self._buckets[key]
+            taken[key] = taken.get(key, 0.0) + bucket.weights[pos]
+            seen[key].add(pos)
+            candidate = bucket.members[pos]
+            if str(candidate.id) in exclude:  # type: ignore[attr-defined]
+                continue
+            selected.append(candidate)
+            model_counts[key[0]] = model_counts.get(key[0], 0) + 1
+            region_counts[key[1]] = region_counts.get(key[1], 0) + 1
+
+        return selected
 
-    return selected
+    def _draw_from_bucket(self, key: Tuple[str, str], seen: set, rng: random.Random) -> Optional[int]:
+        """
+        Draw an unseen member position, or None if the bucket has none left.
+        """
+        bucket = self._buckets[key]
+        if bucket.table is None:
+            bucket.table = AliasTable(bucket.weights)
+        # Rejection is cheap while few members were seen; fall back to an
+        # exact weighted scan when the seen set dominates the bucket.
+        for _ in range(8):
+            pos = bucket.table.draw(rng)
+            if pos not in seen and bucket.weights[pos] > 0:
+                return pos
+        candidates = [i for i in range(len(bucket.members)) if i not in seen and bucket.weights[i] > 0]
+        if not candidates:
+            return None
+        point = rng.random() * math.fsum(bucket.weights[i] for i in candidates)
+        for i in candidates:
+            point -= bucket.weights[i]
+            if point < 0:
+                return i
+        return candidates[-1]
 
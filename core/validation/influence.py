@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Optional
 
 
 @dataclass
@@ -26,6 +27,7 @@ def compute_influence_weight(
     ctx: ValidatorInfluenceContext,
     *,
     max_weight_cap: float = 1e6,
+    stake_cap: Optional[float] = None,
     min_stake: float = 1.0,
     min_reputation: float = 1.0,
     min_diversity: float = 0.2,
@@ -36,9 +38,10 @@ def compute_influence_weight(
 
         IW = log(stake_locked) * sqrt(reputation_score) * diversity_modifier * time_factor
 
-    with caps and floors to enforce constraints.
+    with caps and floors to enforce constraints. Stake is capped at
+    ``stake_cap`` (``max_weight_cap`` when not given).
     """
-    stake = max(min_stake, min(ctx.stake_locked, max_weight_cap))
+    stake = max(min_stake, min(ctx.stake_locked, max_weight_cap if stake_cap is None else stake_cap))
     rep = max(min_reputation, min(ctx.reputation_score, max_weight_cap))
     diversity = max(min_diversity, min(ctx.diversity_modifier, max_diversity))
     t_factor = compute_time_factor(ctx.time_active_days)
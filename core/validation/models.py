@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from typing import List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -20,6 +20,13 @@ class VoteCreateRequest(BaseModel):
     signature: str = Field(..., description="Ed25519 signature encoded as hex over the canonical vote payload")
 
 
+class BatchConsensusRequest(BaseModel):
+    claim_ids: Union[List[uuid.UUID], Literal["all_pending"]] = Field(
+        default="all_pending", description="Claims to evaluate, or \"all_pending\" for every non-finalized claim."
+    )
+    workers: Optional[int] = Field(default=None, ge=1, description="Process pool size; defaults to and is capped at the CPU count.")
+
+
 class VoteResponse(BaseModel):
     id: uuid.UUID
     claim_id: uuid.UUID
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.observability.metrics import (
+    record_consensus_batch,
+    record_consensus_evaluation,
+    update_consensus_queue_depth,
+)
+
+from .models import Vote
+from .session import ValidationSession, ValidationSessionService
+
+
+@dataclass
+class PendingClaim:
+    claim_id: uuid.UUID
+    new_votes: int
+    first_pending_at: float
+    queued: bool = False
+
+
+class ConsensusScheduler:
+    """
+    Background consensus scheduler for the API process.
+
+    Claims with votes that have not yet been evaluated are tracked as pending.
+    A claim becomes due when it has accumulated ``vote_trigger`` new votes or
+    when its oldest pending vote is ``time_trigger_seconds`` old. Each tick
+    evaluates at most ``batch_size`` due claims through
+    ``ValidationSessionService.compute_consensus``, which applies outcomes to
+    the ledger, reputation and stake exactly once per claim.
+
+    Time triggers are kept in a min-heap keyed by deadline so a tick only does
+    work proportional to the number of due claims. Evaluation runs on the
+    event loop, like every other writer of stake and reputation state, and
+    the background task yields between claims so a full batch does not stall
+    request handling.
+    """
+
+    def __init__(
+        self,
+        sessions: ValidationSessionService,
+        *,
+        vote_trigger: int = 5,
+        time_trigger_seconds: float = 30.0,
+        tick_interval: float = 1.0,
+        batch_size: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if vote_trigger < 1:
+            raise ValueError("vote_trigger must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self._sessions = sessions
+        self.vote_trigger = vote_trigger
+        self.time_trigger_seconds = time_trigger_seconds
+        self.tick_interval = tick_interval
+        self.batch_size = batch_size
+        self._clock = clock
+        self._pending: Dict[uuid.UUID, PendingClaim] = {}
+        self._ready: List[uuid.UUID] = []
+        self._deadlines: List[Tuple[float, uuid.UUID]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    # ---- Vote intake ----
+
+    def notify_vote(self, vote: Vote) -> None:
+        """
+        Vote listener: mark the vote's claim as pending evaluation.
+        """
+        claim_id = vote.claim_id
+        if self._sessions.is_finalized(claim_id):
+            return
+        pending = self._pending.get(claim_id)
+        if pending is None:
+            now = self._clock()
+            pending = PendingClaim(claim_id=claim_id, new_votes=0, first_pending_at=now)
+            self._pending[claim_id] = pending
+            heapq.heappush(self._deadlines, (now + self.time_trigger_seconds, claim_id))
+        pending.new_votes += 1
+        if pending.new_votes >= self.vote_trigger:
+            self._enqueue(pending)
+        update_consensus_queue_depth(len(self._pending))
+
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    def _enqueue(self, pending: PendingClaim) -> None:
+        if not pending.queued:
+            pending.queued = True
+            self._ready.append(pending.claim_id)
+
+    def _collect_expired(self, now: float) -> None:
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, claim_id = heapq.heappop(self._deadlines)
+            pending = self._pending.get(claim_id)
+            # Stale heap entries (claim already evaluated and re-armed) are skipped.
+            if pending is None or pending.first_pending_at + self.time_trigger_seconds != deadline:
+                continue
+            self._enqueue(pending)
+
+    # ---- Evaluation ----
+
+    def _next_batch(self) -> List[uuid.UUID]:
+        self._collect_expired(self._clock())
+        batch, self._ready = self._ready[: self.batch_size], self._ready[self.batch_size :]
+        return batch
+
+    def _evaluate(self, claim_id: uuid.UUID) -> Optional[ValidationSession]:
+        if self._pending.pop(claim_id, None) is None:
+            return None
+        started = time.perf_counter()
+        session = self._sessions.compute_consensus(claim_id)
+        record_consensus_evaluation(time.perf_counter() - started)
+        return session
+
+    def _finish_batch(self, batch: List[uuid.UUID]) -> None:
+        if batch:
+            record_consensus_batch(len(batch))
+        update_consensus_queue_depth(len(self._pending))
+
+    def run_once(self) -> List[ValidationSession]:
+        """
+        Evaluate one batch of due claims and return the resulting sessions.
+        """
+        batch = self._next_batch()
+        results: List[ValidationSession] = []
+        for claim_id in batch:
+            session = self._evaluate(claim_id)
+            if session is not None:
+                results.append(session)
+        self._finish_batch(batch)
+        return results
+
+    async def run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            for claim_id in batch:
+                self._evaluate(claim_id)
+                # Let requests and other schedulers run between claims.
+                await asyncio.sleep(0)
+            self._finish_batch(batch)
+            await asyncio.sleep(self.tick_interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+
+@dataclass
+class SequentialDecision:
+    outcome: str
+    confidence: float
+    votes_used: int
+
+
+def regularized_beta(x: float, a: float, b: float) -> float:
+    """
+    Regularized incomplete beta function I_x(a, b) (continued fraction, Lentz).
+    """
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    # The continued fraction converges quickly for x < (a + 1) / (a + b + 2).
+    if x > (a + 1.0) / (a + b + 2.0):
+        return 1.0 - regularized_beta(1.0 - x, b, a)
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    return math.exp(log_front) * _beta_cf(x, a, b) / a
+
+
+def _beta_cf(x: float, a: float, b: float, max_iter: int = 200, eps: float = 1e-12) -> float:
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, max_iter + 1):
+        m2 = 2 * m
+        num = m * (b - m) * x / ((a + m2 - 1.0) * (a + m2))
+        d = 1.0 + num * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + num / c
+        c = c if abs(c) > tiny else tiny
+        result *= d * c
+        num = -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1.0))
+        d = 1.0 + num * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + num / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        result *= delta
+        if abs(delta - 1.0) < eps:
+            break
+    return result
+
+
+def sequential_decide(
+    weighted_votes: Iterable[Tuple[str, float, float]],
+    confidence_threshold: float,
+    error_bound: float,
+    prior: float = 1.0,
+) -> SequentialDecision:
+    """
+    Bayesian sequential test on the influence-weighted approve/reject share.
+
+    ``weighted_votes`` yields (vote_type, influence, confidence) in arrival
+    order and is consumed lazily, so influence is only computed for the
+    votes actually needed. Influence is normalised by its running mean, so
+    each vote contributes at most one pseudo-observation (scaled by its
+    influence relative to the others and by its confidence) to
+    Beta(prior + share, prior + rest) posteriors over the approve and reject
+    shares. Stops with "accepted"/"rejected" as soon as
+    P(share >= confidence_threshold) >= 1 - error_bound; otherwise returns
+    "uncertain" after all votes. The reported confidence is the posterior
+    mean share of the returned side.
+    """
+    if not 0.0 < error_bound < 1.0:
+        raise ValueError("error_bound must be in (0, 1)")
+
+    approve = reject = other = 0.0
+    influence_total = 0.0
+    used = 0
+    approve_mean = reject_mean = 0.0
+    for vote_type, influence, confidence in weighted_votes:
+        used += 1
+        influence_total += influence
+        weight = influence * confidence
+        if vote_type == "approve":
+            approve += weight
+        elif vote_type == "reject":
+            reject += weight
+        else:
+            other += weight
+        if influence_total <= 0.0:
+            continue
+
+        scale = used / influence_total
+        a, r = approve * scale, reject * scale
+        n = (approve + reject + other) * scale
+        approve_mean = (prior + a) / (2 * prior + n)
+        reject_mean = (prior + r) / (2 * prior + n)
+        if 1.0 - regularized_beta(confidence_threshold, prior + a, prior + n - a) >= 1.0 - error_bound:
+            return SequentialDecision("accepted", approve_mean, used)
+        if 1.0 - regularized_beta(confidence_threshold, prior + r, prior + n - r) >= 1.0 - error_bound:
+            return SequentialDecision("rejected", reject_mean, used)
+
+    return SequentialDecision("uncertain", max(approve_mean, reject_mean), used)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import binascii
 import uuid
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List
 
 from core.identity.service import IdentityService
 
@@ -55,7 +55,8 @@ def _verify_signature(public_key_str: str, req: VoteCreateRequest) -> bool:
         vk = VerifyKey(pubkey_bytes)
         vk.verify(message, sig_bytes)
         return True
-    except BadSignatureError:
+    except (BadSignatureError, ValueError):
+        # Malformed keys or signatures (wrong length) are treated as invalid.
         return False
 
 
@@ -69,6 +70,13 @@ class VoteService:
 
     def __init__(self) -> None:
         self._votes_by_claim: Dict[uuid.UUID, List[Vote]] = {}
+        self._listeners: List[Callable[[Vote], None]] = []
+
+    def add_listener(self, listener: Callable[[Vote], None]) -> None:
+        """
+        Register a callback invoked synchronously for every stored vote.
+        """
+        self._listeners.append(listener)
 
     def submit_vote(self, req: VoteCreateRequest, identity: IdentityService) -> VoteResponse:
         pubkey = identity.get_public_key(str(req.validator_id))
@@ -85,8 +93,41 @@ class VoteService:
             signature_valid=signature_valid,
         )
         self._votes_by_claim.setdefault(req.claim_id, []).append(v)
+        for listener in self._listeners:
+            listener(v)
         return VoteResponse(**v.__dict__)
 
+    def add_votes(self, votes: Iterable[Vote]) -> int:
+        """
+        Bulk-load already verified votes (e.g. backfills from storage or peers).
+        """
+        count = 0
+        for v in votes:
+            self._votes_by_claim.setdefault(v.claim_id, []).append(v)
+            for listener in self._listeners:
+                listener(v)
+            count += 1
+        return count
+
     def list_votes_for_claim(self, claim_id: uuid.UUID) -> List[VoteResponse]:
         return [VoteResponse(**v.__dict__) for v in self._votes_by_claim.get(claim_id, [])]
 
+    def raw_votes_for_claim(self, claim_id: uuid.UUID) -> List[Vote]:
+        """
+        Stored votes for a claim without response-model conversion (read-only).
+        """
+        return self._votes_by_claim.get(claim_id, [])
+
+    def vote_count(self, claim_id: uuid.UUID) -> int:
+        """
+        Number of votes stored for a claim. Votes are append-only, so this
+        doubles as a version of the claim's vote set.
+        """
+        return len(self._votes_by_claim.get(claim_id, ()))
+
+    def list_claim_ids(self) -> List[uuid.UUID]:
+        """
+        Claims that have received at least one vote.
+        """
+        return list(self._votes_by_claim.keys())
+
@@ -1,21 +1,58 @@
 from __future__ import annotations
 
+import hashlib
+import random
+import threading
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Literal, Optional
+from typing import Dict, Iterable, List, Literal, Optional, Set, Tuple
 
+from core.governance.models import DEFAULT_PARAMS, GovernanceParams
+from core.governance.service import GovernanceService
+from core.leaderboard.service import LeaderboardService
+from core.ledger.service import LedgerService
+from core.population.service import PopulationAggregates
 from core.reputation.service import ReputationEngine
+from core.stake.models import StakeState
 from core.stake.service import StakeManager
+from core.identity.models import ValidatorIdentity
 from core.identity.service import IdentityService
 
 from .influence import ValidatorInfluenceContext, compute_influence_weight
-from .diversity import diversity_sampler
+from .correlation import VoteCorrelationEngine
+from .diversity import WeightedValidatorSampler, compute_correlation_penalty
 from .models import Vote
+from .sequential import sequential_decide
 from .service import VoteService
 
 
 ConsensusOutcome = Literal["accepted", "rejected", "uncertain"]
+ConsensusMode = Literal["threshold", "sequential"]
+
+
+def decide_outcome(
+    approve_weight: float,
+    reject_weight: float,
+    uncertain_weight: float,
+    confidence_threshold: float,
+) -> Tuple[ConsensusOutcome, float]:
+    """
+    Map influence-weighted vote totals to an outcome and its confidence.
+    """
+    total = approve_weight + reject_weight + uncertain_weight
+    if total <= 0:
+        return "uncertain", 0.0
+
+    approve_frac = approve_weight / total
+    reject_frac = reject_weight / total
+
+    if approve_frac >= confidence_threshold:
+        return "accepted", approve_frac
+    elif reject_frac >= confidence_threshold:
+        return "rejected", reject_frac
+    else:
+        return "uncertain", max(approve_frac, reject_frac)
 
 
 @dataclass
@@ -26,6 +63,11 @@ class ValidationSession:
     outcome: Optional[ConsensusOutcome] = None
     confidence: float = 0.0
     validators_sampled: List[str] = None
+    finalized: bool = False
+    sampled_ids: Set[str] = field(default_factory=set)
+    votes_used: int = 0
+    votes_saved: int = 0
+    params_version: Optional[int] = None
 
 
 class ValidationSessionService:
@@ -37,6 +79,19 @@ class ValidationSessionService:
     - Diversity-aware validator selection
     - Influence-weighted consensus calculation
     - Automatic reputation and stake updates
+
+    A session is finalized the first time it reaches an accepted/rejected
+    outcome; ledger, reputation and stake updates are applied exactly once at
+    that point and later evaluations return the finalized session unchanged.
+
+    With ``consensus_mode="sequential"`` a claim is decided by a Bayesian
+    sequential test over votes in arrival order (see ``sequential_decide``)
+    and finalized as soon as the posterior error bound is met, instead of
+    requiring the full weighted share to clear ``confidence_threshold``.
+
+    Influence caps and sampling diversity caps come from the governance
+    params snapshot. Each evaluation loads the snapshot once and uses it
+    throughout, and records its version on the session.
     """
 
     def __init__(
@@ -48,88 +103,244 @@ class ValidationSessionService:
         max_rounds: int = 3,
         confidence_threshold: float = 0.6,
         sample_size: int = 20,
+        ledger: Optional[LedgerService] = None,
+        sampling_seed: int = 0,
+        min_sample_weight: float = 0.01,
+        sample_weight_tolerance: float = 0.05,
+        correlation: Optional[VoteCorrelationEngine] = None,
+        consensus_mode: ConsensusMode = "threshold",
+        sequential_error_bound: float = 0.05,
+        leaderboards: Optional[LeaderboardService] = None,
+        population: Optional[PopulationAggregates] = None,
+        governance: Optional[GovernanceService] = None,
     ) -> None:
+        if consensus_mode not in ("threshold", "sequential"):
+            raise ValueError(f"unknown consensus_mode: {consensus_mode}")
         self._votes = votes
         self._stake = stake
         self._reputation = reputation
         self._identity = identity
+        self._ledger = ledger
+        self._sampling_seed = sampling_seed
+        self._correlation = correlation
+        self._leaderboards = leaderboards
+        self._population = population
+        self._governance = governance
         self._max_rounds = max_rounds
         self._confidence_threshold = confidence_threshold
         self._sample_size = sample_size
+        self._consensus_mode = consensus_mode
+        self._sequential_error_bound = sequential_error_bound
         self._sessions: Dict[uuid.UUID, ValidationSession] = {}
+        # Evaluations and listener updates run on the event loop; the lock
+        # keeps direct callers from other threads (scripts, replays) safe.
+        self._lock = threading.RLock()
+
+        # Influence-weighted sampling tables, kept in sync with the identity
+        # registry. The floor keeps validators without stake sampleable.
+        # Influence is re-read on every stake, reputation and decay change;
+        # drifts within the relative tolerance keep the stored weight, so a
+        # bucket's alias table is only rebuilt once some member has moved by
+        # more than that.
+        self._sampler: WeightedValidatorSampler[ValidatorIdentity] = WeightedValidatorSampler(
+            min_weight=min_sample_weight, tolerance=sample_weight_tolerance
+        )
+        for validator in identity.active_identities():
+            self._on_identity_change(validator)
+        identity.add_listener(self._on_identity_change)
+        stake.add_listener(self._on_stake_change)
+
+    def params(self) -> GovernanceParams:
+        """
+        Current governance params snapshot.
+        """
+        return self._governance.get_params() if self._governance is not None else DEFAULT_PARAMS
 
-    def _get_or_create_session(self, claim_id: uuid.UUID) -> ValidationSession:
+    def _get_or_create_session(self, claim_id: uuid.UUID, params: GovernanceParams) -> ValidationSession:
         if claim_id not in self._sessions:
-            self._sessions[claim_id] = ValidationSession(
+            session = ValidationSession(
                 claim_id=claim_id,
                 created_at=datetime.now(timezone.utc),
                 round=1,
                 validators_sampled=[],
             )
+            self._record_sample(session, params)
+            self._sessions[claim_id] = session
         return self._sessions[claim_id]
 
+    @property
+    def confidence_threshold(self) -> float:
+        return self._confidence_threshold
+
+    def get_session(self, claim_id: uuid.UUID) -> Optional[ValidationSession]:
+        return self._sessions.get(claim_id)
+
+    def is_finalized(self, claim_id: uuid.UUID) -> bool:
+        session = self._sessions.get(claim_id)
+        return bool(session and session.finalized)
+
     def compute_consensus(self, claim_id: uuid.UUID) -> ValidationSession:
         """
-        Compute multi-round, influence-weighted consensus for a claim.
+        Evaluate one round of influence-weighted consensus for a claim.
 
         Features:
         - Multi-round sampling with up to 3 rounds
         - Diversity-aware validator selection
         - Influence-weighted voting
         - Automatic reputation and stake updates
+
+        Each evaluation that does not reach the confidence threshold advances
+        the session by one round (capped at ``max_rounds``) so that later
+        evaluations can still finalize the claim as more votes arrive.
         """
-        session = self._get_or_create_session(claim_id)
-        
-        # Run multi-round consensus
-        while session.round <= self._max_rounds:
-            # Sample validators for this round
-            validators = self._sample_validators(session)
-            session.validators_sampled.extend(validators)
-            
-            # Get votes for this claim
-            votes = self._votes.list_votes_for_claim(claim_id)
-            
-            # Compute influence-weighted consensus
-            outcome, confidence = self._compute_round_consensus(votes)
-            
-            # Check if we have sufficient confidence
-            if confidence >= self._confidence_threshold:
-                session.outcome = outcome
-                session.confidence = confidence
-                self._apply_outcome_updates(claim_id, outcome, votes)
-                return session
-            
-            # Move to next round
-            session.round += 1
-        
-        # If we didn't reach sufficient confidence after all rounds
+        with self._lock:
+            return self._compute_consensus(claim_id)
+
+    def _compute_consensus(self, claim_id: uuid.UUID) -> ValidationSession:
+        params = self.params()
+        session = self._get_or_create_session(claim_id, params)
+        if session.finalized:
+            return session
+        session.params_version = params.version
+
+        from core.observability.metrics import record_consensus_votes_saved
+
+        votes = self._votes.list_votes_for_claim(claim_id)
+        valid_count = sum(1 for v in votes if v.signature_valid)
+        if self._consensus_mode == "sequential":
+            outcome, confidence, session.votes_used = self._compute_sequential_consensus(
+                [v for v in votes if v.signature_valid], params
+            )
+            decided = outcome != "uncertain"
+        else:
+            outcome, confidence = self._compute_round_consensus(votes, params)
+            session.votes_used = valid_count
+            decided = confidence >= self._confidence_threshold and outcome != "uncertain"
+
+        if decided:
+            if self._consensus_mode == "sequential":
+                # Votes the early stop did not need: already cast but never
+                # weighed, or sampled validators that have yet to vote.
+                session.votes_saved = max(valid_count, len(session.validators_sampled)) - session.votes_used
+                record_consensus_votes_saved(session.votes_saved)
+            self._finalize(session, outcome, confidence, votes, params)
+            if self._ledger is not None:
+                self._ledger.apply_consensus(claim_id, outcome, confidence)
+            return session
+
         session.outcome = "uncertain"
-        session.confidence = 0.5
+        session.confidence = confidence
+        if session.round < self._max_rounds:
+            session.round += 1
+            self._record_sample(session, params)
         return session
 
-    def _sample_validators(self, session: ValidationSession) -> List[str]:
+    def _finalize(
+        self,
+        session: ValidationSession,
+        outcome: ConsensusOutcome,
+        confidence: float,
+        votes: List[Vote],
+        params: GovernanceParams,
+    ) -> None:
+        """
+        Record a strong outcome and apply its reputation and stake side effects.
+
+        Callers are responsible for the matching ledger update so that batch
+        callers can append all ledger versions under a single Merkle recompute.
+        """
+        from core.observability.metrics import record_consensus
+
+        session.outcome = outcome
+        session.confidence = confidence
+        session.finalized = True
+        self._apply_outcome_updates(session.claim_id, outcome, votes, params)
+        record_consensus(outcome=outcome, rounds=session.round, confidence=confidence)
+
+    def finalize_outcomes(
+        self,
+        outcomes: Iterable[Tuple[uuid.UUID, ConsensusOutcome, float]],
+        params: Optional[GovernanceParams] = None,
+    ) -> List[ValidationSession]:
+        """
+        Finalize many externally computed outcomes (e.g. from batch evaluation).
+
+        Claims that are already finalized are skipped, so outcomes are still
+        applied exactly once. Ledger versions for the whole batch are appended
+        with a single Merkle root recompute. ``params`` should be the snapshot
+        the outcomes were computed with (the current one if omitted).
+        """
+        with self._lock:
+            return self._finalize_outcomes(outcomes, params or self.params())
+
+    def _finalize_outcomes(
+        self, outcomes: Iterable[Tuple[uuid.UUID, ConsensusOutcome, float]], params: GovernanceParams
+    ) -> List[ValidationSession]:
+        finalized: List[ValidationSession] = []
+        ledger_updates: List[Tuple[uuid.UUID, str, float]] = []
+        for claim_id, outcome, confidence in outcomes:
+            if outcome == "uncertain":
+                continue
+            session = self._get_or_create_session(claim_id, params)
+            if session.finalized:
+                continue
+            session.params_version = params.version
+            votes = self._votes.list_votes_for_claim(claim_id)
+            self._finalize(session, outcome, confidence, votes, params)
+            ledger_updates.append((claim_id, outcome, confidence))
+            finalized.append(session)
+        if self._ledger is not None and ledger_updates:
+            self._ledger.apply_consensus_batch(ledger_updates)
+        return finalized
+
+    def _on_identity_change(self, validator: ValidatorIdentity) -> None:
+        with self._lock:
+            if validator.is_active:
+                now = datetime.now(timezone.utc)
+                self._sampler.upsert(validator, self._compute_influence(validator.id, now))
+            else:
+                self._sampler.remove(str(validator.id))
+
+    def _on_stake_change(self, state: StakeState) -> None:
+        # Keep sampling weights and influence aggregates current when
+        # stake is locked, decayed or slashed outside of an evaluation.
+        if self._identity.get_validator(str(state.validator_id)) is not None:
+            self.influence_for_validator(state.validator_id, datetime.now(timezone.utc))
+
+    def _sampling_rng(self, session: ValidationSession) -> random.Random:
+        """
+        Deterministic RNG per (sampling_seed, claim, round) so that audits can
+        reproduce a round's sample from the same registry and weights.
+        """
+        material = f"{self._sampling_seed}:{session.claim_id}:{session.round}".encode("utf-8")
+        return random.Random(int.from_bytes(hashlib.sha256(material).digest()[:8], "big"))
+
+    def _record_sample(self, session: ValidationSession, params: GovernanceParams) -> None:
+        sampled = self._sample_validators(session, params)
+        session.validators_sampled.extend(sampled)
+        session.sampled_ids.update(sampled)
+
+    def _sample_validators(self, session: ValidationSession, params: GovernanceParams) -> List[str]:
         """
         Sample validators with diversity constraints.
+
+        Draws by influence weight from per-(model_family, region) alias
+        tables, excluding validators sampled in earlier rounds, so the cost
+        depends on the sample size rather than the validator population.
         """
-        all_validators = self._identity.list_validators()
-        
-        # Exclude already sampled validators
-        available_validators = [
-            v for v in all_validators 
-            if str(v.id) not in session.validators_sampled
-        ]
-        
-        # Apply diversity sampling
-        sampled_validators = diversity_sampler(
-            available_validators,
-            self._sample_size,
-            max_model_family_fraction=0.3,
-            max_region_fraction=0.4
+        sampled_validators = self._sampler.sample(
+            target_count=self._sample_size,
+            max_same_model_fraction=params.diversity_model_cap,
+            max_same_region_fraction=params.diversity_region_cap,
+            exclude=session.sampled_ids,
+            rng=self._sampling_rng(session),
         )
         
         return [str(v.id) for v in sampled_validators]
 
-    def _compute_round_consensus(self, votes: List[Vote]) -> tuple[ConsensusOutcome, float]:
+    def _compute_round_consensus(
+        self, votes: List[Vote], params: GovernanceParams
+    ) -> tuple[ConsensusOutcome, float]:
         """
         Compute influence-weighted consensus for current votes.
         """
@@ -142,7 +353,7 @@ class ValidationSessionService:
             if not v.signature_valid:
                 continue
 
-            iw = self._influence_for_vote(v, now)
+            iw = self._influence_for_vote(v, now, params)
             if v.vote_type == "approve":
                 approve_weight += iw * v.confidence
             elif v.vote_type == "reject":
@@ -150,154 +361,146 @@ class ValidationSessionService:
             else:
                 uncertain_weight += iw * v.confidence
 
-        total = approve_weight + reject_weight + uncertain_weight
-        if total <= 0:
-            return "uncertain", 0.0
-
-        approve_frac = approve_weight / total
-        reject_frac = reject_weight / total
+        return decide_outcome(approve_weight, reject_weight, uncertain_weight, self._confidence_threshold)
 
-        if approve_frac >= self._confidence_threshold:
-            return "accepted", approve_frac
-        elif reject_frac >= self._confidence_threshold:
-            return "rejected", reject_frac
-        else:
-            return "uncertain", max(approve_frac, reject_frac)
+    def _compute_sequential_consensus(
+        self, votes: List[Vote], params: GovernanceParams
+    ) -> Tuple[ConsensusOutcome, float, int]:
+        """
+        Sequential-test consensus over valid votes in arrival order; influence
+        is computed only for the votes consumed before the test stops.
+        """
+        now = datetime.now(timezone.utc)
+        weighted = ((v.vote_type, self._influence_for_vote(v, now, params), v.confidence) for v in votes)
+        decision = sequential_decide(weighted, self._confidence_threshold, self._sequential_error_bound)
+        return decision.outcome, decision.confidence, decision.votes_used
 
-    def _apply_outcome_updates(self, claim_id: uuid.UUID, outcome: ConsensusOutcome, votes: List[Vote]):
+    def _apply_outcome_updates(
+        self,
+        claim_id: uuid.UUID,
+        outcome: ConsensusOutcome,
+        votes: List[Vote],
+        params: Optional[GovernanceParams] = None,
+    ):
         """
         Apply automatic reputation and stake updates based on consensus outcome.
+
+        Votes are classified in a single pass; the minority flag is decided
+        once from the approve/reject head counts (the winning side was the
+        minority if it won on influence despite fewer votes). Reputation and
+        stake changes are then applied as one batch each at a shared
+        timestamp, and metrics are flushed once for the whole outcome.
         """
-        from core.reputation.models import ReputationUpdateRequest
-        from core.stake.models import StakeUpdateRequest
-        from core.observability.metrics import record_consensus, record_slashing, update_validator_metrics
+        from core.observability.metrics import record_slashing_batch, update_validator_metrics_batch
+
+        params = params or self.params()
+        winning_type = "approve" if outcome == "accepted" else "reject"
+        approve_count = 0
+        reject_count = 0
+        correct_ids: List[uuid.UUID] = []
+        incorrect_ids: List[uuid.UUID] = []
+        voter_ids: Dict[uuid.UUID, None] = {}
 
-        # First, determine which votes were correct
-        correct_votes = []
-        incorrect_votes = []
-        
         for v in votes:
-            if not v.signature_valid or v.vote_type == "uncertain":
+            if not v.signature_valid:
                 continue
-                
-            is_correct = (v.vote_type == "approve" and outcome == "accepted") or \
-                       (v.vote_type == "reject" and outcome == "rejected")
-            
-            if is_correct:
-                correct_votes.append(v)
+            voter_ids[v.validator_id] = None
+            if v.vote_type == "uncertain":
+                continue
+            if v.vote_type == "approve":
+                approve_count += 1
             else:
-                incorrect_votes.append(v)
-        
-        # Apply reputation updates
-        for v in correct_votes:
-            req = ReputationUpdateRequest(
-                validator_id=v.validator_id,
-                was_correct=True,
-                was_minority=self._is_minority_vote(v, votes, outcome)
-            )
-            self._reputation.apply_outcome(req)
-            
-        for v in incorrect_votes:
-            req = ReputationUpdateRequest(
-                validator_id=v.validator_id,
-                was_correct=False,
-                was_minority=False
-            )
-            self._reputation.apply_outcome(req)
-        
-        # Apply stake updates (for slashing)
-        for v in incorrect_votes:
-            # Slash stake for incorrect votes
-            req = StakeUpdateRequest(
-                validator_id=v.validator_id,
-                amount=-0.1  # Slash 10% of stake for incorrect votes
-            )
-            self._stake.apply_update(req)
-            
-            # Record slashing event
-            record_slashing(
-                validator_id=str(v.validator_id),
-                amount=0.1,
-                reason="incorrect_vote"
-            )
-        
+                reject_count += 1
+            if v.vote_type == winning_type:
+                correct_ids.append(v.validator_id)
+            else:
+                incorrect_ids.append(v.validator_id)
+
+        if outcome == "accepted":
+            was_minority = approve_count < reject_count
+        else:
+            was_minority = reject_count < approve_count
+
+        now = datetime.now(timezone.utc)
+        self._reputation.apply_outcomes(
+            [(vid, True, was_minority) for vid in correct_ids]
+            + [(vid, False, False) for vid in incorrect_ids],
+            now,
+        )
+        # Slash 10% of stake for incorrect votes
+        slashed = self._stake.slash_many(incorrect_ids, fraction=0.1, reason="incorrect_vote", now=now)
+
         # Update validator metrics after outcome
-        for v in votes:
-            if not v.signature_valid:
-                continue
-                
-            # Get current validator state
-            stake_state = self._stake.get_state(v.validator_id)
-            rep_state = self._reputation.get_state(v.validator_id)
-            
-            # Calculate current influence
-            from core.validation.influence import ValidatorInfluenceContext, compute_influence_weight
-            from datetime import datetime, timezone
-            
-            now = datetime.now(timezone.utc)
-            time_active_days = (now - rep_state.last_updated).total_seconds() / 86400.0
-            
-            validator = self._identity.get_validator(str(v.validator_id))
-            diversity_modifier = self._compute_diversity_modifier(validator)
-            
-            ctx = ValidatorInfluenceContext(
-                stake_locked=stake_state.effective_stake,
-                reputation_score=rep_state.score,
-                diversity_modifier=diversity_modifier,
-                time_active_days=time_active_days
-            )
-            
-            influence = compute_influence_weight(ctx)
-            
-            # Update metrics
-            update_validator_metrics(
-                validator_id=str(v.validator_id),
-                influence=influence,
-                stake=stake_state.effective_stake,
-                reputation=rep_state.score
+        rows = []
+        for validator_id in voter_ids:
+            influence = self._compute_influence(validator_id, now, params)
+            if self._leaderboards is not None:
+                self._leaderboards.record_influence(validator_id, influence)
+            if self._population is not None:
+                self._population.record_influence(validator_id, influence)
+            rows.append(
+                (
+                    str(validator_id),
+                    influence,
+                    self._stake.effective_stake(validator_id, now),
+                    self._reputation.score(validator_id, now),
+                )
             )
+        record_slashing_batch(len(slashed), reason="incorrect_vote")
+        update_validator_metrics_batch(rows)
+
+    def _influence_for_vote(self, v: Vote, now: datetime, params: GovernanceParams) -> float:
+        return self.influence_for_validator(v.validator_id, now, params)
 
-    def _is_minority_vote(self, vote: Vote, all_votes: List[Vote], outcome: ConsensusOutcome) -> bool:
+    def influence_for_validator(
+        self, validator_id: uuid.UUID, now: datetime, params: Optional[GovernanceParams] = None
+    ) -> float:
         """
-        Determine if a vote was a minority correct vote.
+        Current influence weight; also refreshes the validator's sampling weight.
         """
-        if not (vote.vote_type == "approve" and outcome == "accepted" or 
-                vote.vote_type == "reject" and outcome == "rejected"):
-            return False
-            
-        # Count votes
-        approve_count = sum(1 for v in all_votes if v.vote_type == "approve" and v.signature_valid)
-        reject_count = sum(1 for v in all_votes if v.vote_type == "reject" and v.signature_valid)
-        
-        # Determine if vote type was minority
-        if outcome == "accepted":
-            return reject_count < approve_count and vote.vote_type == "reject"
-        else:
-            return approve_count < reject_count and vote.vote_type == "approve"
+        iw = self._compute_influence(validator_id, now, params)
+        with self._lock:
+            self._sampler.update_weight(str(validator_id), iw)
+            if self._leaderboards is not None:
+                self._leaderboards.record_influence(validator_id, iw)
+            if self._population is not None:
+                self._population.record_influence(validator_id, iw)
+        return iw
+
+    def _compute_influence(
+        self, validator_id: uuid.UUID, now: datetime, params: Optional[GovernanceParams] = None
+    ) -> float:
+        params = params or self.params()
+        return compute_influence_weight(
+            self.influence_context(validator_id, now),
+            max_weight_cap=params.max_influence_weight,
+            stake_cap=params.stake_cap,
+        )
 
-    def _influence_for_vote(self, v: Vote, now: datetime) -> float:
+    def influence_context(self, validator_id: uuid.UUID, now: datetime) -> ValidatorInfluenceContext:
+        """
+        The parameter-independent inputs of a validator's influence weight.
+        """
         # Stake
-        stake_state = self._stake.get_state(v.validator_id)
-        stake_locked = stake_state.effective_stake if stake_state else 1.0
+        stake_locked = self._stake.effective_stake(validator_id, now)
 
         # Reputation
-        rep_state = self._reputation.get_state(v.validator_id)
+        rep_state = self._reputation.get_state(validator_id)
         reputation_score = rep_state.score
 
         # Time active: approximate as days since we first saw the validator.
         time_active_days = (now - rep_state.last_updated).total_seconds() / 86400.0
 
         # Diversity modifier
-        validator = self._identity.get_validator(str(v.validator_id))
+        validator = self._identity.get_validator(str(validator_id))
         diversity_modifier = self._compute_diversity_modifier(validator)
 
-        ctx = ValidatorInfluenceContext(
+        return ValidatorInfluenceContext(
             stake_locked=stake_locked,
             reputation_score=reputation_score,
             diversity_modifier=diversity_modifier,
             time_active_days=max(0.0, time_active_days),
         )
-        return compute_influence_weight(ctx)
 
     def _compute_diversity_modifier(self, validator) -> float:
         """
@@ -307,6 +510,10 @@ class ValidationSessionService:
             return 1.0
             
         # For now, use a simple diversity modifier based on model family and region
-        # In production, this should use Neo4j correlation data
-        return 0.8 + (hash(validator.model_family + validator.region) % 40) / 100.0
+        modifier = 0.8 + (hash(validator.model_family + validator.region) % 40) / 100.0
+
+        # Penalize validators whose votes track their co-voters too closely.
+        if self._correlation is not None:
+            modifier *= compute_correlation_penalty(self._correlation.score(validator.id))
+        return modifier
 
@@ -0,0 +1,137 @@
+"""
+Benchmark streaming collusion detection on a synthetic vote stream.
+
+Streams --votes votes (honest validators voting at random on rolling claims,
+plus planted blocs that start voting together at staggered times) through
+CollusionDetector. Reports per-vote ingest latency, how long after its
+onset each bloc was flagged (stream time and votes), and any honest
+validators flagged.
+
+Usage:
+    python -m load.bench_collusion --votes 1000000 --validators 20000 --blocs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from core.audit.collusion import CollusionDetector
+from core.audit.service import AuditEngine
+from core.validation.models import Vote
+
+
+class Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--votes", type=int, default=1_000_000)
+    parser.add_argument("--validators", type=int, default=20_000)
+    parser.add_argument("--blocs", type=int, default=20)
+    parser.add_argument("--bloc-size", type=int, default=6)
+    parser.add_argument("--votes-per-claim", type=int, default=10)
+    parser.add_argument("--open-claims", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    clock = Clock(start)
+    audit = AuditEngine(clock=clock, max_anomalies=100_000)
+    detector = CollusionDetector(audit, clock=clock)
+
+    honest = [uuid.uuid4() for _ in range(args.validators)]
+    blocs = [[uuid.uuid4() for _ in range(args.bloc_size)] for _ in range(args.blocs)]
+    bloc_of: Dict[uuid.UUID, int] = {m: i for i, bloc in enumerate(blocs) for m in bloc}
+    # Blocs start over the first half of the stream and then join about one claim in 500.
+    onsets = sorted(rng.randrange(args.votes // 2) for _ in blocs)
+    onset_at: List[datetime] = [start] * len(blocs)
+    onset_vote: List[int] = [0] * len(blocs)
+    flagged_at: Dict[int, datetime] = {}
+    flagged_vote: Dict[int, int] = {}
+
+    claims = [[uuid.uuid4(), 0] for _ in range(args.open_claims)]
+    latencies: List[float] = []
+    ts = start
+    sent = 0
+    checked = ts
+    t_start = time.perf_counter()
+    while sent < args.votes:
+        slot = rng.randrange(len(claims))
+        claim = claims[slot]
+        batch = []
+        active = [i for i, onset in enumerate(onsets) if onset <= sent]
+        if active and rng.random() < 0.002 * len(active):
+            b = rng.choice(active)
+            if onset_vote[b] == 0:
+                onset_vote[b], onset_at[b] = sent, ts
+            vote_type = rng.choice(("approve", "reject"))
+            batch = [(member, vote_type) for member in blocs[b]]
+        else:
+            batch = [(rng.choice(honest), "approve" if rng.random() < 0.7 else "reject")]
+        for validator_id, vote_type in batch:
+            ts += timedelta(seconds=0.1)
+            clock.now = ts
+            v = Vote(
+                id=uuid.uuid4(),
+                claim_id=claim[0],
+                validator_id=validator_id,
+                vote_type=vote_type,
+                confidence=0.9,
+                timestamp=ts,
+                signature="",
+                signature_valid=True,
+            )
+            t0 = time.perf_counter()
+            detector.observe_vote(v)
+            latencies.append(time.perf_counter() - t0)
+            sent += 1
+        claim[1] += len(batch)
+        if claim[1] >= args.votes_per_claim:
+            claims[slot] = [uuid.uuid4(), 0]
+
+        for anomaly in audit.get_recent_anomalies(since=checked):
+            b = bloc_of.get(uuid.UUID(anomaly.validator_id))
+            if b is not None and b not in flagged_at:
+                flagged_at[b], flagged_vote[b] = ts, sent
+        checked = ts + timedelta(microseconds=1)
+
+    elapsed = time.perf_counter() - t_start
+    latencies.sort()
+    honest_flagged = {a.validator_id for a in audit.get_recent_anomalies()} - {str(m) for m in bloc_of}
+    print(
+        f"{sent:,} votes in {elapsed:.1f}s ({sent / sum(latencies):,.0f} votes/s in the detector), "
+        f"{detector.edge_count():,} edges"
+    )
+    print(
+        f"ingest latency  p50={percentile(latencies, 0.5) * 1e6:.1f}us  p99={percentile(latencies, 0.99) * 1e6:.1f}us  "
+        f"max={latencies[-1] * 1e3:.2f}ms"
+    )
+    delays = sorted((flagged_at[b] - onset_at[b]).total_seconds() for b in flagged_at)
+    votes_to_flag = sorted(flagged_vote[b] - onset_vote[b] for b in flagged_at)
+    if delays:
+        print(
+            f"blocs flagged {len(flagged_at)}/{len(blocs)}  detection delay p50={percentile(delays, 0.5):.0f}s "
+            f"max={delays[-1]:.0f}s of stream time, p50={percentile(votes_to_flag, 0.5):,} votes after onset"
+        )
+    else:
+        print(f"blocs flagged 0/{len(blocs)}")
+    print(f"honest validators flagged: {len(honest_flagged)}")
+
+
+if __name__ == "__main__":
+    main()
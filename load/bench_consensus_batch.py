@@ -0,0 +1,100 @@
+"""
+Benchmark batch consensus evaluation across a process pool.
+
+Builds an in-memory network with synthetic claims and votes and times
+BatchConsensusEvaluator.evaluate (dry run, no write-back) for worker counts
+from 1 up to the number of CPUs.
+
+Usage:
+    python -m load.bench_consensus_batch --claims 100000 --votes-per-claim 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLockRequest
+from core.stake.service import StakeManager
+from core.validation.batch import BatchConsensusEvaluator
+from core.validation.models import Vote
+from core.validation.service import VoteService
+from core.validation.session import ValidationSessionService
+
+
+def build(claims: int, votes_per_claim: int, validators: int, seed: int) -> BatchConsensusEvaluator:
+    rng = random.Random(seed)
+    identity = IdentityService()
+    stake = StakeManager()
+    votes = VoteService()
+    sessions = ValidationSessionService(votes=votes, stake=stake, reputation=ReputationEngine(), identity=identity)
+
+    lock_until = datetime.now(timezone.utc) + timedelta(days=365)
+    validator_ids = []
+    for i in range(validators):
+        v = identity.register_validator(
+            ValidatorRegistrationRequest(public_key="", model_family=f"model{i % 7}", region=f"region{i % 5}")
+        )
+        stake.lock_stake(StakeLockRequest(validator_id=v.id, amount=rng.uniform(10, 10_000), lock_until=lock_until))
+        validator_ids.append(v.id)
+
+    now = datetime.now(timezone.utc)
+    vote_types = ("approve", "approve", "approve", "reject", "uncertain")
+
+    def synthetic_votes():
+        for _ in range(claims):
+            claim_id = uuid.uuid4()
+            for vid in rng.sample(validator_ids, votes_per_claim):
+                yield Vote(
+                    id=uuid.uuid4(),
+                    claim_id=claim_id,
+                    validator_id=vid,
+                    vote_type=rng.choice(vote_types),
+                    confidence=rng.random(),
+                    timestamp=now,
+                    signature="",
+                    signature_valid=True,
+                )
+
+    votes.add_votes(synthetic_votes())
+    return BatchConsensusEvaluator(sessions, votes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--claims", type=int, default=100_000)
+    parser.add_argument("--votes-per-claim", type=int, default=10)
+    parser.add_argument("--validators", type=int, default=2_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    evaluator = build(args.claims, args.votes_per_claim, args.validators, args.seed)
+    evaluator.max_workers = args.max_workers
+    claim_ids = evaluator.pending_claim_ids()
+    print(f"built {len(claim_ids)} claims x {args.votes_per_claim} votes in {time.perf_counter() - t0:.2f}s")
+
+    workers = 1
+    baseline = None
+    while workers <= args.max_workers:
+        t0 = time.perf_counter()
+        evaluator.evaluate(claim_ids, workers=workers, apply=False)
+        elapsed = time.perf_counter() - t0
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:<3d} {elapsed:8.3f}s  "
+            f"{len(claim_ids) / elapsed:12.0f} claims/s  speedup={baseline / elapsed:5.2f}x"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Soak the gossip seen-message cache and report memory as traffic grows.
+
+Feeds --messages synthetic message ids through a SeenMessageCache at a
+simulated --rate messages per second; a --duplicate-rate share of them
+re-sends a recent id, as peers echoing gossip would. Every --report-every
+messages it prints throughput, resident memory, cache size and hit counts.
+Memory should stay flat once the LRU and both Bloom generations are full.
+
+Usage:
+    python -m load.bench_gossip_dedup --messages 100000000 --rate 20000 --duplicate-rate 0.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import time
+
+from core.hub.dedup import SeenMessageCache
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize() / 2**20
+    except OSError:
+        # Peak rather than current RSS where /proc is unavailable.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=100_000_000)
+    parser.add_argument("--rate", type=float, default=20_000.0, help="simulated messages per second")
+    parser.add_argument("--duplicate-rate", type=float, default=0.3)
+    parser.add_argument("--max-entries", type=int, default=100_000)
+    parser.add_argument("--ttl", type=float, default=600.0)
+    parser.add_argument("--bloom-capacity", type=int, default=1_000_000)
+    parser.add_argument("--false-positive-rate", type=float, default=1e-6)
+    parser.add_argument("--report-every", type=int, default=10_000_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    clock_now = [0.0]
+    cache = SeenMessageCache(
+        max_entries=args.max_entries,
+        ttl_seconds=args.ttl,
+        bloom_capacity=args.bloom_capacity,
+        false_positive_rate=args.false_positive_rate,
+        clock=lambda: clock_now[0],
+    )
+    print(f"bloom filters: {cache.memory_bytes() / 2**20:.1f} MB, start rss {rss_mb():.1f} MB")
+
+    step = 1.0 / args.rate
+    recent = [""] * 1024
+    fresh = 0
+    false_positives = 0
+    started = last = time.perf_counter()
+    for i in range(1, args.messages + 1):
+        clock_now[0] += step
+        if fresh and rng.random() < args.duplicate_rate:
+            cache.check_and_add(recent[rng.randrange(min(fresh, 1024))])
+        else:
+            message_id = f"m{fresh:x}"
+            recent[fresh & 1023] = message_id
+            fresh += 1
+            false_positives += cache.check_and_add(message_id)
+        if i % args.report_every == 0:
+            now = time.perf_counter()
+            stats = cache.stats()
+            print(
+                f"{i:>12,} msgs  {args.report_every / (now - last):>9,.0f} msg/s  rss {rss_mb():7.1f} MB  "
+                f"lru {stats['entries']:,}  hits lru/bloom {stats['lru_hits']:,}/{stats['bloom_hits']:,}  "
+                f"evictions {stats['evictions']}  false positives {false_positives}"
+            )
+            last = now
+    elapsed = time.perf_counter() - started
+    print(
+        f"{args.messages:,} messages in {elapsed:.1f}s; "
+        f"observed false-positive rate {false_positives / max(fresh, 1):.2e} "
+        f"(budget {args.false_positive_rate:.0e})"
+    )
+
+
+if __name__ == "__main__":
+    main()
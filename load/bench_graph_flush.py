@@ -0,0 +1,56 @@
+"""
+Benchmark correlation graph writer buffering and flush throughput.
+
+Records --pairs synthetic co-vote pairs among --validators validators into a
+CorrelationGraphWriter and times flush_all for each batch size. The
+in-memory backend is used unless --neo4j is given, in which case rows are
+written to the server at NEO4J_URI (NEO4J_USER / NEO4J_PASSWORD).
+
+Usage:
+    python -m load.bench_graph_flush --pairs 1000000 --validators 10000 --batch-sizes 1000 5000 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+
+from core.neo4j.client import get_neo4j_driver
+from core.neo4j.graph import InMemoryGraphBackend, Neo4jGraphBackend
+from core.neo4j.writer import CorrelationGraphWriter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pairs", type=int, default=1_000_000)
+    parser.add_argument("--validators", type=int, default=10_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1_000, 5_000, 20_000])
+    parser.add_argument("--neo4j", action="store_true", help="write to the Neo4j server at NEO4J_URI")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    validators = [uuid.uuid4() for _ in range(args.validators)]
+    pairs = [(rng.choice(validators), rng.choice(validators), rng.random() < 0.6) for _ in range(args.pairs)]
+
+    for batch_size in args.batch_sizes:
+        backend = Neo4jGraphBackend(get_neo4j_driver()) if args.neo4j else InMemoryGraphBackend()
+        writer = CorrelationGraphWriter(backend, batch_size=batch_size)
+        t0 = time.perf_counter()
+        for a, b, agreed in pairs:
+            writer.record_co_vote(a, b, agreed)
+        buffered = time.perf_counter() - t0
+        rows = writer.pending()
+        t0 = time.perf_counter()
+        writer.flush_all()
+        flushed = time.perf_counter() - t0
+        print(
+            f"batch={batch_size:<6d} buffered {args.pairs:,} pairs into {rows:,} rows in {buffered:.2f}s "
+            f"({args.pairs / buffered:,.0f} pairs/s); flushed in {flushed:.2f}s ({rows / flushed:,.0f} rows/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark outcome application (reputation, stake, metrics) for large claims.
+
+Times ValidationSessionService._apply_outcome_updates on claims with many
+votes. With --legacy, also times the previous per-vote path, which recounted
+every vote for each correct vote and called the services one vote at a time.
+
+Usage:
+    python -m load.bench_outcome_pipeline --votes-per-claim 10000 --claims 5 --legacy
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.observability.metrics import record_slashing, update_validator_metrics
+from core.reputation.models import ReputationUpdateRequest
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLockRequest
+from core.stake.service import StakeManager
+from core.validation.models import Vote
+from core.validation.service import VoteService
+from core.validation.session import ValidationSessionService
+
+
+def legacy_apply(sessions: ValidationSessionService, outcome: str, votes) -> None:
+    correct, incorrect = [], []
+    for v in votes:
+        if not v.signature_valid or v.vote_type == "uncertain":
+            continue
+        ok = (v.vote_type == "approve") == (outcome == "accepted")
+        (correct if ok else incorrect).append(v)
+    for v in correct:
+        approve_count = sum(1 for o in votes if o.vote_type == "approve" and o.signature_valid)
+        reject_count = sum(1 for o in votes if o.vote_type == "reject" and o.signature_valid)
+        minority = approve_count < reject_count if outcome == "accepted" else reject_count < approve_count
+        sessions._reputation.apply_outcome(
+            ReputationUpdateRequest(validator_id=v.validator_id, was_correct=True, was_minority=minority)
+        )
+    for v in incorrect:
+        sessions._reputation.apply_outcome(ReputationUpdateRequest(validator_id=v.validator_id, was_correct=False))
+    for v in incorrect:
+        sessions._stake.slash(v.validator_id, fraction=0.1, reason="incorrect_vote")
+        record_slashing(validator_id=str(v.validator_id), amount=0.1, reason="incorrect_vote")
+    for v in votes:
+        if not v.signature_valid:
+            continue
+        now = datetime.now(timezone.utc)
+        stake_state = sessions._stake.get_state(v.validator_id)
+        update_validator_metrics(
+            validator_id=str(v.validator_id),
+            influence=sessions._compute_influence(v.validator_id, now),
+            stake=stake_state.effective_stake if stake_state else 1.0,
+            reputation=sessions._reputation.get_state(v.validator_id).score,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--votes-per-claim", type=int, default=10_000)
+    parser.add_argument("--claims", type=int, default=5)
+    parser.add_argument("--legacy", action="store_true", help="also time the previous O(n^2) path (slow)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    identity = IdentityService()
+    stake = StakeManager()
+    votes = VoteService()
+    sessions = ValidationSessionService(votes=votes, stake=stake, reputation=ReputationEngine(), identity=identity)
+
+    lock_until = datetime.now(timezone.utc) + timedelta(days=365)
+    validator_ids = []
+    for i in range(args.votes_per_claim):
+        v = identity.register_validator(
+            ValidatorRegistrationRequest.model_construct(
+                public_key="", model_family=f"model{i % 7}", region=f"region{i % 5}", domain_focus=None
+            )
+        )
+        stake.lock_stake(StakeLockRequest(validator_id=v.id, amount=rng.uniform(10, 10_000), lock_until=lock_until))
+        validator_ids.append(v.id)
+
+    now = datetime.now(timezone.utc)
+    vote_types = ("approve", "approve", "approve", "reject", "uncertain")
+    claims = []
+    for _ in range(args.claims):
+        claim_id = uuid.uuid4()
+        claims.append(
+            [
+                Vote(
+                    id=uuid.uuid4(),
+                    claim_id=claim_id,
+                    validator_id=vid,
+                    vote_type=rng.choice(vote_types),
+                    confidence=rng.random(),
+                    timestamp=now,
+                    signature="",
+                    signature_valid=True,
+                )
+                for vid in validator_ids
+            ]
+        )
+
+    t0 = time.perf_counter()
+    for claim_votes in claims:
+        sessions._apply_outcome_updates(claim_votes[0].claim_id, "accepted", claim_votes)
+    elapsed = time.perf_counter() - t0
+    print(f"batched pipeline: {elapsed / args.claims * 1e3:10.1f} ms/claim ({args.votes_per_claim} votes)")
+
+    if args.legacy:
+        t0 = time.perf_counter()
+        legacy_apply(sessions, "accepted", claims[0])
+        elapsed = time.perf_counter() - t0
+        print(f"legacy per-vote:  {elapsed * 1e3:10.1f} ms/claim ({args.votes_per_claim} votes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark replaying reputation and stake event logs.
+
+Generates a synthetic history (mostly vote outcomes, with some locks and
+slashes) in blocks of --block events and replays it through ReplayEngine,
+resuming each block from the previous block's checkpoint so memory stays
+bounded by one block. --workers > 1 replays each block in validator-
+partitioned chunks on a process pool.
+
+Usage:
+    python -m load.bench_replay --events 100000000 --validators 1000000 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+
+from core.replay.log import CORRECT, CORRECT_MINORITY, INCORRECT, LOCK, OUTCOME, SLASH, EventLog
+from core.replay.service import ReplayEngine
+
+
+def generate_block(log: EventLog, rng: random.Random, n_events: int, n_validators: int, ts: float) -> float:
+    kinds, timestamps, validators, values = log.kinds, log.timestamps, log.validators, log.values
+    outcomes = (CORRECT, CORRECT, CORRECT, CORRECT_MINORITY, INCORRECT)
+    for _ in range(n_events):
+        ts += rng.random()
+        roll = rng.random()
+        if roll < 0.97:
+            kinds.append(OUTCOME)
+            values.append(rng.choice(outcomes))
+        elif roll < 0.995:
+            kinds.append(LOCK)
+            values.append(rng.uniform(1.0, 1_000.0))
+        else:
+            log.slash_reasons[len(timestamps)] = "incorrect_vote"
+            kinds.append(SLASH)
+            values.append(0.1)
+        timestamps.append(ts)
+        validators.append(rng.randrange(n_validators))
+    return ts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100_000_000)
+    parser.add_argument("--validators", type=int, default=1_000_000)
+    parser.add_argument("--block", type=int, default=10_000_000, help="events generated and replayed per block")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    validator_ids = [uuid.uuid4() for _ in range(args.validators)]
+    index = {vid: i for i, vid in enumerate(validator_ids)}
+    engine = ReplayEngine()
+    ts = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+
+    checkpoint = None
+    done = 0
+    replay_seconds = 0.0
+    while done < args.events:
+        n = min(args.block, args.events - done)
+        log = EventLog(validator_ids=validator_ids, _index=index)
+        ts = generate_block(log, rng, n, args.validators, ts)
+        if checkpoint is not None:
+            checkpoint.offset = 0  # offsets are per block log
+        t0 = time.perf_counter()
+        result = engine.replay(log, start=checkpoint, checkpoint_every=n, workers=args.workers)
+        replay_seconds += time.perf_counter() - t0
+        checkpoint = result.checkpoint
+        done += n
+        print(f"{done:>12,} events  {done / replay_seconds:12,.0f} events/s")
+
+    print(
+        f"replayed {done:,} events over {len(result.reputation):,} validators in {replay_seconds:.1f}s "
+        f"({replay_seconds / done * 1e6:.2f} us/event, workers={args.workers})"
+    )
+
+
+if __name__ == "__main__":
+    main()
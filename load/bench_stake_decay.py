@@ -0,0 +1,79 @@
+"""
+Benchmark stake decay for large validator sets.
+
+Times StakeManager.apply_decay_all materializing decay for every validator,
+a batched effective_stakes read of all of them, and (with --legacy) the
+previous approach of calling apply_decay once per validator.
+
+Usage:
+    python -m load.bench_stake_decay --validators 1000000 --legacy
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from core.stake.service import StakeManager
+
+
+class Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def build(n: int, seed: int, clock: Clock):
+    rng = random.Random(seed)
+    manager = StakeManager(decay_half_life_days=30.0, clock=clock)
+    start = clock.now
+    ids = [uuid.uuid4() for _ in range(n)]
+    # Spread last updates over a day in 1000 distinct instants, as batched
+    # outcome processing does.
+    instants = [start + timedelta(seconds=86.4 * i) for i in range(1000)]
+    for vid in ids:
+        clock.now = rng.choice(instants)
+        manager.lock(vid, rng.uniform(10.0, 10_000.0))
+    return manager, ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--validators", type=int, default=1_000_000)
+    parser.add_argument("--legacy", action="store_true", help="also time per-validator apply_decay calls")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    clock = Clock(start)
+    manager, ids = build(args.validators, args.seed, clock)
+    now = start + timedelta(days=2)
+
+    out = manager.effective_stakes(ids, now)
+    t0 = time.perf_counter()
+    manager.effective_stakes(ids, now, out)
+    print(f"batched read:       {time.perf_counter() - t0:8.3f} s ({args.validators:,} validators)")
+
+    t0 = time.perf_counter()
+    manager.apply_decay_all(now)
+    print(f"sweep (first):      {time.perf_counter() - t0:8.3f} s")
+    t0 = time.perf_counter()
+    manager.apply_decay_all(now + timedelta(hours=1))
+    print(f"sweep (one anchor): {time.perf_counter() - t0:8.3f} s")
+
+    if args.legacy:
+        clock.now = start
+        manager, ids = build(args.validators, args.seed, clock)
+        t0 = time.perf_counter()
+        for vid in ids:
+            manager.apply_decay(vid, now)
+        print(f"per-validator:      {time.perf_counter() - t0:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
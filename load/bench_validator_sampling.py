@@ -0,0 +1,81 @@
+"""
+Benchmark diversity-aware validator sampling over a large registry.
+
+Times round-one sampling for new claims through ValidationSessionService,
+whose WeightedValidatorSampler keeps per-(model_family, region) alias tables
+in sync with the identity registry, against the full-population path (list
+every validator and build a sampler over them for each sample).
+
+Usage:
+    python -m load.bench_validator_sampling --validators 1000000 --sample-size 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.reputation.service import ReputationEngine
+from core.stake.service import StakeManager
+from core.validation.diversity import diversity_aware_sample
+from core.validation.service import VoteService
+from core.validation.session import ValidationSessionService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--validators", type=int, default=1_000_000)
+    parser.add_argument("--sample-size", type=int, default=20)
+    parser.add_argument("--models", type=int, default=12)
+    parser.add_argument("--regions", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    identity = IdentityService()
+    sessions = ValidationSessionService(
+        votes=VoteService(),
+        stake=StakeManager(),
+        reputation=ReputationEngine(),
+        identity=identity,
+        sample_size=args.sample_size,
+        sampling_seed=args.seed,
+    )
+    t0 = time.perf_counter()
+    for i in range(args.validators):
+        identity.register_validator(
+            ValidatorRegistrationRequest.model_construct(
+                public_key="",
+                model_family=f"model{i % args.models}",
+                region=f"region{(i // args.models) % args.regions}",
+                domain_focus=None,
+            )
+        )
+    print(f"registered {args.validators} validators (sampler kept in sync) in {time.perf_counter() - t0:.2f}s")
+
+    params = sessions.params()
+    t0 = time.perf_counter()
+    for _ in range(args.iterations):
+        session = sessions._get_or_create_session(uuid.uuid4(), params)
+    elapsed = time.perf_counter() - t0
+    print(
+        f"session sampler: {elapsed / args.iterations * 1e6:10.1f} us/sample "
+        f"({len(session.validators_sampled)} picks)"
+    )
+
+    t0 = time.perf_counter()
+    picks = diversity_aware_sample(
+        identity.list_validators(),
+        target_count=args.sample_size,
+        max_same_model_fraction=params.diversity_model_cap,
+        max_same_region_fraction=params.diversity_region_cap,
+    )
+    elapsed = time.perf_counter() - t0
+    print(f"full scan:       {elapsed * 1e6:10.1f} us/sample ({len(picks)} picks)")
+
+
+if __name__ == "__main__":
+    main()
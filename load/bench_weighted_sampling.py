@@ -0,0 +1,81 @@
+"""
+Benchmark influence-weighted validator sampling with alias tables.
+
+Reports raw alias-table draws per second, capped diversity samples per second,
+and the cost of the lazy per-bucket rebuild after weight updates.
+
+Usage:
+    python -m load.bench_weighted_sampling --validators 1000000 --sample-size 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+
+from core.validation.diversity import AliasTable, ValidatorProfile, WeightedValidatorSampler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--validators", type=int, default=1_000_000)
+    parser.add_argument("--sample-size", type=int, default=20)
+    parser.add_argument("--models", type=int, default=12)
+    parser.add_argument("--regions", type=int, default=8)
+    parser.add_argument("--samples", type=int, default=5_000)
+    parser.add_argument("--updates", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sampler: WeightedValidatorSampler[ValidatorProfile] = WeightedValidatorSampler(min_weight=0.01)
+    ids = []
+    t0 = time.perf_counter()
+    for i in range(args.validators):
+        profile = ValidatorProfile(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            model_family=f"model{i % args.models}",
+            region=f"region{(i // args.models) % args.regions}",
+        )
+        sampler.upsert(profile, rng.lognormvariate(0.0, 1.0))
+        ids.append(str(profile.id))
+    print(f"loaded {args.validators} validators in {time.perf_counter() - t0:.2f}s")
+
+    weights = [rng.lognormvariate(0.0, 1.0) for _ in range(args.validators)]
+    t0 = time.perf_counter()
+    table = AliasTable(weights)
+    print(f"alias table build ({args.validators} weights): {time.perf_counter() - t0:.2f}s")
+    draws = 1_000_000
+    t0 = time.perf_counter()
+    for _ in range(draws):
+        table.draw(rng)
+    print(f"raw alias draws: {draws / (time.perf_counter() - t0):12.0f} draws/s")
+
+    def run_samples(n: int) -> float:
+        t0 = time.perf_counter()
+        for i in range(n):
+            sampler.sample(
+                target_count=args.sample_size,
+                max_same_model_fraction=0.3,
+                max_same_region_fraction=0.4,
+                rng=random.Random(i),
+            )
+        return time.perf_counter() - t0
+
+    run_samples(1)  # build all bucket tables once
+    elapsed = run_samples(args.samples)
+    print(
+        f"capped samples: {args.samples / elapsed:12.0f} samples/s "
+        f"({args.samples * args.sample_size / elapsed:.0f} validator draws/s)"
+    )
+
+    for vid in rng.sample(ids, args.updates):
+        sampler.update_weight(vid, rng.lognormvariate(0.0, 1.0))
+    elapsed = run_samples(1)
+    print(f"first sample after {args.updates} weight updates (lazy rebuilds): {elapsed * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.audit.service import AuditEngine
+from core.audit.sketch import TDigest
+
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = T0
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def test_tdigest_quantiles_stay_accurate_in_bounded_space():
+    rng = random.Random(3)
+    digest = TDigest(compression=100)
+    values = [rng.uniform(0.0, 1.0) for _ in range(50_000)]
+    for value in values:
+        digest.add(value)
+    for q in (0.01, 0.5, 0.9, 0.99):
+        assert digest.quantile(q) == pytest.approx(q, abs=0.01)
+    assert (digest.quantile(0.0), digest.quantile(1.0)) == (min(values), max(values))
+    assert len(digest._means) <= 100
+
+
+def test_drift_stats_are_windowed_and_flag_level_shifts():
+    clock = Clock()
+    audit = AuditEngine(window_seconds=600, window_buckets=6, max_signals_per_domain=100, clock=clock)
+    rng = random.Random(5)
+
+    flags = []
+    for i in range(300):
+        clock.now = T0 + timedelta(seconds=i)
+        flags.append(audit.record_drift("medicine", rng.gauss(0.1, 0.01)))
+    assert not any(flags)
+    summary = audit.drift_summary("medicine")
+    assert summary.ewma == pytest.approx(0.1, abs=0.01)
+    assert summary.p50 == pytest.approx(0.1, abs=0.005)
+    assert summary.change_points == 0
+
+    for i in range(300, 400):
+        clock.now = T0 + timedelta(seconds=i)
+        flags.append(audit.record_drift("medicine", rng.gauss(0.3, 0.01)))
+    assert flags.index(True) in range(300, 305)
+    summary = audit.drift_summary("medicine")
+    assert summary.change_points >= 1 and summary.last_change_at >= T0 + timedelta(seconds=300)
+    assert summary.ewma == pytest.approx(0.3, abs=0.01)
+
+    # Ten minutes later the window holds only the shifted level.
+    clock.now = T0 + timedelta(seconds=899)
+    assert audit.drift_summary("medicine").p50 == pytest.approx(0.3, abs=0.01)
+    assert audit.drift_summary("economics") is None
+
+
+def test_signal_reads_are_bounded_and_time_indexed():
+    clock = Clock()
+    audit = AuditEngine(max_signals_per_domain=50, max_anomalies=20, clock=clock)
+    for i in range(200):
+        clock.now = T0 + timedelta(seconds=i)
+        audit.record_drift("medicine" if i % 2 else "economics", float(i))
+        audit.record_anomaly(f"v{i}", "burst", float(i))
+
+    medicine = audit.get_recent_drift("medicine")
+    assert len(medicine) == 50
+    assert [s.drift_score for s in medicine[:2]] == [199.0, 197.0]
+
+    window = audit.get_recent_drift(since=T0 + timedelta(seconds=150), until=T0 + timedelta(seconds=160))
+    assert [s.drift_score for s in window] == [float(i) for i in range(159, 149, -1)]
+    assert len(audit.get_recent_drift(limit=5)) == 5
+
+    anomalies = audit.get_recent_anomalies()
+    assert [a.validator_id for a in anomalies[:2]] == ["v199", "v198"] and len(anomalies) == 20
+    assert audit.get_recent_anomalies(until=T0 + timedelta(seconds=180)) == []
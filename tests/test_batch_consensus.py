@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import binascii
+from datetime import datetime, timedelta, timezone
+
+from nacl.signing import SigningKey
+
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.ledger.models import ClaimCreateRequest
+from core.ledger.service import LedgerService
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLockRequest
+from core.stake.service import StakeManager
+from core.validation.batch import BatchConsensusEvaluator
+from core.validation.models import VoteCreateRequest
+from core.validation.service import VoteService, _canonical_vote_message
+from core.validation.session import ValidationSessionService
+
+
+def build_network(n_validators: int = 4):
+    identity = IdentityService()
+    stake = StakeManager()
+    votes = VoteService()
+    ledger = LedgerService()
+    reputation = ReputationEngine()
+    sessions = ValidationSessionService(
+        votes=votes, stake=stake, reputation=reputation, identity=identity, ledger=ledger
+    )
+    keys = []
+    for i in range(n_validators):
+        sk = SigningKey.generate()
+        v = identity.register_validator(
+            ValidatorRegistrationRequest(
+                public_key=binascii.hexlify(sk.verify_key.encode()).decode("ascii"),
+                model_family=f"model{i}",
+                region=f"region{i}",
+            )
+        )
+        stake.lock_stake(
+            StakeLockRequest(
+                validator_id=v.id, amount=100.0 * (i + 1), lock_until=datetime.now(timezone.utc) + timedelta(days=30)
+            )
+        )
+        # Pin time-active so influence does not depend on wall-clock jitter.
+        reputation.load_state(v.id, reputation.initial_score, datetime.now(timezone.utc) - timedelta(days=30))
+        keys.append((v.id, sk))
+    return identity, votes, ledger, sessions, keys
+
+
+def cast(votes, identity, claim_id, validator_id, sk, vote_type):
+    req = VoteCreateRequest(
+        claim_id=claim_id,
+        validator_id=validator_id,
+        vote_type=vote_type,
+        confidence=0.8,
+        timestamp=datetime.now(timezone.utc),
+        signature="00",
+    )
+    req.signature = binascii.hexlify(sk.sign(_canonical_vote_message(req)).signature).decode("ascii")
+    votes.submit_vote(req, identity)
+
+
+def test_batch_matches_single_claim_consensus_and_applies_once():
+    identity, votes, ledger, sessions, keys = build_network()
+    patterns = [
+        ("approve", "approve", "approve", "approve"),
+        ("reject", "reject", "reject", "approve"),
+        ("approve", "reject", "approve", "reject"),
+    ]
+    claim_ids = []
+    for pattern in patterns:
+        claim = ledger.create_claim(ClaimCreateRequest(statement="x", domain="physics", proposer_id=keys[0][0]))
+        for (vid, sk), vote_type in zip(keys, pattern):
+            cast(votes, identity, claim.id, vid, sk, vote_type)
+        claim_ids.append(claim.id)
+
+    expected = {cid: sessions._compute_round_consensus(votes.list_votes_for_claim(cid), sessions.params()) for cid in claim_ids}
+
+    evaluator = BatchConsensusEvaluator(sessions, votes, min_parallel_claims=0, max_workers=2)
+    assert set(evaluator.pending_claim_ids()) == set(claim_ids)
+    dry_run = {r.claim_id: r for r in evaluator.evaluate(workers=2, apply=False)}
+    for cid, (outcome, confidence) in expected.items():
+        assert dry_run[cid].outcome == outcome
+        assert abs(dry_run[cid].confidence - confidence) < 1e-6
+        assert not dry_run[cid].finalized
+        assert ledger.get_claim(cid).version == 1
+
+    applied = {r.claim_id: r for r in evaluator.evaluate(workers=2)}
+    for cid, (outcome, _) in expected.items():
+        assert applied[cid].finalized == (outcome != "uncertain")
+        assert ledger.get_claim(cid).version == (2 if outcome != "uncertain" else 1)
+
+    # Re-running only touches claims that are still pending, and never
+    # appends a second ledger version for finalized ones.
+    assert evaluator.pending_claim_ids() == [claim_ids[2]]
+    rerun = evaluator.evaluate(claim_ids, workers=1)
+    assert sum(1 for r in rerun if r.finalized) == 2
+    assert ledger.get_claim(claim_ids[0]).version == 2
+
+
+def test_async_batch_matches_sync_and_caps_workers():
+    identity, votes, ledger, sessions, keys = build_network()
+    claim_ids = []
+    for _ in range(3):
+        claim = ledger.create_claim(ClaimCreateRequest(statement="x", domain="physics", proposer_id=keys[0][0]))
+        for vid, sk in keys:
+            cast(votes, identity, claim.id, vid, sk, "approve")
+        claim_ids.append(claim.id)
+
+    evaluator = BatchConsensusEvaluator(sessions, votes, min_parallel_claims=0, max_workers=2)
+    _, plan = evaluator._plan(claim_ids, 10_000, None)
+    assert plan.workers == 2
+
+    dry_run = evaluator.evaluate(claim_ids, workers=1, apply=False)
+    applied = asyncio.run(evaluator.evaluate_async(claim_ids, workers=10_000))
+    assert [(r.claim_id, r.outcome) for r in applied] == [(r.claim_id, r.outcome) for r in dry_run]
+    assert all(r.finalized for r in applied)
+    assert all(ledger.get_claim(cid).version == 2 for cid in claim_ids)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from core.audit.collusion import CollusionDetector
+from core.audit.service import AuditEngine
+from core.validation.models import Vote
+
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def vote(claim_id, validator_id, vote_type, ts, valid=True):
+    return Vote(
+        id=uuid.uuid4(),
+        claim_id=claim_id,
+        validator_id=validator_id,
+        vote_type=vote_type,
+        confidence=0.9,
+        timestamp=ts,
+        signature="",
+        signature_valid=valid,
+    )
+
+
+def test_bloc_is_flagged_once_and_honest_voters_are_not():
+    audit = AuditEngine()
+    detector = CollusionDetector(audit, min_edge_weight=3.0, min_cluster_size=4, half_life_seconds=3600.0)
+    rng = random.Random(11)
+    bloc = [uuid.uuid4() for _ in range(5)]
+    honest = [uuid.uuid4() for _ in range(200)]
+
+    ts = T0
+    for round_ in range(6):
+        claim = uuid.uuid4()
+        for member in bloc:
+            ts += timedelta(seconds=1)
+            detector.observe_vote(vote(claim, member, "approve", ts))
+        for voter in rng.sample(honest, 10):
+            ts += timedelta(seconds=1)
+            detector.observe_vote(vote(claim, voter, rng.choice(["approve", "reject"]), ts))
+        if round_ == 1:
+            assert detector.clusters() == []
+
+    assert [set(c) for c in detector.clusters()] == [set(bloc)]
+    flagged = audit.get_recent_anomalies()
+    assert {a.validator_id for a in flagged} == {str(m) for m in bloc}
+    assert all(a.reason == "collusion_cluster" and a.severity == 1.0 for a in flagged)
+    assert len(flagged) == len(bloc)  # a member joining later is reported alone
+
+    # Invalid signatures and uncertain votes never form edges.
+    claim = uuid.uuid4()
+    detector.observe_vote(vote(claim, honest[0], "approve", ts, valid=False))
+    detector.observe_vote(vote(claim, honest[1], "uncertain", ts))
+    assert detector.edge_weight(honest[0], honest[1]) == 0.0
+
+
+def test_votes_outside_the_window_do_not_pair_and_clusters_decay():
+    audit = AuditEngine()
+    detector = CollusionDetector(
+        audit, window_seconds=60.0, min_edge_weight=2.0, min_cluster_size=3, half_life_seconds=600.0
+    )
+    trio = [uuid.uuid4() for _ in range(3)]
+
+    # Same claims, but ten minutes apart: no bloc.
+    ts = T0
+    for _ in range(4):
+        claim = uuid.uuid4()
+        for member in trio:
+            ts += timedelta(minutes=10)
+            detector.observe_vote(vote(claim, member, "reject", ts))
+    assert detector.clusters() == [] and detector.edge_count() == 0
+
+    for _ in range(3):
+        claim = uuid.uuid4()
+        for member in trio:
+            ts += timedelta(seconds=5)
+            detector.observe_vote(vote(claim, member, "reject", ts))
+    assert [set(c) for c in detector.clusters()] == [set(trio)]
+    assert detector.edge_weight(trio[0], trio[1]) > 2.0
+
+    # After a few half-lives the ties fall below the threshold and the core dissolves.
+    ts += timedelta(hours=1)
+    detector.observe_vote(vote(uuid.uuid4(), uuid.uuid4(), "approve", ts))
+    assert detector.clusters() == []
+    assert detector.edge_weight(trio[0], trio[1]) < 0.1
+
+
+class Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def test_future_dated_votes_are_clamped_and_cannot_disable_detection():
+    audit = AuditEngine()
+    clock = Clock(T0)
+    detector = CollusionDetector(
+        audit, min_edge_weight=2.0, min_cluster_size=3, half_life_seconds=3600.0, clock=clock
+    )
+    # A year ahead is ~8.8k half-lives: unclamped, this overflowed and pinned time.
+    forged = vote(uuid.uuid4(), uuid.uuid4(), "approve", T0 + timedelta(days=365))
+    detector.observe_vote(forged)
+
+    trio = [uuid.uuid4() for _ in range(3)]
+    ts = T0
+    for _ in range(3):
+        claim = uuid.uuid4()
+        for member in trio:
+            ts += timedelta(seconds=1)
+            clock.now = ts
+            detector.observe_vote(vote(claim, member, "approve", ts))
+    assert [set(c) for c in detector.clusters()] == [set(trio)]
+
+
+def test_long_gaps_rebase_without_overflow_and_failures_do_not_propagate():
+    audit = AuditEngine()
+    clock = Clock(T0)
+    detector = CollusionDetector(audit, half_life_seconds=1.0, clock=clock)
+    a, b = uuid.uuid4(), uuid.uuid4()
+    claim = uuid.uuid4()
+    detector.observe_vote(vote(claim, a, "approve", T0))
+    detector.observe_vote(vote(claim, b, "approve", T0))
+    assert detector.edge_weight(a, b) == 1.0
+
+    later = T0 + timedelta(days=30)  # ~2.6M half-lives
+    clock.now = later
+    detector.observe_vote(vote(uuid.uuid4(), a, "approve", later))
+    assert detector.edge_weight(a, b) == 0.0
+
+    def boom(*args):
+        raise RuntimeError("broken")
+
+    detector._add_weight = boom
+    claim = uuid.uuid4()
+    detector.observe_vote(vote(claim, a, "reject", later))
+    detector.observe_vote(vote(claim, b, "reject", later))  # logged, not raised
+
+
+def test_edges_slots_and_flags_are_bounded_incrementally():
+    audit = AuditEngine()
+    detector = CollusionDetector(
+        audit,
+        min_edge_weight=2.0,
+        min_cluster_size=3,
+        half_life_seconds=600.0,
+        max_edges=20,
+        max_tracked_claims=5,
+        flag_cooldown_seconds=60.0,
+    )
+    trio = [uuid.uuid4() for _ in range(3)]
+    ts = T0
+    for _ in range(3):
+        claim = uuid.uuid4()
+        for member in trio:
+            ts += timedelta(seconds=1)
+            detector.observe_vote(vote(claim, member, "approve", ts))
+    assert [set(c) for c in detector.clusters()] == [set(trio)]
+    assert len(detector._flagged_at) == 3
+
+    # A flood of one-off pairs stays within max_edges; the strong trio survives it.
+    for _ in range(50):
+        claim = uuid.uuid4()
+        for _ in range(2):
+            ts += timedelta(seconds=1)
+            detector.observe_vote(vote(claim, uuid.uuid4(), "approve", ts))
+    assert detector.edge_count() <= 20
+    assert [set(c) for c in detector.clusters()] == [set(trio)]
+    assert detector.edge_weight(trio[0], trio[1]) > 2.0
+    assert len(detector._expiries) == len(detector._expiry_at) == 3
+    assert not detector._flagged_at  # cooldown passed
+
+    # Once everything decays and the old claim windows roll off, edges are
+    # forgotten and validator slots are reused.
+    slots = len(detector._validators)
+    ts += timedelta(days=1)
+    for _ in range(5):
+        ts += timedelta(seconds=1)
+        detector.observe_vote(vote(uuid.uuid4(), uuid.uuid4(), "approve", ts))
+    assert detector.edge_count() == 0 and detector.clusters() == []
+    assert len(detector._ids) == 5
+    assert len(detector._validators) == slots
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import binascii
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from nacl.signing import SigningKey
+
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.ledger.models import ClaimCreateRequest
+from core.ledger.service import LedgerService
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLockRequest
+from core.stake.service import StakeManager
+from core.validation.coalescing import ConsensusCoalescer
+from core.validation.models import VoteCreateRequest
+from core.validation.service import VoteService, _canonical_vote_message
+from core.validation.session import ValidationSessionService
+
+
+class CountingSessions(ValidationSessionService):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+        self.loop_thread_only = True
+
+    def compute_consensus(self, claim_id):
+        self.calls += 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.loop_thread_only = False
+        return super().compute_consensus(claim_id)
+
+
+def build():
+    identity = IdentityService()
+    stake = StakeManager()
+    votes = VoteService()
+    ledger = LedgerService()
+    sessions = CountingSessions(
+        votes=votes, stake=stake, reputation=ReputationEngine(), identity=identity, ledger=ledger
+    )
+    return identity, stake, votes, ledger, sessions
+
+
+def signed_vote(identity, stake, votes, claim_id, vote_type="approve"):
+    sk = SigningKey.generate()
+    v = identity.register_validator(
+        ValidatorRegistrationRequest(
+            public_key=binascii.hexlify(sk.verify_key.encode()).decode("ascii"), model_family="m", region="r"
+        )
+    )
+    stake.lock_stake(
+        StakeLockRequest(validator_id=v.id, amount=100.0, lock_until=datetime.now(timezone.utc) + timedelta(days=1))
+    )
+    req = VoteCreateRequest(
+        claim_id=claim_id,
+        validator_id=v.id,
+        vote_type=vote_type,
+        confidence=0.9,
+        timestamp=datetime.now(timezone.utc),
+        signature="00",
+    )
+    req.signature = binascii.hexlify(sk.sign(_canonical_vote_message(req)).signature).decode("ascii")
+    votes.submit_vote(req, identity)
+
+
+def test_repeated_polls_are_served_from_the_cache_on_the_loop():
+    _, _, votes, _, sessions = build()
+    coalescer = ConsensusCoalescer(sessions, votes)
+    claim_id = uuid.uuid4()
+
+    async def scenario():
+        async def poll():
+            return coalescer.get_consensus(claim_id)
+
+        return await asyncio.gather(*(poll() for _ in range(20)))
+
+    results = asyncio.run(scenario())
+    assert sessions.calls == 1
+    # Finalization mutates shared engines, so it must never leave the loop thread.
+    assert sessions.loop_thread_only
+    assert {r.claim_id for r in results} == {claim_id}
+
+
+def test_result_cached_until_vote_set_changes():
+    identity, stake, votes, ledger, sessions = build()
+    coalescer = ConsensusCoalescer(sessions, votes)
+    claim_id = ledger.create_claim(
+        ClaimCreateRequest(statement="x", domain="physics", proposer_id=uuid.uuid4())
+    ).id
+
+    def poll(n):
+        return [coalescer.get_consensus(claim_id) for _ in range(n)]
+
+    first = poll(3)
+    assert sessions.calls == 1
+    assert first[-1].outcome == "uncertain"
+
+    signed_vote(identity, stake, votes, claim_id)
+    signed_vote(identity, stake, votes, claim_id)
+    polled = poll(5)
+    assert sessions.calls == 2
+    assert polled[-1].finalized
+    assert polled[-1].outcome == "accepted"
+    assert len(coalescer) == 0  # finalized claims are not cached
+
+    # Repeated polls after finalization never append extra ledger versions.
+    poll(5)
+    assert sessions.calls == 2
+    assert ledger.get_claim(claim_id).version == 2
+
+
+def test_cache_evicts_least_recently_polled_claims():
+    _, _, votes, _, sessions = build()
+    coalescer = ConsensusCoalescer(sessions, votes, max_entries=3)
+    claims = [uuid.uuid4() for _ in range(4)]
+    for claim_id in claims[:3]:
+        coalescer.get_consensus(claim_id)
+    coalescer.get_consensus(claims[0])  # refreshes the oldest entry
+    coalescer.get_consensus(claims[3])
+    assert len(coalescer) == 3
+    assert sessions.calls == 4
+
+    coalescer.get_consensus(claims[0])
+    assert sessions.calls == 4
+    coalescer.get_consensus(claims[1])  # evicted, evaluated again
+    assert sessions.calls == 5
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import binascii
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from nacl.signing import SigningKey
+
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.ledger.models import ClaimCreateRequest
+from core.ledger.service import LedgerService
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLockRequest
+from core.stake.service import StakeManager
+from core.validation.models import VoteCreateRequest
+from core.validation.scheduler import ConsensusScheduler
+from core.validation.service import VoteService, _canonical_vote_message
+from core.validation.session import ValidationSessionService
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_network(n_validators: int = 3):
+    identity = IdentityService()
+    stake = StakeManager()
+    votes = VoteService()
+    ledger = LedgerService()
+    sessions = ValidationSessionService(
+        votes=votes,
+        stake=stake,
+        reputation=ReputationEngine(),
+        identity=identity,
+        ledger=ledger,
+    )
+    keys = []
+    for i in range(n_validators):
+        sk = SigningKey.generate()
+        v = identity.register_validator(
+            ValidatorRegistrationRequest(
+                public_key=binascii.hexlify(sk.verify_key.encode()).decode("ascii"),
+                model_family=f"model{i}",
+                region=f"region{i}",
+            )
+        )
+        stake.lock_stake(
+            StakeLockRequest(
+                validator_id=v.id,
+                amount=100.0,
+                lock_until=datetime.now(timezone.utc) + timedelta(days=30),
+            )
+        )
+        keys.append((v.id, sk))
+    return identity, votes, ledger, sessions, keys
+
+
+def new_claim(ledger: LedgerService, proposer_id: uuid.UUID) -> uuid.UUID:
+    claim = ledger.create_claim(
+        ClaimCreateRequest(statement="The sky is blue", domain="physics", proposer_id=proposer_id)
+    )
+    return claim.id
+
+
+def cast(votes: VoteService, identity: IdentityService, claim_id, validator_id, sk, vote_type="approve"):
+    req = VoteCreateRequest(
+        claim_id=claim_id,
+        validator_id=validator_id,
+        vote_type=vote_type,
+        confidence=0.9,
+        timestamp=datetime.now(timezone.utc),
+        signature="00",
+    )
+    req.signature = binascii.hexlify(sk.sign(_canonical_vote_message(req)).signature).decode("ascii")
+    return votes.submit_vote(req, identity)
+
+
+def test_vote_trigger_applies_outcome_exactly_once():
+    identity, votes, ledger, sessions, keys = build_network()
+    scheduler = ConsensusScheduler(sessions, vote_trigger=2, time_trigger_seconds=60.0, clock=FakeClock())
+    votes.add_listener(scheduler.notify_vote)
+    claim_id = new_claim(ledger, keys[0][0])
+
+    cast(votes, identity, claim_id, *keys[0])
+    assert scheduler.queue_depth() == 1
+    assert scheduler.run_once() == []
+
+    cast(votes, identity, claim_id, *keys[1])
+    [session] = scheduler.run_once()
+    assert session.finalized
+    assert session.outcome == "accepted"
+    assert scheduler.queue_depth() == 0
+    assert ledger.get_claim(claim_id).version == 2
+
+    # Votes on a finalized claim are not queued and never re-apply the outcome.
+    cast(votes, identity, claim_id, *keys[2])
+    assert scheduler.queue_depth() == 0
+    sessions.compute_consensus(claim_id)
+    assert ledger.get_claim(claim_id).version == 2
+
+
+def test_time_trigger_fires_after_deadline():
+    identity, votes, ledger, sessions, keys = build_network()
+    clock = FakeClock()
+    scheduler = ConsensusScheduler(sessions, vote_trigger=10, time_trigger_seconds=5.0, clock=clock)
+    votes.add_listener(scheduler.notify_vote)
+    claim_id = new_claim(ledger, keys[0][0])
+
+    cast(votes, identity, claim_id, *keys[0])
+    clock.now = 4.0
+    assert scheduler.run_once() == []
+
+    clock.now = 5.0
+    [session] = scheduler.run_once()
+    assert session.claim_id == claim_id
+    assert session.finalized
+
+
+def test_ticks_are_bounded_by_batch_size():
+    identity, votes, ledger, sessions, keys = build_network()
+    scheduler = ConsensusScheduler(sessions, vote_trigger=1, batch_size=2, clock=FakeClock())
+    votes.add_listener(scheduler.notify_vote)
+
+    for _ in range(3):
+        cast(votes, identity, new_claim(ledger, keys[0][0]), *keys[0])
+
+    assert len(scheduler.run_once()) == 2
+    assert scheduler.queue_depth() == 1
+    assert len(scheduler.run_once()) == 1
+    assert scheduler.queue_depth() == 0
+
+
+def test_background_task_yields_between_claims():
+    identity, votes, ledger, sessions, keys = build_network()
+    scheduler = ConsensusScheduler(sessions, vote_trigger=1, batch_size=10, tick_interval=60.0, clock=FakeClock())
+    votes.add_listener(scheduler.notify_vote)
+    for _ in range(4):
+        cast(votes, identity, new_claim(ledger, keys[0][0]), *keys[0])
+
+    events = []
+    evaluate = sessions.compute_consensus
+    sessions.compute_consensus = lambda claim_id: events.append("claim") or evaluate(claim_id)
+
+    async def scenario():
+        scheduler.start()
+        for _ in range(8):
+            events.append("other")
+            await asyncio.sleep(0)
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+    assert events.count("claim") == 4
+    # Other tasks run between evaluations instead of after the whole batch.
+    assert "claim" not in {events[i] for i in range(len(events) - 1) if events[i + 1] == "claim"}
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.neo4j.graph import InMemoryGraphBackend, Neo4jGraphBackend
+from core.neo4j.writer import CorrelationGraphWriter
+from core.validation.correlation import VoteCorrelationEngine
+from core.validation.models import Vote
+
+
+def vote(claim_id, validator_id, vote_type):
+    return Vote(
+        id=uuid.uuid4(),
+        claim_id=claim_id,
+        validator_id=validator_id,
+        vote_type=vote_type,
+        confidence=0.9,
+        timestamp=datetime.now(timezone.utc),
+        signature="",
+        signature_valid=True,
+    )
+
+
+def test_writer_mirrors_correlation_pairs_into_the_graph():
+    identity = IdentityService()
+    correlation = VoteCorrelationEngine()
+    writer = CorrelationGraphWriter(InMemoryGraphBackend(), batch_size=2)
+    identity.add_listener(writer.record_validator)
+    correlation.add_listener(writer.record_co_vote)
+
+    a, b, c = (
+        identity.register_validator(ValidatorRegistrationRequest(public_key="", model_family="m", region=f"r{i}")).id
+        for i in range(3)
+    )
+    for i in range(5):
+        claim = uuid.uuid4()
+        correlation.observe_vote(vote(claim, a, "approve"))
+        correlation.observe_vote(vote(claim, b, "approve"))
+        correlation.observe_vote(vote(claim, c, "approve" if i < 2 else "reject"))
+    assert writer.pending() == 3 + 3  # repeated pairs are coalesced
+
+    assert writer.flush_all() == 6 and writer.pending() == 0
+    graph = writer.backend
+    assert graph.counts() == (3, 3)
+    assert graph.validator(str(a))["region"] == "r0"
+    edge = graph.pair(str(c), str(a))
+    assert (edge.co_votes, edge.agreements) == (5, 2)
+    assert [(e.co_votes, e.agreements) for e in graph.co_voters(str(a), limit=2)] == [(5, 5), (5, 2)]
+
+
+class FlakyBackend(InMemoryGraphBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures = 1
+
+    def write_co_votes(self, rows):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("neo4j unavailable")
+        super().write_co_votes(rows)
+
+
+def test_failed_batches_are_retried_without_losing_or_double_counting():
+    writer = CorrelationGraphWriter(FlakyBackend())
+    a, b = uuid.uuid4(), uuid.uuid4()
+    writer.record_co_vote(a, b, True)
+    writer.record_co_vote(b, a, False)
+    with pytest.raises(ConnectionError):
+        writer.flush()
+    writer.record_co_vote(a, b, True)  # arrives while the batch is being retried
+    writer.flush_all()
+    edge = writer.backend.pair(str(a), str(b))
+    assert (edge.co_votes, edge.agreements) == (3, 2)
+
+
+def test_background_task_flushes_once_the_buffer_fills():
+    async def scenario():
+        writer = CorrelationGraphWriter(InMemoryGraphBackend(), flush_interval=60.0, max_pending=10)
+        writer.start()
+        for _ in range(10):
+            writer.record_co_vote(uuid.uuid4(), uuid.uuid4(), True)
+        await asyncio.sleep(0.05)
+        flushed = writer.backend.counts()[1]
+        await writer.stop()
+        return flushed
+
+    assert asyncio.run(scenario()) == 10
+
+
+class RecordingDriver:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def execute_query(self, query, parameters_=None, routing_=None, database_=None):
+        self.calls.append((query, parameters_))
+        return type("EagerResult", (), {"records": []})()
+
+
+def test_neo4j_backend_writes_unwind_batches():
+    driver = RecordingDriver()
+    writer = CorrelationGraphWriter(Neo4jGraphBackend(driver), batch_size=2)
+    for _ in range(5):
+        writer.record_co_vote(uuid.uuid4(), uuid.uuid4(), True)
+    writer.flush_all()
+    schema, *writes = driver.calls
+    assert schema[0].startswith("CREATE CONSTRAINT")
+    assert [len(params["rows"]) for _, params in writes] == [2, 2, 1]
+    assert all(query.lstrip().startswith("UNWIND $rows") for query, _ in writes)
+    assert all(row["a"] <= row["b"] for _, params in writes for row in params["rows"])
@@ -40,3 +40,118 @@ def test_diversity_sampler_respects_model_and_region_caps():
     for count in region_counts.values():
         assert count / total <= 0.7 + 1e-6
 
+
+def test_session_sampling_follows_identity_registrations():
+    from core.identity.models import ValidatorRegistrationRequest
+    from core.identity.service import IdentityService
+    from core.reputation.service import ReputationEngine
+    from core.stake.service import StakeManager
+    from core.validation.service import VoteService
+    from core.validation.session import ValidationSessionService
+
+    identity = IdentityService()
+
+    def register(i):
+        return identity.register_validator(
+            ValidatorRegistrationRequest(public_key="k", model_family=f"model{i % 5}", region=f"region{i % 3}")
+        )
+
+    early = [register(i) for i in range(20)]  # registered before the session service exists
+    sessions = ValidationSessionService(
+        votes=VoteService(), stake=StakeManager(), reputation=ReputationEngine(), identity=identity, sample_size=30
+    )
+    late = [register(i) for i in range(20, 40)]
+    retired = {str(v.id) for v in early[:5] + late[:5]}
+    for vid in retired:
+        assert identity.deactivate_validator(vid)
+
+    sampled = sessions.compute_consensus(uuid.uuid4()).validators_sampled
+    assert len(sampled) == len(set(sampled)) == 30
+    assert set(sampled) == {str(v.id) for v in early + late} - retired
+
+
+def test_alias_table_matches_weights():
+    import random
+
+    from core.validation.diversity import AliasTable
+
+    weights = [1.0, 2.0, 7.0, 0.0]
+    table = AliasTable(weights)
+    rng = random.Random(42)
+    counts = [0] * len(weights)
+    draws = 100_000
+    for _ in range(draws):
+        counts[table.draw(rng)] += 1
+
+    assert counts[3] == 0
+    for w, c in zip(weights, counts):
+        assert abs(c / draws - w / sum(weights)) < 0.01
+
+
+def test_weighted_sampler_is_seeded_weighted_and_updates_incrementally():
+    import random
+
+    from core.validation.diversity import WeightedValidatorSampler
+
+    profiles = [
+        ValidatorProfile(id=uuid.uuid4(), model_family=f"model{i % 4}", region=f"region{i % 3}") for i in range(40)
+    ]
+    sampler = WeightedValidatorSampler()
+    for p in profiles:
+        sampler.upsert(p, 1.0)
+
+    def draw(seed):
+        return sampler.sample(
+            target_count=8, max_same_model_fraction=0.5, max_same_region_fraction=0.5, rng=random.Random(seed)
+        )
+
+    assert [v.id for v in draw(7)] == [v.id for v in draw(7)]
+    assert len({v.id for v in draw(7)}) == 8
+
+    heavy = profiles[-1]
+    assert sampler.update_weight(str(heavy.id), 1000.0)
+    assert sum(heavy in draw(seed) for seed in range(50)) >= 45
+
+    assert sampler.remove(str(heavy.id))
+    assert str(heavy.id) not in sampler
+    assert all(heavy not in draw(seed) for seed in range(20))
+
+
+def test_diversity_aware_sample_is_not_biased_by_iteration_order():
+    validators = [ValidatorProfile(id=uuid.uuid4(), model_family=f"m{i % 5}", region=f"r{i % 5}") for i in range(100)]
+
+    picked_late = 0
+    for seed in range(30):
+        sample = diversity_aware_sample(validators, target_count=5, seed=seed)
+        assert len(sample) == 5
+        picked_late += sum(1 for v in sample if validators.index(v) >= 50)
+    assert picked_late > 0.3 * 30 * 5
+
+
+def test_session_sampler_ignores_small_influence_drift():
+    from core.identity.models import ValidatorRegistrationRequest
+    from core.identity.service import IdentityService
+    from core.reputation.service import ReputationEngine
+    from core.stake.service import StakeManager
+    from core.validation.service import VoteService
+    from core.validation.session import ValidationSessionService
+
+    identity = IdentityService()
+    stake = StakeManager()
+    sessions = ValidationSessionService(
+        votes=VoteService(), stake=stake, reputation=ReputationEngine(), identity=identity, sample_size=5
+    )
+    validators = [
+        identity.register_validator(ValidatorRegistrationRequest(public_key="k", model_family="m", region="r"))
+        for _ in range(10)
+    ]
+    for v in validators:
+        stake.lock(v.id, 1000.0)
+    sessions.compute_consensus(uuid.uuid4())
+    bucket = sessions._sampler._buckets[("m", "r")]
+    assert bucket.table is not None
+
+    stake.lock(validators[0].id, 1.0)  # well within the tolerance: the alias table is kept
+    assert bucket.table is not None
+    stake.lock(validators[0].id, 5000.0)
+    assert bucket.table is None
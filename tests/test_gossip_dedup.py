@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+
+import pytest
+
+from core.hub.dedup import BloomFilter, SeenMessageCache
+from core.hub.gossip import GossipProtocol, HubConfig, MessageType
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def ids(n: int) -> list:
+    return [str(uuid.uuid4()) for _ in range(n)]
+
+
+def test_duplicates_hit_the_lru_and_new_ids_miss():
+    cache = SeenMessageCache(max_entries=10, clock=Clock())
+    assert cache.check_and_add("a") is False
+    assert cache.check_and_add("b") is False
+    assert cache.check_and_add("a") is True
+    assert cache.stats()["lru_hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_lru_entries_expire_after_ttl_and_on_capacity():
+    clock = Clock()
+    cache = SeenMessageCache(max_entries=3, ttl_seconds=10.0, bloom_capacity=0, clock=clock)
+    for message_id in ("a", "b", "c", "d"):
+        cache.add(message_id)
+    assert len(cache) == 3
+    assert cache.evictions["capacity"] == 1
+    # Without the Bloom tier the evicted id is forgotten.
+    assert cache.check_and_add("a") is False
+
+    clock.now = 5.0
+    cache.check_and_add("c")  # refreshes "c"
+    clock.now = 12.0
+    cache.check_and_add("e")
+    assert cache.evictions["ttl"] == 2  # "d" and "a"; "c" was seen at t=5
+    assert cache.check_and_add("c") is True
+
+
+def test_bloom_tier_catches_ids_evicted_from_the_lru():
+    cache = SeenMessageCache(max_entries=100, bloom_capacity=10_000, false_positive_rate=1e-6, clock=Clock())
+    batch = ids(1_000)
+    for message_id in batch:
+        cache.add(message_id)
+    assert len(cache) == 100
+    assert all(cache.check_and_add(message_id) for message_id in batch[:500])
+    assert cache.bloom_hits == 500
+
+
+def test_bloom_generations_rotate_and_forget_old_ids():
+    clock = Clock()
+    cache = SeenMessageCache(max_entries=10, ttl_seconds=60.0, bloom_capacity=100, clock=clock)
+    first = ids(100)
+    for message_id in first:
+        cache.add(message_id)
+    # A full generation rotates; the previous one still answers.
+    for message_id in ids(50):
+        cache.add(message_id)
+    assert cache.evictions["rotation"] == 0
+    assert cache.check_and_add(first[0]) is True
+
+    # A second rotation (here by age) drops the first generation.
+    clock.now = 61.0
+    cache.add("tick")
+    assert cache.evictions["rotation"] == 100
+    assert sum(cache.check_and_add(message_id) for message_id in first[:50]) <= 1
+
+
+def test_false_positive_rate_stays_within_budget():
+    budget = 0.01
+    cache = SeenMessageCache(max_entries=10, bloom_capacity=20_000, false_positive_rate=budget, clock=Clock())
+    for message_id in ids(19_990):
+        cache.add(message_id)
+    probes = ids(20_000)
+    false_positives = sum(cache.check_and_add(message_id) for message_id in probes)
+    assert false_positives / len(probes) < 1.5 * budget
+
+
+def test_memory_is_fixed_by_configuration():
+    clock = Clock()
+    cache = SeenMessageCache(max_entries=1_000, ttl_seconds=1.0, bloom_capacity=5_000, clock=clock)
+    size = cache.memory_bytes()
+    for i in range(50_000):
+        clock.now = i * 1e-3
+        cache.add(str(i))
+    assert len(cache) <= 1_000
+    assert cache.memory_bytes() == size
+    assert cache.evictions["rotation"] > 0
+
+
+def test_bloom_filter_sizing():
+    bloom = BloomFilter(1_000, 0.01)
+    assert 9_500 <= bloom.num_bits <= 9_700  # ~9.6 bits per item
+    assert bloom.num_hashes == 7
+    with pytest.raises(ValueError):
+        BloomFilter(0, 0.01)
+
+
+def test_gossip_protocol_drops_duplicates_and_echoes():
+    gossip = GossipProtocol(HubConfig(hub_id="hub-a", host="localhost", port=0, dedup_max_entries=100))
+    processed = []
+
+    async def process(message):
+        processed.append(message.message_id)
+
+    gossip._process_message = process
+
+    def raw(message_id: str) -> str:
+        return json.dumps(
+            {
+                "message_id": message_id,
+                "message_type": MessageType.HEALTH_CHECK.value,
+                "source_hub": "hub-b",
+                "timestamp": "2025-01-01T00:00:00",
+                "data": {"status": "healthy"},
+                "ttl": 0,
+            }
+        )
+
+    async def scenario():
+        await gossip._handle_message("peer", raw("m1"))
+        await gossip._handle_message("peer", raw("m1"))
+        await gossip._handle_message("peer", raw("m2"))
+        await gossip.broadcast(MessageType.HEALTH_CHECK, {"status": "healthy"})
+        own = next(reversed(gossip.seen_messages._entries))
+        await gossip._handle_message("peer", raw(own))
+
+    asyncio.run(scenario())
+    assert processed == ["m1", "m2"]
+    status = gossip.get_status()
+    assert status["received_messages"] == 2
+    assert status["sent_messages"] == 1
+    assert status["dedup"]["lru_hits"] == 2
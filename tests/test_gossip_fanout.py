@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+from core.hub.gossip import GossipProtocol, HubConfig, MessageType
+
+
+class FakeWebSocket:
+    def __init__(self, *, blocked: bool = False, fail: bool = False) -> None:
+        self.sent = []
+        self.closed = False
+        self.fail = fail
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def send(self, payload: str) -> None:
+        if self.fail:
+            raise ConnectionError("peer went away")
+        await self.gate.wait()
+        self.sent.append(json.loads(payload)["message_id"])
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def protocol(**overrides) -> GossipProtocol:
+    return GossipProtocol(HubConfig(hub_id="hub-a", host="localhost", port=0, **overrides))
+
+
+async def settle() -> None:
+    await asyncio.sleep(0.01)
+
+
+def test_a_slow_peer_does_not_delay_the_others():
+    async def scenario():
+        gossip = protocol(propagation_timeout=60.0)
+        fast = [FakeWebSocket() for _ in range(3)]
+        slow = FakeWebSocket(blocked=True)
+        for i, ws in enumerate(fast + [slow]):
+            gossip._add_peer(f"p{i}", ws)
+
+        started = time.perf_counter()
+        for _ in range(5):
+            await gossip.broadcast(MessageType.HEALTH_CHECK, {"status": "healthy"})
+        enqueue_time = time.perf_counter() - started
+        await settle()
+
+        assert all(len(ws.sent) == 5 for ws in fast)
+        assert slow.sent == []
+        assert gossip.peers["p3"].queued() == 4  # one in flight
+        assert enqueue_time < 0.5
+
+        slow.gate.set()
+        await settle()
+        assert len(slow.sent) == 5
+        assert gossip.get_status()["peer_queues"]["p3"]["sent"] == 5
+        await gossip.stop()
+
+    asyncio.run(scenario())
+
+
+def test_drop_oldest_keeps_the_newest_messages():
+    async def scenario():
+        gossip = protocol(peer_queue_size=2, propagation_timeout=60.0)
+        slow = FakeWebSocket(blocked=True)
+        gossip._add_peer("slow", slow)
+        for _ in range(6):
+            await gossip.broadcast(MessageType.HEALTH_CHECK, {"status": "healthy"})
+            await settle()
+        peer = gossip.peers["slow"]
+        assert peer.queued() == 2
+        assert peer.dropped == 3
+        assert peer.lag() > 0
+
+        slow.gate.set()
+        await settle()
+        broadcast_ids = list(gossip.seen_messages._entries)
+        assert slow.sent == [broadcast_ids[0]] + broadcast_ids[-2:]
+        await gossip.stop()
+
+    asyncio.run(scenario())
+
+
+def test_drop_newest_keeps_the_queued_messages():
+    async def scenario():
+        gossip = protocol(peer_queue_size=2, peer_overflow_policy="drop_newest", propagation_timeout=60.0)
+        slow = FakeWebSocket(blocked=True)
+        gossip._add_peer("slow", slow)
+        for _ in range(6):
+            await gossip.broadcast(MessageType.HEALTH_CHECK, {"status": "healthy"})
+            await settle()
+        slow.gate.set()
+        await settle()
+        assert slow.sent == list(gossip.seen_messages._entries)[:3]
+        await gossip.stop()
+
+    asyncio.run(scenario())
+
+
+def test_disconnect_policy_drops_an_overflowing_peer():
+    async def scenario():
+        gossip = protocol(peer_queue_size=1, peer_overflow_policy="disconnect", propagation_timeout=60.0)
+        fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+        gossip._add_peer("fast", fast)
+        gossip._add_peer("slow", slow)
+        for _ in range(4):
+            await gossip.broadcast(MessageType.HEALTH_CHECK, {"status": "healthy"})
+            await settle()
+        assert list(gossip.peers) == ["fast"]
+        assert slow.closed
+        assert len(fast.sent) == 4
+        await gossip.stop()
+
+    asyncio.run(scenario())
+
+
+def test_failed_or_timed_out_sends_remove_only_that_peer():
+    async def scenario():
+        gossip = protocol(propagation_timeout=0.05)
+        ok, broken, stuck = FakeWebSocket(), FakeWebSocket(fail=True), FakeWebSocket(blocked=True)
+        for peer_id, ws in (("ok", ok), ("broken", broken), ("stuck", stuck)):
+            gossip._add_peer(peer_id, ws)
+        await gossip.broadcast(MessageType.HEALTH_CHECK, {"status": "healthy"})
+        await settle()
+        assert set(gossip.peers) == {"ok", "stuck"}
+        await asyncio.sleep(0.1)
+        assert list(gossip.peers) == ["ok"]
+        assert broken.closed and stuck.closed
+        await gossip.broadcast(MessageType.HEALTH_CHECK, {"status": "healthy"})
+        await settle()
+        assert len(ok.sent) == 2
+        await gossip.stop()
+
+    asyncio.run(scenario())
+
+
+def test_relayed_messages_skip_the_peer_they_came_from():
+    async def scenario():
+        gossip = protocol()
+        gossip._process_message = lambda message: asyncio.sleep(0)
+        a, b = FakeWebSocket(), FakeWebSocket()
+        gossip._add_peer("a", a)
+        gossip._add_peer("b", b)
+        raw = json.dumps(
+            {
+                "message_id": "m1",
+                "message_type": MessageType.HEALTH_CHECK.value,
+                "source_hub": "hub-b",
+                "timestamp": "2025-01-01T00:00:00",
+                "data": {"status": "healthy"},
+                "ttl": 2,
+            }
+        )
+        await gossip._handle_message("a", raw)
+        await settle()
+        assert a.sent == []
+        assert b.sent == ["m1"]
+        await gossip.stop()
+        assert a.closed and b.closed and gossip.peers == {}
+
+    asyncio.run(scenario())
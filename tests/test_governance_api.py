@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import uuid
+
 from fastapi.testclient import TestClient
 
 from api.main import create_app
@@ -30,3 +32,11 @@ def test_governance_params_and_proposal_creation():
     assert "id" in data
     assert data["title"] == payload["title"]
 
+
+    impact = client.get(f"/governance/proposals/{data['id']}/impact")
+    assert impact.status_code == 200
+    assert impact.json()["proposal_id"] == data["id"]
+    assert client.get(f"/governance/proposals/{uuid.uuid4()}/impact").status_code == 404
+
+    bad = dict(payload, parameters_diff={"diversity_model_cap": 2.0})
+    assert client.post("/governance/proposals", json=bad).status_code == 422
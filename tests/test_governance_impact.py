@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from core.governance import impact as impact_module
+from core.governance.impact import GovernanceImpactSimulator
+from core.governance.models import ProposalCreateRequest
+from core.governance.service import GovernanceService
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.ledger.models import ClaimCreateRequest
+from core.ledger.service import LedgerService
+from core.reputation.service import ReputationEngine
+from core.stake.service import StakeManager
+from core.validation.models import Vote
+from core.validation.service import VoteService
+from core.validation.session import ValidationSessionService
+
+
+def build(governance: GovernanceService):
+    identity = IdentityService()
+    stake = StakeManager()
+    votes = VoteService()
+    ledger = LedgerService()
+    reputation = ReputationEngine()
+    sessions = ValidationSessionService(
+        votes=votes, stake=stake, reputation=reputation, identity=identity, ledger=ledger, governance=governance
+    )
+    validators = []
+    for i, amount in enumerate([1e9, 10.0, 10.0, 10.0]):
+        v = identity.register_validator(
+            ValidatorRegistrationRequest(public_key="", model_family=f"model{i}", region=f"region{i}")
+        )
+        stake.lock(v.id, amount)
+        reputation.load_state(v.id, reputation.initial_score, datetime.now(timezone.utc) - timedelta(days=30))
+        validators.append(v.id)
+    return votes, ledger, sessions, validators
+
+
+def add_claim(votes, ledger, validators, domain, vote_types):
+    claim = ledger.create_claim(ClaimCreateRequest(statement="s", domain=domain, proposer_id=uuid.uuid4()))
+    now = datetime.now(timezone.utc)
+    votes.add_votes(
+        Vote(
+            id=uuid.uuid4(),
+            claim_id=claim.id,
+            validator_id=vid,
+            vote_type=vote_type,
+            confidence=1.0,
+            timestamp=now,
+            signature="",
+            signature_valid=True,
+        )
+        for vid, vote_type in zip(validators, vote_types)
+    )
+    return claim.id
+
+
+def test_stake_cap_diff_flips_whale_decided_claims_per_domain():
+    governance = GovernanceService()
+    votes, ledger, sessions, validators = build(governance)
+    # The whale's stake outweighs three small rejecting validators until stake is capped.
+    whale_claims = [add_claim(votes, ledger, validators, "medicine", ["approve", "reject", "reject", "reject"])]
+    whale_claims.append(add_claim(votes, ledger, validators, "economics", ["approve", "reject", "reject", "reject"]))
+    add_claim(votes, ledger, validators, "economics", ["approve"] * 4)
+    add_claim(votes, ledger, validators, "economics", ["reject"] * 4)
+
+    simulator = GovernanceImpactSimulator(sessions, votes, ledger)
+    impact = simulator.simulate({"stake_cap": 10.0})
+    assert (impact.base_version, impact.claims_evaluated, impact.claims_flipped) == (1, 4, 2)
+    assert sorted(impact.flipped_claims) == sorted(whale_claims)
+    by_domain = {row.domain: row for row in impact.domains}
+    assert (by_domain["economics"].claims, by_domain["economics"].flipped) == (3, 1)
+    assert by_domain["medicine"].transitions == {"accepted->rejected": 1}
+
+    # The same result from parallel chunks.
+    parallel = GovernanceImpactSimulator(sessions, votes, ledger, min_parallel_claims=0, chunks_per_worker=2)
+    assert parallel.simulate({"stake_cap": 10.0}, workers=2).domains == impact.domains
+
+    # Diversity caps only shape sampling, so they cannot flip cast votes.
+    assert simulator.simulate({"diversity_model_cap": 0.9, "unknown": 1.0}).claims_flipped == 0
+
+
+def test_proposal_impact_is_attached_and_reused_until_params_change():
+    governance = GovernanceService()
+    votes, ledger, sessions, validators = build(governance)
+    add_claim(votes, ledger, validators, "medicine", ["approve", "reject", "reject", "reject"])
+    simulator = GovernanceImpactSimulator(sessions, votes, ledger)
+    proposal = governance.create_proposal(
+        ProposalCreateRequest(title="t", body="b", parameters_diff={"stake_cap": 10.0}, activation_delay_hours=1)
+    )
+
+    impact = simulator.proposal_impact(governance, proposal.id)
+    assert impact.proposal_id == proposal.id and impact.claims_flipped == 1
+    assert proposal.impact is impact
+    assert simulator.proposal_impact(governance, proposal.id) is impact
+    assert simulator.proposal_impact(governance, proposal.id, refresh=True) is not impact
+    assert simulator.proposal_impact(governance, uuid.uuid4()) is None
+
+    governance.maybe_enact_proposals(datetime.now(timezone.utc) + timedelta(hours=2))
+    # The pre-enactment report stays attached to the enacted proposal.
+    assert simulator.proposal_impact(governance, proposal.id).base_version == 1
+
+
+def test_concurrent_proposal_impacts_share_one_capped_pool(monkeypatch):
+    governance = GovernanceService()
+    votes, ledger, sessions, validators = build(governance)
+    for _ in range(4):
+        add_claim(votes, ledger, validators, "medicine", ["approve", "reject", "reject", "reject"])
+    simulator = GovernanceImpactSimulator(sessions, votes, ledger, min_parallel_claims=0, max_workers=2)
+    proposals = [
+        governance.create_proposal(
+            ProposalCreateRequest(title="t", body="b", parameters_diff={"stake_cap": cap}, activation_delay_hours=1)
+        )
+        for cap in (10.0, 20.0)
+    ]
+
+    live, peak, sizes = [0], [0], []
+    real_pool = impact_module.ProcessPoolExecutor
+
+    class CountingPool(real_pool):
+        def __init__(self, max_workers):
+            sizes.append(max_workers)
+            live[0] += 1
+            peak[0] = max(peak[0], live[0])
+            super().__init__(max_workers=max_workers)
+
+        def shutdown(self, *args, **kwargs):
+            super().shutdown(*args, **kwargs)
+            live[0] -= 1
+
+    monkeypatch.setattr(impact_module, "ProcessPoolExecutor", CountingPool)
+    requests = [proposal.id for proposal in proposals for _ in range(3)]
+    threads = [
+        threading.Thread(target=simulator.proposal_impact, args=(governance, proposal_id), kwargs={"workers": 8})
+        for proposal_id in requests
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One simulation per proposal; waiters reuse the attached report.
+    assert sizes == [2, 2] and peak[0] == 1
+    assert all(proposal.impact.claims_flipped == 4 for proposal in proposals)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from core.governance.models import GovernanceParams, ProposalCreateRequest, next_params
+from core.governance.service import GovernanceService
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.reputation.service import ReputationEngine
+from core.stake.service import StakeManager
+from core.validation.models import Vote
+from core.validation.service import VoteService
+from core.validation.session import ValidationSessionService
+
+
+def enact(governance: GovernanceService, **diff: float) -> None:
+    governance.create_proposal(
+        ProposalCreateRequest(title="t", body="b", parameters_diff=diff, activation_delay_hours=1)
+    )
+    governance.maybe_enact_proposals(datetime.now(timezone.utc) + timedelta(hours=2))
+
+
+def test_enactment_swaps_an_immutable_versioned_snapshot():
+    governance = GovernanceService()
+    before = governance.get_params()
+    with pytest.raises(ValidationError):
+        before.stake_cap = 1.0
+
+    enact(governance, stake_cap=5e8, version=99)
+    after = governance.get_params()
+    assert after is not before
+    assert (before.version, before.stake_cap) == (1, 1e9)  # readers holding the old snapshot are unaffected
+    assert (after.version, after.stake_cap) == (2, 5e8)
+
+    # Nothing due: no new version.
+    governance.maybe_enact_proposals()
+    assert governance.get_params() is after
+
+
+@pytest.mark.parametrize(
+    "diff",
+    [
+        {"diversity_model_cap": 1.5},
+        {"diversity_region_cap": 0.0},
+        {"stake_cap": -1.0},
+        {"slashing_confirmation_rounds": 2.5},
+    ],
+)
+def test_invalid_diffs_are_rejected_at_proposal_time(diff):
+    with pytest.raises(ValidationError):
+        ProposalCreateRequest(title="t", body="b", parameters_diff=diff)
+    # Snapshots are only ever built through validation.
+    with pytest.raises(ValidationError):
+        next_params(GovernanceParams(), diff)
+
+
+def test_next_params_coerces_whole_floats_and_bumps_the_version():
+    governance = GovernanceService()
+    enact(governance, slashing_confirmation_rounds=3.0)
+    params = governance.get_params()
+    assert params.slashing_confirmation_rounds == 3 and isinstance(params.slashing_confirmation_rounds, int)
+    assert params.version == 2
+
+
+def test_sessions_use_and_record_the_active_params():
+    identity = IdentityService()
+    stake = StakeManager()
+    votes = VoteService()
+    governance = GovernanceService(GovernanceParams(diversity_model_cap=0.5, diversity_region_cap=1.0))
+    sessions = ValidationSessionService(
+        votes=votes, stake=stake, reputation=ReputationEngine(), identity=identity, governance=governance
+    )
+    validators = []
+    for i in range(20):
+        v = identity.register_validator(
+            ValidatorRegistrationRequest(public_key="", model_family=f"model{i % 2}", region="eu")
+        )
+        stake.lock(v.id, 1e7)
+        validators.append(v)
+
+    def vote_on(claim_id):
+        now = datetime.now(timezone.utc)
+        votes.add_votes(
+            Vote(
+                id=uuid.uuid4(),
+                claim_id=claim_id,
+                validator_id=v.id,
+                vote_type="approve",
+                confidence=0.9,
+                timestamp=now,
+                signature="",
+                signature_valid=True,
+            )
+            for v in validators
+        )
+        return sessions.compute_consensus(claim_id)
+
+    first = vote_on(uuid.uuid4())
+    assert first.params_version == 1
+    # Diversity caps: at most half of the 20-validator sample per model family.
+    families = [identity.get_validator(vid).model_family for vid in first.validators_sampled]
+    assert max(families.count(f) for f in set(families)) <= 10
+
+    now = datetime.now(timezone.utc)
+    uncapped = sessions.influence_for_validator(validators[0].id, now)
+    enact(governance, stake_cap=10.0)
+    capped = sessions.influence_for_validator(validators[0].id, now)
+    assert capped < uncapped
+
+    second = vote_on(uuid.uuid4())
+    assert second.params_version == 2
+    assert first.params_version == 1
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+from api.validation_routes import get_leaderboard_service, get_stake_manager
+from core.leaderboard.service import Leaderboard, LeaderboardService
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLockRequest
+from core.stake.service import StakeManager
+
+
+def test_leaderboard_matches_sorted_reference_under_churn():
+    rng = random.Random(5)
+    board = Leaderboard(load=4)
+    reference = {}
+    ids = [uuid.uuid4() for _ in range(200)]
+    for _ in range(2000):
+        vid = rng.choice(ids)
+        if rng.random() < 0.1:
+            board.remove(vid)
+            reference.pop(vid, None)
+        else:
+            key = rng.choice([rng.random(), 0.5])  # include ties
+            board.update(vid, key)
+            reference[vid] = key
+
+    expected = sorted(reference.items(), key=lambda item: (-item[1], item[0]))
+    assert len(board) == len(reference)
+    assert board.top(15) == expected[:15]
+    for rank, (vid, _) in enumerate(expected, start=1):
+        assert board.rank(vid) == rank
+    assert abs(board.total - sum(reference.values())) < 1e-9
+
+
+def test_reputation_board_tracks_decayed_order():
+    reputation = ReputationEngine(decay_rate_per_day=0.1)
+    service = LeaderboardService(reputation, StakeManager())
+    now = datetime.now(timezone.utc)
+    # An old high score can decay below a recent lower one.
+    old, recent = uuid.uuid4(), uuid.uuid4()
+    reputation.load_state(old, 5.0, now - timedelta(days=30))
+    reputation.load_state(recent, 1.5, now)
+
+    top = service.top("reputation", 2, now)
+    assert [vid for vid, _ in top] == [recent, old]
+    assert top[0][1] > top[1][1]
+    assert service.rank("reputation", old) == 2
+
+
+def test_stake_board_follows_lock_and_slash_and_serves_api():
+    stake = get_stake_manager()
+    service = get_leaderboard_service()
+    lock_until = datetime.now(timezone.utc) + timedelta(days=30)
+    whale, minnow = uuid.uuid4(), uuid.uuid4()
+    stake.lock_stake(StakeLockRequest(validator_id=whale, amount=1e8, lock_until=lock_until))
+    stake.lock_stake(StakeLockRequest(validator_id=minnow, amount=1e7, lock_until=lock_until))
+    assert service.rank("stake", whale) < service.rank("stake", minnow)
+
+    stake.slash(whale, fraction=0.95, reason="test")
+    assert service.rank("stake", minnow) < service.rank("stake", whale)
+
+    client = TestClient(create_app())
+    data = client.get("/leaderboards/stake", params={"k": 1}).json()
+    assert data["entries"][0]["validator_id"] == str(minnow)
+    assert 0.0 < data["top_share"] <= 1.0
+    rank = client.get(f"/leaderboards/stake/{whale}").json()
+    assert rank["rank"] == service.rank("stake", whale)
+    assert client.get(f"/leaderboards/stake/{uuid.uuid4()}").status_code == 404
+    assert client.get("/leaderboards/karma").status_code == 422
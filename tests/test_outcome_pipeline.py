@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.reputation.models import ReputationUpdateRequest
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLockRequest
+from core.stake.service import StakeManager
+from core.validation.models import Vote
+from core.validation.service import VoteService
+from core.validation.session import ValidationSessionService
+
+
+def test_batched_reputation_matches_sequential_updates():
+    now = datetime.now(timezone.utc)
+    start = now - timedelta(days=5)
+    ids = [uuid.uuid4() for _ in range(3)]
+    updates = [(ids[0], True, False), (ids[1], True, True), (ids[2], False, False), (ids[0], True, False)]
+
+    sequential = ReputationEngine()
+    batched = ReputationEngine()
+    for engine in (sequential, batched):
+        for vid in ids:
+            engine.load_state(vid, engine.initial_score, start)
+
+    for vid, was_correct, was_minority in updates:
+        sequential.apply_outcome(
+            ReputationUpdateRequest(validator_id=vid, was_correct=was_correct, was_minority=was_minority), now
+        )
+    batched.apply_outcomes(updates, now)
+
+    for vid in ids:
+        assert batched.get_state(vid).score == pytest.approx(sequential.get_state(vid).score)
+        assert batched.get_state(vid).last_updated == now
+
+
+def test_outcome_pipeline_flags_minority_winners_and_slashes_once():
+    identity = IdentityService()
+    stake = StakeManager()
+    votes = VoteService()
+    reputation = ReputationEngine()
+    sessions = ValidationSessionService(votes=votes, stake=stake, reputation=reputation, identity=identity)
+
+    lock_until = datetime.now(timezone.utc) + timedelta(days=365)
+    validators = []
+    for i, amount in enumerate((1_000_000.0, 10.0, 10.0)):
+        v = identity.register_validator(
+            ValidatorRegistrationRequest(public_key="", model_family=f"model{i}", region=f"region{i}")
+        )
+        stake.lock_stake(StakeLockRequest(validator_id=v.id, amount=amount, lock_until=lock_until))
+        validators.append(v)
+
+    claim_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    votes.add_votes(
+        Vote(
+            id=uuid.uuid4(),
+            claim_id=claim_id,
+            validator_id=v.id,
+            vote_type=vote_type,
+            confidence=1.0,
+            timestamp=now,
+            signature="",
+            signature_valid=True,
+        )
+        for v, vote_type in zip(validators, ("approve", "reject", "reject"))
+    )
+
+    session = sessions.compute_consensus(claim_id)
+    assert session.outcome == "accepted"
+
+    # The lone approver won on influence against two rejecters.
+    boosted = 1.0 + reputation.correct_reward * reputation.minority_boost_multiplier
+    assert reputation.get_state(validators[0].id).score == pytest.approx(boosted)
+    for v in validators[1:]:
+        state = stake.get_state(v.id)
+        assert state.slash_count == 1
+        assert state.total_locked == pytest.approx(9.0)
+        assert reputation.get_state(v.id).score == reputation.min_score
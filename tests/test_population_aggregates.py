@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+from api.validation_routes import get_identity_service, get_stake_manager
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.population.service import PopulationAggregates
+from core.reputation.service import ReputationEngine
+from core.stake.service import StakeManager
+
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = T0
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def register(identity: IdentityService, family: str, region: str, domain=None) -> uuid.UUID:
+    return identity.register_validator(
+        ValidatorRegistrationRequest(public_key="", model_family=family, region=region, domain_focus=domain)
+    ).id
+
+
+def test_group_totals_track_changes_and_decay():
+    rng = random.Random(4)
+    clock = Clock()
+    identity = IdentityService()
+    # Half-life long enough that no stake reaches the 1.0 floor, which the sums ignore.
+    stake = StakeManager(decay_half_life_days=20.0, clock=clock)
+    reputation = ReputationEngine(decay_rate_per_day=0.05, clock=clock)
+    early = register(identity, "llama", "eu")  # registered before the aggregates exist
+    stake.lock(early, 10.0)
+    population = PopulationAggregates(identity, stake, reputation)
+
+    ids = [early] + [
+        register(identity, rng.choice(["gpt", "llama"]), rng.choice(["eu", "us", "apac"]), rng.choice([None, "bio"]))
+        for _ in range(40)
+    ]
+    influence = dict.fromkeys(ids, 0.0)
+    for day in range(30):
+        clock.now = T0 + timedelta(days=day)
+        vid = rng.choice(ids)
+        stake.lock(vid, rng.uniform(10.0, 500.0))
+        reputation.apply_outcome_at(rng.choice(ids), rng.random() < 0.7, False, clock.now.timestamp())
+        target, weight = rng.choice(ids), rng.uniform(0.1, 2.0)
+        population.record_influence(target, weight)
+        influence[target] = weight
+        if day % 6 == 0:
+            stake.slash(rng.choice(ids), fraction=0.05, reason="test")
+        if day == 15:
+            stake.apply_decay_all()
+            identity.deactivate_validator(str(ids[-1]))
+
+    now = T0 + timedelta(days=40)
+    active = [v for v in identity.list_validators()]
+    total_stake = sum(stake.effective_stake(v.id, now) if stake.get_state(v.id) else 0.0 for v in active)
+    validators, stake_total, _ = population.totals(now)
+    assert validators == len(active)
+    assert stake_total == pytest.approx(total_stake, rel=1e-6)
+
+    for group in population.groups("region", now):
+        members = [v for v in active if v.region == group.group]
+        group_stake = sum(stake.effective_stake(v.id, now) if stake.get_state(v.id) else 0.0 for v in members)
+        assert group.validators == len(members)
+        assert group.stake == pytest.approx(group_stake, rel=1e-6)
+        assert group.stake_share == pytest.approx(group_stake / total_stake, rel=1e-6)
+        assert group.mean_reputation == pytest.approx(
+            sum(reputation.score(v.id, now) for v in members) / len(members), rel=1e-6
+        )
+        assert group.influence == pytest.approx(sum(influence[v.id] for v in members))
+    domains = {g.group for g in population.groups("domain", now)}
+    assert domains <= {"none", "bio"}
+
+
+def test_metric_labels_fold_unknown_and_excess_groups(monkeypatch):
+    published = []
+    monkeypatch.setattr("core.population.service.update_population_metrics", published.extend)
+    identity = IdentityService()
+    stake = StakeManager()
+    population = PopulationAggregates(
+        identity, stake, ReputationEngine(), max_metric_groups=2, metric_domains={"physics"}
+    )
+    for i, domain in enumerate(["physics", "bio", "x" * 200, None]):
+        stake.lock(register(identity, f"family-{i}", "eu", domain), 10.0)
+
+    population.publish_metrics()
+    labels = {(dim, group): validators for dim, group, validators, _, _ in published}
+    assert labels[("domain", "physics")] == 1
+    assert labels[("domain", "none")] == 1
+    assert labels[("domain", "other")] == 2
+    assert labels[("model_family", "other")] == 2
+    assert len([key for key in labels if key[0] == "model_family"]) == 3
+    # Reads still report every group under its own name.
+    assert len(population.groups("domain")) == 4
+    assert len(population.groups("model_family")) == 4
+
+
+def test_population_endpoint():
+    identity = get_identity_service()
+    vid = register(identity, "population-test-family", "population-test-region")
+    get_stake_manager().lock(vid, 1234.0)
+
+    client = TestClient(create_app())
+    data = client.get("/population/model_family").json()
+    group = next(g for g in data["groups"] if g["group"] == "population-test-family")
+    assert group["validators"] == 1
+    assert group["stake"] == pytest.approx(1234.0, rel=1e-3)
+    assert 0.0 < group["stake_share"] <= 1.0
+    assert client.get("/population/planet").status_code == 422
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+from api.validation_routes import get_reputation_engine
+from core.reputation.history import ReputationHistory
+from core.reputation.models import ReputationUpdateRequest
+from core.reputation.service import ReputationEngine
+
+
+def test_history_rolls_up_and_stays_bounded():
+    history = ReputationHistory(tiers=(("raw", 0, 8), ("minute", 60, 4), ("hour", 3600, 4)))
+    vid = uuid.uuid4()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+    # Ten updates per minute over three hours.
+    for i in range(180 * 10):
+        history.record(vid, start + i * 6, float(i))
+
+    raw = history.points(vid, "raw")
+    assert len(raw) == 8
+    assert [p.score for p in raw] == [float(i) for i in range(1792, 1800)]
+
+    minutes = history.points(vid, "minute")
+    assert len(minutes) == 4
+    last = minutes[-1]
+    assert last.updates == 10
+    assert (last.min_score, last.max_score, last.score) == (1790.0, 1799.0, 1799.0)
+
+    # Hours are rolled up from minutes the minute ring no longer holds.
+    hours = history.points(vid, "hour")
+    assert [p.updates for p in hours] == [600, 600, 600]
+    assert (hours[0].min_score, hours[0].max_score, hours[-1].score) == (0.0, 599.0, 1799.0)
+    assert hours[0].timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    since = datetime(2024, 1, 1, 1, 30, tzinfo=timezone.utc)
+    assert [p.timestamp.hour for p in history.points(vid, "hour", since=since)] == [1, 2]
+    assert len(history.points(vid, "raw", limit=3)) == 3
+
+
+def test_engine_records_history_and_endpoint_serves_it(monkeypatch):
+    engine = get_reputation_engine()
+    vid = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    for i in range(3):
+        engine.apply_outcome(ReputationUpdateRequest(validator_id=vid, was_correct=True), now + timedelta(seconds=i))
+
+    client = TestClient(create_app())
+    resp = client.get(f"/reputation/{vid}/history")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["resolution"] == "raw"
+    scores = [p["score"] for p in data["points"]]
+    assert len(scores) == 3 and scores == sorted(scores)
+
+    # A naive ``since`` is read as UTC, not server local time.
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        naive = (now + timedelta(seconds=0.5)).astimezone(timezone.utc).replace(tzinfo=None)
+        since = client.get(f"/reputation/{vid}/history", params={"since": naive.isoformat()}).json()["points"]
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+    assert [p["score"] for p in since] == scores[1:]
+
+    assert client.get(f"/reputation/{vid}/history", params={"resolution": "week"}).status_code == 400
+    assert client.get(f"/reputation/{uuid.uuid4()}/history").json()["points"] == []
+
+
+def test_engine_without_history_records_nothing():
+    engine = ReputationEngine()
+    engine.apply_outcome(ReputationUpdateRequest(validator_id=uuid.uuid4(), was_correct=True))
+    assert engine.history is None
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import math
+import uuid
+from array import array
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.reputation.models import ReputationUpdateRequest
+from core.reputation.service import ReputationEngine
+
+
+def test_reads_decay_in_closed_form_without_writing_back():
+    engine = ReputationEngine(decay_rate_per_day=0.01)
+    vid = uuid.uuid4()
+    start = datetime.now(timezone.utc) - timedelta(days=100)
+    engine.load_state(vid, 3.0, start)
+
+    later = start + timedelta(days=50)
+    expected = 1.0 + 2.0 * math.exp(-0.01 * 50)
+    assert engine.score(vid, later) == pytest.approx(expected)
+    assert engine.get_state(vid, later).score == pytest.approx(expected)
+    # Reads do not move the decay origin.
+    assert engine.get_state(vid).last_updated == start
+    assert engine.score(vid, later) == pytest.approx(expected)
+
+    # An outcome decays first, then applies the reward.
+    state = engine.apply_outcome(ReputationUpdateRequest(validator_id=vid, was_correct=True), later)
+    assert state.score == pytest.approx(expected * (1.0 + engine.correct_reward))
+    assert engine.get_state(vid).last_updated == later
+
+
+def test_unknown_validators_are_not_stored_on_read():
+    engine = ReputationEngine()
+    for _ in range(100):
+        vid = uuid.uuid4()
+        assert engine.get_state(vid).score == engine.initial_score
+        assert engine.score(vid) == engine.initial_score
+    assert len(engine) == 0
+
+
+def test_batch_scores_match_single_reads():
+    engine = ReputationEngine(decay_rate_per_day=0.05)
+    now = datetime.now(timezone.utc)
+    ids = [uuid.uuid4() for _ in range(10)]
+    for i, vid in enumerate(ids[:8]):
+        engine.load_state(vid, 1.0 + i, now - timedelta(days=i))
+
+    out = array("d", bytes(8 * len(ids)))
+    result = engine.scores(ids, now, out=out)
+    assert result is out
+    assert list(result) == pytest.approx([engine.score(vid, now) for vid in ids])
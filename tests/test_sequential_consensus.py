@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import math
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLockRequest
+from core.stake.service import StakeManager
+from core.validation.models import Vote
+from core.validation.sequential import regularized_beta, sequential_decide
+from core.validation.service import VoteService
+from core.validation.session import ValidationSessionService
+
+
+def test_regularized_beta_matches_binomial_tail():
+    # I_x(k, n - k + 1) = P(Binomial(n, x) >= k)
+    n, x = 9, 0.35
+    for k in range(1, n + 1):
+        tail = sum(math.comb(n, j) * x**j * (1 - x) ** (n - j) for j in range(k, n + 1))
+        assert regularized_beta(x, k, n - k + 1) == pytest.approx(tail, rel=1e-9)
+
+
+def test_sequential_decide_stops_early_only_when_settled():
+    unanimous = [("approve", 1.0, 1.0)] * 50
+    decision = sequential_decide(iter(unanimous), confidence_threshold=0.6, error_bound=0.05)
+    assert decision.outcome == "accepted"
+    assert decision.votes_used < 10
+
+    split = [("approve", 1.0, 1.0), ("reject", 1.0, 1.0)] * 25
+    decision = sequential_decide(iter(split), confidence_threshold=0.6, error_bound=0.05)
+    assert decision.outcome == "uncertain"
+    assert decision.votes_used == len(split)
+
+
+def build_sessions(n_validators: int, mode: str):
+    identity = IdentityService()
+    stake = StakeManager()
+    votes = VoteService()
+    reputation = ReputationEngine()
+    sessions = ValidationSessionService(
+        votes=votes, stake=stake, reputation=reputation, identity=identity, consensus_mode=mode
+    )
+    lock_until = datetime.now(timezone.utc) + timedelta(days=365)
+    validators = []
+    for i in range(n_validators):
+        v = identity.register_validator(
+            ValidatorRegistrationRequest(public_key="", model_family=f"model{i}", region=f"region{i}")
+        )
+        stake.lock_stake(StakeLockRequest(validator_id=v.id, amount=100.0, lock_until=lock_until))
+        validators.append(v)
+    return sessions, votes, validators
+
+
+def test_sequential_mode_finalizes_with_fewer_votes():
+    results = {}
+    for mode in ("threshold", "sequential"):
+        sessions, votes, validators = build_sessions(20, mode)
+        claim_id = uuid.uuid4()
+        now = datetime.now(timezone.utc)
+        votes.add_votes(
+            Vote(
+                id=uuid.uuid4(),
+                claim_id=claim_id,
+                validator_id=v.id,
+                vote_type="approve",
+                confidence=0.9,
+                timestamp=now,
+                signature="",
+                signature_valid=True,
+            )
+            for v in validators[:12]  # all 20 are sampled; 8 have yet to vote
+        )
+        results[mode] = sessions.compute_consensus(claim_id)
+
+    assert results["threshold"].outcome == results["sequential"].outcome == "accepted"
+    assert results["threshold"].votes_used == 12
+    assert results["threshold"].votes_saved == 0  # no early stop in threshold mode
+    assert results["sequential"].finalized
+    assert results["sequential"].votes_used < 20
+    assert results["sequential"].votes_saved == 20 - results["sequential"].votes_used
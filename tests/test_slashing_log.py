@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+from api.validation_routes import get_stake_manager
+from core.stake.models import SlashingEvent
+from core.stake.slashing import SlashingLog
+
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_events(n: int = 500, seed: int = 2):
+    rng = random.Random(seed)
+    validators = [uuid.uuid4() for _ in range(30)]
+    events = []
+    ts = T0
+    for _ in range(n):
+        # Mostly in order, with occasional late arrivals.
+        ts += timedelta(hours=rng.random() * 2)
+        at = ts - timedelta(hours=rng.random() * 5) if rng.random() < 0.1 else ts
+        events.append(
+            SlashingEvent(
+                id=uuid.uuid4(),
+                validator_id=rng.choice(validators),
+                amount_slashed=rng.uniform(1.0, 100.0),
+                reason=rng.choice(["incorrect_vote", "collusion", "downtime"]),
+                created_at=at,
+            )
+        )
+    return events
+
+
+def test_indexed_queries_match_scans():
+    events = make_events()
+    log = SlashingLog()
+    for ev in events:
+        log.append(ev)
+    assert len(log) == len(events)
+
+    since, until = T0 + timedelta(days=5), T0 + timedelta(days=12)
+    window = [ev for ev in events if since <= ev.created_at < until]
+    count, amount = log.totals(since=since, until=until)
+    assert count == len(window)
+    assert amount == pytest.approx(sum(ev.amount_slashed for ev in window))
+
+    by_reason = log.totals_by_reason(since=since, until=until)
+    for reason in ("incorrect_vote", "collusion", "downtime"):
+        expected = [ev for ev in window if ev.reason == reason]
+        assert by_reason[reason][0] == len(expected)
+        assert by_reason[reason][1] == pytest.approx(sum(ev.amount_slashed for ev in expected))
+        assert log.totals(reason=reason, since=since, until=until) == by_reason[reason]
+    assert log.totals(reason="unknown") == (0, 0.0)
+
+    newest = sorted(window, key=lambda ev: ev.created_at, reverse=True)
+    assert [ev.id for ev in log.events(since=since, until=until, limit=10)] == [ev.id for ev in newest[:10]]
+    vid = events[0].validator_id
+    mine = [ev for ev in newest if ev.validator_id == vid and ev.reason == "collusion"]
+    assert [ev.id for ev in log.events(validator_id=vid, reason="collusion", since=since, until=until)] == [
+        ev.id for ev in mine
+    ]
+
+    counts = {}
+    for ev in events:
+        counts[ev.validator_id] = counts.get(ev.validator_id, 0) + 1
+    threshold = sorted(counts.values())[len(counts) // 2]
+    offenders = log.repeat_offenders(threshold)
+    assert {vid for vid, _ in offenders} == {vid for vid, c in counts.items() if c >= threshold}
+    assert all(count == counts[vid] for vid, count in offenders)
+    assert [c for _, c in offenders] == sorted((c for _, c in offenders), reverse=True)
+    assert log.repeat_offenders(threshold, limit=3) == offenders[:3]
+    assert log.repeat_offenders(threshold, limit=0) == []
+
+
+def test_slashing_endpoints_and_state_summary():
+    stake = get_stake_manager()
+    vid = uuid.uuid4()
+    stake.lock(vid, 1000.0)
+    since = datetime.now(timezone.utc)
+    stake.slash(vid, fraction=0.1, reason="audit_test")
+    stake.slash(vid, fraction=0.1, reason="audit_test")
+
+    state = stake.get_state(vid)
+    assert state.slash_count == 2
+    assert state.total_slashed == pytest.approx(190.0)
+    assert state.last_slashed_at is not None
+
+    client = TestClient(create_app())
+    events = client.get("/stake/slashing/events", params={"validator_id": str(vid)}).json()["events"]
+    assert [ev["amount_slashed"] for ev in events] == [pytest.approx(90.0), pytest.approx(100.0)]
+
+    summary = client.get("/stake/slashing/summary", params={"since": since.isoformat()}).json()
+    assert summary["by_reason"]["audit_test"] == {"count": 2, "amount": pytest.approx(190.0)}
+
+    offenders = client.get("/stake/slashing/repeat-offenders", params={"min_count": 2}).json()["validators"]
+    assert {"validator_id": str(vid), "slash_count": 2} in offenders
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.leaderboard.service import LeaderboardService
+from core.reputation.service import ReputationEngine
+from core.stake.service import StakeManager
+
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = T0
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def test_lazy_reads_sweep_and_per_validator_decay_agree():
+    rng = random.Random(3)
+    clock = Clock()
+    lazy = StakeManager(decay_half_life_days=20.0, clock=clock)
+    swept = StakeManager(decay_half_life_days=20.0, clock=clock)
+    stepped = StakeManager(decay_half_life_days=20.0, clock=clock)
+    ids = [uuid.uuid4() for _ in range(50)]
+    for day in range(60):
+        clock.now = T0 + timedelta(days=day, hours=rng.random())
+        for manager in (lazy, swept, stepped):
+            manager.lock(ids[day % len(ids)], 100.0)
+        if day % 7 == 0:
+            for manager in (lazy, swept, stepped):
+                manager.slash_many(ids[:5], fraction=0.2, reason="test")
+        if day % 10 == 0:
+            swept.apply_decay_all()
+            for vid in ids:
+                stepped.apply_decay(vid)
+
+    end = T0 + timedelta(days=90)
+    assert swept.apply_decay_all(end) == len(swept.export_states())
+    expected = lazy.effective_stakes(ids, end)
+    for i, vid in enumerate(ids):
+        stepped.apply_decay(vid, end)
+        assert expected[i] == pytest.approx(lazy.effective_stake(vid, end))
+        assert swept.get_state(vid).effective_stake == pytest.approx(expected[i])
+        assert stepped.get_state(vid).effective_stake == pytest.approx(expected[i])
+    # Decay halves stake per half-life down to the 1.0 floor.
+    assert lazy.effective_stake(ids[0], end + timedelta(days=20)) == pytest.approx(
+        max(1.0, expected[0] / 2)
+    )
+    assert lazy.effective_stake(uuid.uuid4(), end) == 1.0
+
+
+def test_stake_board_ranks_by_current_decayed_stake():
+    clock = Clock()
+    stake = StakeManager(decay_half_life_days=1.0, clock=clock)
+    service = LeaderboardService(ReputationEngine(clock=clock), stake)
+    old, fresh = uuid.uuid4(), uuid.uuid4()
+    stake.lock(old, 1000.0)
+    clock.now = T0 + timedelta(days=3)
+    stake.lock(fresh, 200.0)
+
+    # 1000 locked three half-lives ago is worth 125 now, below the fresh 200.
+    assert service.rank("stake", fresh) == 1
+    assert service.top("stake", 2, clock.now) == [
+        (fresh, pytest.approx(200.0)),
+        (old, pytest.approx(125.0)),
+    ]
+    assert service.top_share("stake", 1) == pytest.approx(200.0 / 325.0)
+
+    # Materializing decay leaves the board unchanged.
+    stake.apply_decay(old)
+    assert service.top_share("stake", 1) == pytest.approx(200.0 / 325.0)
+
+    # Far-future updates move the epoch without disturbing the order.
+    clock.now = T0 + timedelta(days=400)
+    stake.lock(old, 50.0)
+    assert service.rank("stake", old) == 1
+    assert service.value("stake", old, clock.now) == pytest.approx(51.0)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.db.base import Base
+from core.db.models import ReplayEventORM, ReputationStateORM, StakeLockORM, StakeStateORM, ValidatorORM
+from core.db.write_behind import StateWriteBehind
+from core.identity.models import ValidatorRegistrationRequest
+from core.identity.service import IdentityService
+from core.replay.log import EventLog
+from core.replay.service import ReplayEngine
+from core.reputation.models import ReputationUpdateRequest
+from core.reputation.service import ReputationEngine
+from core.stake.models import StakeLockRequest
+from core.stake.service import StakeManager
+
+
+def make_session_factory():
+    # One shared in-memory connection, usable from the flush executor thread.
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, autoflush=False, future=True)
+
+
+def count(factory, orm) -> int:
+    with factory() as db:
+        return db.scalar(select(func.count()).select_from(orm))
+
+
+def test_changes_are_buffered_then_flushed_in_batches_and_restored():
+    factory = make_session_factory()
+    identity = IdentityService()
+    reputation = ReputationEngine()
+    stake = StakeManager()
+    writer = StateWriteBehind(reputation, stake, factory, identity=identity, batch_size=2)
+
+    lock_until = datetime.now(timezone.utc) + timedelta(days=30)
+    validators = [
+        identity.register_validator(
+            ValidatorRegistrationRequest(public_key="", model_family=f"model{i}", region="eu")
+        )
+        for i in range(3)
+    ]
+    for v in validators:
+        stake.lock_stake(StakeLockRequest(validator_id=v.id, amount=50.0, lock_until=lock_until))
+        reputation.apply_outcome(ReputationUpdateRequest(validator_id=v.id, was_correct=True))
+    stake.slash(validators[0].id, fraction=0.5, reason="test")
+    # Unregistered validators cannot satisfy the foreign key and are dropped.
+    stake.lock_stake(StakeLockRequest(validator_id=uuid.uuid4(), amount=5.0, lock_until=lock_until))
+
+    # Nothing is written on the request path.
+    assert count(factory, StakeStateORM) == 0
+    assert writer.pending() == 7
+
+    assert writer.flush() == 4  # two reputation + two stake rows
+    assert writer.flush_all() == 2
+    assert writer.pending() == 0
+    assert count(factory, ValidatorORM) == 3
+    assert count(factory, ReputationStateORM) == 3
+    assert count(factory, StakeStateORM) == 3
+
+    # Later changes upsert in place.
+    reputation.apply_outcome(ReputationUpdateRequest(validator_id=validators[1].id, was_correct=False))
+    writer.flush_all()
+    assert count(factory, ReputationStateORM) == 3
+
+    restored_reputation = ReputationEngine()
+    restored_stake = StakeManager()
+    restorer = StateWriteBehind(restored_reputation, restored_stake, factory)
+    assert restorer.restore() == 6
+    assert restorer.pending() == 0
+    for v in validators:
+        assert restored_reputation.score(v.id) == pytest.approx(reputation.score(v.id))
+        assert restored_stake.get_state(v.id).effective_stake == stake.get_state(v.id).effective_stake
+    assert restored_stake.get_state(validators[0].id).total_locked == 25.0
+
+
+def test_background_task_flushes_on_bound_and_on_stop():
+    factory = make_session_factory()
+    reputation = ReputationEngine()
+    stake = StakeManager()
+    writer = StateWriteBehind(reputation, stake, factory, flush_interval=3600.0, max_dirty=5)
+
+    async def scenario():
+        writer.start()
+        for _ in range(5):
+            reputation.apply_outcome(ReputationUpdateRequest(validator_id=uuid.uuid4(), was_correct=True))
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if writer.pending() == 0:
+                break
+        flushed_on_bound = count(factory, ReputationStateORM)
+
+        reputation.apply_outcome(ReputationUpdateRequest(validator_id=uuid.uuid4(), was_correct=True))
+        await writer.stop()
+        return flushed_on_bound
+
+    assert asyncio.run(scenario()) == 5
+    assert count(factory, ReputationStateORM) == 6
+
+
+def test_event_log_is_persisted_and_restored_for_replay():
+    factory = make_session_factory()
+    log = EventLog()
+    reputation = ReputationEngine(event_log=log)
+    stake = StakeManager(event_log=log)
+    writer = StateWriteBehind(reputation, stake, factory, event_log=log, batch_size=2)
+
+    ids = [uuid.uuid4() for _ in range(3)]
+    for vid in ids:
+        stake.lock(vid, 100.0)
+        reputation.apply_outcome(ReputationUpdateRequest(validator_id=vid, was_correct=True))
+    stake.slash(ids[0], fraction=0.5, reason="collusion")
+    assert writer.pending() == 6 + len(log)
+
+    writer.flush_all()
+    assert count(factory, ReplayEventORM) == len(log) == 7
+
+    restored = EventLog()
+    restorer = StateWriteBehind(ReputationEngine(), StakeManager(), factory, event_log=restored)
+    restorer.restore()
+    assert restorer.pending() == 0
+    assert list(restored.kinds) == list(log.kinds)
+    assert [restored.validator_ids[i] for i in restored.validators] == [log.validator_ids[i] for i in log.validators]
+    assert list(restored.slash_reasons.values()) == ["collusion"]
+
+    replayed = ReplayEngine().replay(restored)
+    for vid in ids:
+        assert replayed.stake.get_state(vid).total_locked == stake.get_state(vid).total_locked
+        assert replayed.reputation.score(vid) == pytest.approx(reputation.score(vid))
+
+
+def test_restart_restores_slashing_summary_and_pending_locks():
+    factory = make_session_factory()
+    identity = IdentityService()
+    stake = StakeManager()
+    writer = StateWriteBehind(ReputationEngine(), stake, factory, identity=identity)
+    vid = identity.register_validator(ValidatorRegistrationRequest(public_key="", model_family="m", region="eu")).id
+
+    now = datetime.now(timezone.utc)
+    stake.lock_stake(StakeLockRequest(validator_id=vid, amount=100.0, lock_until=now + timedelta(days=1)))
+    stake.lock_stake(StakeLockRequest(validator_id=vid, amount=50.0, lock_until=now + timedelta(days=2)))
+    stake.slash(vid, fraction=0.2, reason="incorrect_vote")
+    writer.flush_all()
+
+    restarted = StakeManager()
+    StateWriteBehind(ReputationEngine(), restarted, factory).restore()
+    state, live = restarted.get_state(vid), stake.get_state(vid)
+    assert state.total_locked == pytest.approx(120.0)
+    assert state.slash_count == 1
+    assert state.total_slashed == pytest.approx(live.total_slashed)
+    assert state.last_slashed_at == live.last_slashed_at
+    assert sorted(r.amount for r in restarted.locks(vid)) == pytest.approx([40.0, 80.0])
+
+    # Restored locks expire and release the restored stake.
+    released = restarted.release_expired(now + timedelta(days=3))
+    assert len(released) == 2
+    assert restarted.get_state(vid).total_locked == pytest.approx(0.0)
+    assert restarted.active_lock_count() == 0
+
+    # Released locks are removed from the table on the next flush.
+    stake.release_expired(now + timedelta(days=3))
+    writer.flush_all()
+    assert count(factory, StakeLockORM) == 0
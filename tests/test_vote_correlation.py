@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timezone
+
+from core.validation.correlation import CountMinSketch, VoteCorrelationEngine
+from core.validation.diversity import compute_correlation_penalty
+from core.validation.models import Vote
+
+
+def make_vote(claim_id: uuid.UUID, validator_id: uuid.UUID, vote_type: str) -> Vote:
+    return Vote(
+        id=uuid.uuid4(),
+        claim_id=claim_id,
+        validator_id=validator_id,
+        vote_type=vote_type,
+        confidence=0.9,
+        timestamp=datetime.now(timezone.utc),
+        signature="",
+        signature_valid=True,
+    )
+
+
+def test_bloc_voters_score_high_and_independent_voters_low():
+    rng = random.Random(3)
+    engine = VoteCorrelationEngine(min_co_votes=5)
+    bloc = [uuid.uuid4() for _ in range(3)]
+    independents = [uuid.uuid4() for _ in range(3)]
+
+    for _ in range(200):
+        claim_id = uuid.uuid4()
+        bloc_choice = rng.choice(["approve", "reject"])
+        for vid in bloc:
+            engine.observe_vote(make_vote(claim_id, vid, bloc_choice))
+        for vid in independents:
+            engine.observe_vote(make_vote(claim_id, vid, rng.choice(["approve", "reject"])))
+
+    for vid in bloc:
+        # Perfect agreement with two of five partners, chance with the rest.
+        assert engine.score(vid) > 0.3
+        assert engine.pair_agreement(bloc[0], bloc[1]) == 1.0
+    for vid in independents:
+        assert engine.score(vid) < 0.2
+    assert compute_correlation_penalty(engine.score(bloc[0])) < compute_correlation_penalty(
+        engine.score(independents[0])
+    )
+    assert engine.score(uuid.uuid4()) == 0.0
+
+
+def test_memory_is_bounded_by_top_k_and_window():
+    engine = VoteCorrelationEngine(top_k=4, window=8, max_tracked_claims=10)
+    hub = uuid.uuid4()
+    for _ in range(50):
+        claim_id = uuid.uuid4()
+        for _ in range(20):
+            engine.observe_vote(make_vote(claim_id, uuid.uuid4(), "approve"))
+        engine.observe_vote(make_vote(claim_id, hub, "approve"))
+
+    assert len(engine.top_partners(hub)) <= 4
+    assert len(engine._recent) <= 10
+    assert all(len(window) <= 8 for window in engine._recent.values())
+
+
+def test_count_min_sketch_never_undercounts():
+    sketch = CountMinSketch(width=64, depth=3)
+    truth = {}
+    rng = random.Random(1)
+    for _ in range(2000):
+        key = str(rng.randrange(500)).encode()
+        truth[key] = truth.get(key, 0) + 1
+        sketch.add(key)
+    assert all(sketch.estimate(k) >= v for k, v in truth.items())